@@ -41,7 +41,7 @@ def run_simulation():
         "code": 200,
         "message": "卫星资源调度完成",
         "data": {
-            "task_id": "task_20241212_134523",
+            "task_id": "task_1734011123_4821_0",
             "elapsed_time": 287.5,
             "statistics": {
                 "success_rate_all": 0.956,
@@ -9,6 +9,7 @@ import os
 
 from config import get_config
 from api.simulation_api import simulation_bp
+from core.utils import remove_trash_dirs, start_cache_pruning, warm_up_image_export
 
 
 def create_app(env=None):
@@ -30,12 +31,23 @@ def create_app(env=None):
     # 确保目录存在
     config.ensure_directories()
 
+    # 清理上次运行遗留的待删除工作目录（后台执行）
+    remove_trash_dirs(config.TEMP_DATA_DIR)
+
+    # 定期清理过期的结果、数据集和图表缓存（后台执行）
+    if config.RESULT_CACHE_ENABLED or config.DATASET_CACHE_ENABLED or config.CHART_CACHE_ENABLED:
+        start_cache_pruning(config.TEMP_DATA_DIR, config.CLEANUP_KEEP_DAYS)
+
     # 配置CORS
     CORS(app, origins=config.CORS_ORIGINS)
 
     # 配置日志
     setup_logging(app, config)
 
+    # 预先启动图表图片导出引擎（后台执行）
+    if config.IMAGE_EXPORT_WARMUP:
+        warm_up_image_export(config.IMAGE_FORMAT)
+
     # 注册蓝图
     app.register_blueprint(simulation_bp, url_prefix='/api')
 
@@ -48,6 +48,13 @@ class Config:
     AUTO_CLEANUP = os.getenv('AUTO_CLEANUP', 'False').lower() == 'true'
     CLEANUP_KEEP_DAYS = int(os.getenv('CLEANUP_KEEP_DAYS', 7))
 
+    # 结果缓存：相同参数且原始数据未变化时直接返回上次结果（缓存存放在 TEMP_DATA_DIR/_cache）
+    RESULT_CACHE_ENABLED = os.getenv('RESULT_CACHE_ENABLED', 'True').lower() == 'true'
+    # 数据集缓存：相同原始数据 + 天线配置共用同一份构建好的数据集、数据集ZIP和统计信息
+    DATASET_CACHE_ENABLED = os.getenv('DATASET_CACHE_ENABLED', 'True').lower() == 'true'
+    # 图表缓存：调度结果数据内容相同时复用已生成的甘特图/满足度图
+    CHART_CACHE_ENABLED = os.getenv('CHART_CACHE_ENABLED', 'True').lower() == 'true'
+
     # ========== 新增：静态文件清理策略 ==========
     AUTO_CLEANUP_STATIC = os.getenv('AUTO_CLEANUP_STATIC', 'True').lower() == 'true'
     STATIC_KEEP_DAYS = int(os.getenv('STATIC_KEEP_DAYS', 30))  # 静态文件保留30天
@@ -63,6 +70,13 @@ class Config:
     DEFAULT_OPTIMIZATION = os.getenv('DEFAULT_OPTIMIZATION', 'True').lower() == 'true'
     DEFAULT_USE_SA = os.getenv('DEFAULT_USE_SA', 'True').lower() == 'true'
     DEFAULT_SA_MAX_TIME = int(os.getenv('DEFAULT_SA_MAX_TIME', 300))
+    # 模拟退火第一阶段并行链数（每条链一个进程，不超过CPU核数）；
+    # 并发请求或 SCHEDULING_PROCESS_WORKERS > 0 时进程数会成倍增加，默认单链
+    SA_NUM_CHAINS = int(os.getenv('SA_NUM_CHAINS', 1))
+
+    # 调度算法进程池大小：0 表示在请求线程内执行（同一进程内的调度串行）；
+    # 大于0时在独立进程中执行，多个请求的调度可并行使用多个CPU核心
+    SCHEDULING_PROCESS_WORKERS = int(os.getenv('SCHEDULING_PROCESS_WORKERS', 0))
 
     # 超时配置
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 300))
@@ -75,6 +89,11 @@ class Config:
     IMAGE_HEIGHT = int(os.getenv('IMAGE_HEIGHT', 720))  # 图片高度
     IMAGE_FORMAT = os.getenv('IMAGE_FORMAT', 'jpeg')  # 图片格式：jpeg, png
     IMAGE_QUALITY = int(os.getenv('IMAGE_QUALITY', 60))  # JPG质量：1-100
+    # 启动时预热 kaleido 导出进程，首个请求不再承担其启动开销
+    IMAGE_EXPORT_WARMUP = os.getenv('IMAGE_EXPORT_WARMUP', 'True').lower() == 'true'
+
+    # 是否在任务临时目录额外保存图表HTML文件（接口已直接返回HTML，默认不保存）
+    SAVE_CHART_HTML = os.getenv('SAVE_CHART_HTML', 'False').lower() == 'true'
 
     # 可选：OSS配置
     OSS_ENABLED = os.getenv('OSS_ENABLED', 'False').lower() == 'true'
@@ -123,6 +142,10 @@ class TestingConfig(Config):
     ENV = 'testing'
     TESTING = True
     DEBUG = True
+    RESULT_CACHE_ENABLED = False
+    DATASET_CACHE_ENABLED = False
+    CHART_CACHE_ENABLED = False
+    IMAGE_EXPORT_WARMUP = False
 
 
 # 配置字典
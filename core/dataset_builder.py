@@ -135,10 +135,13 @@ class DatasetBuilder:
         """
         删除目录（如果存在）并重新创建
         """
-        if os.path.exists(dir_path):
-            logger.warning(f"⚠ 检测到输出目录已存在: {dir_path}")
+        # 直接尝试删除，目录不存在时跳过（省去单独的存在性检查）
+        try:
             shutil.rmtree(dir_path)
+            logger.warning(f"⚠ 检测到输出目录已存在: {dir_path}")
             logger.info(f"✓ 旧目录已删除")
+        except FileNotFoundError:
+            pass
 
         os.makedirs(dir_path)
         logger.info(f"✓ 创建新目录: {dir_path}")
@@ -296,12 +299,13 @@ class DatasetBuilder:
             # 保存CSV文件
             try:
                 new_df.to_csv(csv_filepath, index=False, encoding='utf-8')
-                logger.info(f"    ✓ 生成: {csv_filename}")
+                logger.debug("    ✓ 生成: %s", csv_filename)
                 success_count += 1
             except Exception as e:
                 logger.error(f"    ✗ 失败: {csv_filename} - {e}")
                 fail_count += 1
 
+        logger.info("    ✓ 生成 %d 个CSV文件", success_count)
         return success_count, fail_count
 
     def _find_excel_file(self, input_dir, station_prefix):
@@ -15,17 +15,20 @@ class DatasetStatistics:
     统计站点数据量和卫星类型数量
     """
 
-    def __init__(self, dataset_dir, antenna_config):
+    def __init__(self, dataset_dir, antenna_config, listing=None):
         """
         初始化统计器
 
         Args:
             dataset_dir: 数据集目录路径（包含QV子目录）
             antenna_config: 天线配置字典 {"CM": 6, "JMS": 14, ...}
+            listing: 可选，已遍历好的文件列表 [(绝对路径, 相对路径), ...]
+                     （见 core.utils.scan_dataset_files），提供时不再逐站点列目录
         """
         self.dataset_dir = dataset_dir
         self.antenna_config = antenna_config
         self.qv_dir = os.path.join(dataset_dir, 'QV')
+        self._station_csvs = self._group_station_csvs(listing) if listing is not None else None
 
         logger.info(f"数据集统计器初始化")
         logger.info(f"  数据集目录: {dataset_dir}")
@@ -63,6 +66,31 @@ class DatasetStatistics:
 
         return result
 
+    @staticmethod
+    def _group_station_csvs(listing):
+        """把文件列表按站点分组: {站点: [CSV文件名, ...]}（仅 QV/站点/*.csv）"""
+        station_csvs = {}
+        for _, arcname in listing:
+            parts = arcname.split('/')
+            if len(parts) == 3 and parts[0] == 'QV' and parts[2].endswith('.csv'):
+                station_csvs.setdefault(parts[1], []).append(parts[2])
+        return station_csvs
+
+    def _list_station_csvs(self, station):
+        """
+        列出站点目录下的CSV文件名
+
+        Returns:
+            list 或 None: CSV文件名列表；站点目录不存在时返回 None
+        """
+        if self._station_csvs is not None:
+            return self._station_csvs.get(station)
+
+        station_dir = os.path.join(self.qv_dir, station)
+        if not os.path.exists(station_dir):
+            return None
+        return [f for f in os.listdir(station_dir) if f.endswith('.csv')]
+
     def _calculate_station_counts(self):
         """
         统计各站点数据量
@@ -77,14 +105,15 @@ class DatasetStatistics:
 
         for station, antenna_count in self.antenna_config.items():
             station_dir = os.path.join(self.qv_dir, station)
+            station_csv_files = self._list_station_csvs(station)
 
-            if not os.path.exists(station_dir):
+            if station_csv_files is None:
                 logger.warning(f"  ⚠ 站点目录不存在: {station}")
                 station_counts[station] = 0
                 continue
 
             # 找到第一个CSV文件
-            csv_files = sorted([f for f in os.listdir(station_dir) if f.endswith('.csv')])
+            csv_files = sorted(station_csv_files)
 
             if not csv_files:
                 logger.warning(f"  ⚠ 站点 {station} 没有CSV文件")
@@ -136,11 +165,10 @@ class DatasetStatistics:
         for station in self.antenna_config.keys():
             station_dir = os.path.join(self.qv_dir, station)
 
-            if not os.path.exists(station_dir):
-                continue
-
             # 遍历该站点的所有CSV文件
-            csv_files = [f for f in os.listdir(station_dir) if f.endswith('.csv')]
+            csv_files = self._list_station_csvs(station)
+            if csv_files is None:
+                continue
 
             for csv_file in csv_files:
                 csv_path = os.path.join(station_dir, csv_file)
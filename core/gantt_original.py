@@ -25,13 +25,15 @@ def generate_gantt_chart(source_dir, output_dir):
     return html_content
 
 
-def generate_gantt_chart_with_figure(source_dir, output_dir):
+def generate_gantt_chart_with_figure(source_dir, output_dir, save_files=True, frames=None):
     """
     生成甘特图 - 返回HTML和Figure对象（新增 + 修复中文乱码）
 
     参数:
     source_dir: 结果CSV文件所在目录
     output_dir: HTML输出目录
+    save_files: 是否同时把HTML保存到 output_dir（服务端直接使用返回的HTML时可关闭）
+    frames: 可选，已读取的CSV数据 {规范化路径: DataFrame}，命中时不再重复读取文件
 
     返回:
     tuple: (html_content, fig)
@@ -51,8 +53,9 @@ def generate_gantt_chart_with_figure(source_dir, output_dir):
 
     for file in csv_files:
         try:
-            # 读取 CSV 文件
-            df = pd.read_csv(file)
+            # 读取 CSV 文件（优先使用已读取的数据，复制一份避免修改共享对象）
+            cached = frames.get(os.path.normpath(file)) if frames is not None else None
+            df = cached.copy() if cached is not None else pd.read_csv(file)
 
             # 获取文件所在的父目录名称（QV 或 S）
             parent_dir = os.path.basename(os.path.dirname(os.path.dirname(file)))
@@ -184,10 +187,11 @@ def generate_gantt_chart_with_figure(source_dir, output_dir):
     )
 
     # 同时保存文件（保持原有功能）
-    os.makedirs(output_dir, exist_ok=True)
-    chart_path = os.path.join(output_dir, "gantt_chart.html")
-    fig.write_html(chart_path)
-    print(f"甘特图已保存: {chart_path}")
+    if save_files:
+        os.makedirs(output_dir, exist_ok=True)
+        chart_path = os.path.join(output_dir, "gantt_chart.html")
+        fig.write_html(chart_path)
+        print(f"甘特图已保存: {chart_path}")
 
     # 返回 HTML 内容和 Figure 对象
     return html_content, fig
@@ -23,7 +23,7 @@ class ResultCombiner:
     将调度算法生成的Excel结果与原始CSV数据合并
     """
 
-    def __init__(self, dataset_dir, excel_path, output_dir):
+    def __init__(self, dataset_dir, excel_path, output_dir, answer_sheets=None):
         """
         初始化合并器
 
@@ -31,10 +31,13 @@ class ResultCombiner:
             dataset_dir: 数据集目录 (包含QV/子目录和CSV文件)
             excel_path: Excel结果文件路径 (算法生成的分配结果)
             output_dir: 输出目录 (合并后的结果输出路径)
+            answer_sheets: 可选，算法已在内存中返回的分配结果 {工作表名: DataFrame}，
+                           提供时不再重新解析Excel文件
         """
         self.dataset_dir = dataset_dir
         self.excel_path = excel_path
         self.output_dir = output_dir
+        self.answer_sheets = answer_sheets
 
         logger.info("=" * 60)
         logger.info("结果合并器初始化（修复版）")
@@ -66,14 +69,18 @@ class ResultCombiner:
         qv_result_path = os.path.join(result_path, 'QV')
         os.makedirs(qv_result_path, exist_ok=True)
 
-        # 3. 读取Excel结果文件
-        logger.info("读取Excel分配结果...")
-        try:
-            excel_data = pd.read_excel(self.excel_path, sheet_name=None, engine='openpyxl')
-            logger.info(f"✓ 成功读取Excel文件，包含 {len(excel_data)} 个工作表")
-        except Exception as e:
-            logger.error(f"✗ 读取Excel文件失败: {e}")
-            raise
+        # 3. 读取Excel结果文件（内存中已有分配结果时直接使用）
+        if self.answer_sheets is not None:
+            excel_data = self.answer_sheets
+            logger.info(f"✓ 使用内存中的分配结果，包含 {len(excel_data)} 个工作表")
+        else:
+            logger.info("读取Excel分配结果...")
+            try:
+                excel_data = pd.read_excel(self.excel_path, sheet_name=None, engine='openpyxl')
+                logger.info(f"✓ 成功读取Excel文件，包含 {len(excel_data)} 个工作表")
+            except Exception as e:
+                logger.error(f"✗ 读取Excel文件失败: {e}")
+                raise
 
         # 4. 获取原始CSV数据目录
         qv_data_dir = os.path.join(self.dataset_dir, 'QV')
@@ -122,7 +129,7 @@ class ResultCombiner:
                     # ========== 修复：添加列前先检查并删除重复列 ==========
                     # 1. 检查是否已有 allocation_status 列
                     if 'allocation_status' in original_df.columns:
-                        logger.debug(f"  {csv_file}: 检测到已存在 allocation_status 列，将覆盖")
+                        logger.debug("  %s: 检测到已存在 allocation_status 列，将覆盖", csv_file)
                         original_df = original_df.drop(columns=['allocation_status'])
 
                     # 2. 检查是否有重复列名（通用处理）
@@ -24,16 +24,18 @@ class SatisfactionChartGenerator:
         self.result_dir = result_dir
         self.output_dir = output_dir
 
-        logger.info(f"满足度图生成器初始化")
-        logger.info(f"  结果目录: {result_dir}")
-        logger.info(f"  临时输出目录: {output_dir}")
+        logger.info("满足度图生成器初始化")
+        logger.info("  结果目录: %s", result_dir)
+        logger.info("  临时输出目录: %s", output_dir)
 
-    def generate(self, task_id):
+    def generate(self, task_id, save_files=True, frames=None):
         """
         生成满足度分析图 - HTML + 图片
 
         Args:
             task_id: 任务ID，用于生成文件名
+            save_files: 是否同时把HTML保存到临时输出目录
+            frames: 可选，结果目录下已读取的CSV数据（见 core.utils.load_csv_tree）
 
         Returns:
             tuple: (html_content, image_url)
@@ -49,38 +51,40 @@ class SatisfactionChartGenerator:
             core_path = os.path.dirname(__file__)
             if core_path not in sys.path:
                 sys.path.insert(0, core_path)
-                logger.info(f"✓ 添加路径到 sys.path: {core_path}")
+                logger.info("✓ 添加路径到 sys.path: %s", core_path)
 
             # 导入修改后的原始脚本函数（返回HTML和Figure）
             from satisfaction_original_byhour import generate_satisfaction_chart_with_figure
 
-            logger.info(f"✓ 成功导入 satisfaction_original_byhour 模块")
+            logger.info("✓ 成功导入 satisfaction_original_byhour 模块")
 
             # ========== 步骤2: 生成HTML和Figure ==========
-            logger.info(f"调用原始满足度图生成函数...")
+            logger.info("调用原始满足度图生成函数...")
             html_content, fig = generate_satisfaction_chart_with_figure(
                 source_dir=self.result_dir,
-                output_dir=self.output_dir
+                output_dir=self.output_dir,
+                save_files=save_files,
+                frames=frames
             )
 
-            logger.info(f"✓ HTML生成完成，长度: {len(html_content)} 字符")
+            logger.info("✓ HTML生成完成，长度: %d 字符", len(html_content))
 
             # ========== 步骤3: 导出图片到静态目录 ==========
             image_url = self._export_image(fig, task_id)
 
-            logger.info(f"✓ 满足度图生成完成")
-            logger.info(f"  HTML长度: {len(html_content)} 字符")
-            logger.info(f"  图片URL: {image_url}")
+            logger.info("✓ 满足度图生成完成")
+            logger.info("  HTML长度: %d 字符", len(html_content))
+            logger.info("  图片URL: %s", image_url)
             logger.info("=" * 70)
 
             return html_content, image_url
 
         except ImportError as e:
-            logger.error(f"导入失败: {e}")
+            logger.error("导入失败: %s", e)
             raise
 
         except Exception as e:
-            logger.error(f"满足度图生成失败: {e}", exc_info=True)
+            logger.error("满足度图生成失败: %s", e, exc_info=True)
 
             # 返回错误提示
             error_html = self._generate_error_html("满足度分析图", str(e))
@@ -114,9 +118,9 @@ class SatisfactionChartGenerator:
             filename = f"{task_id}_satisfaction.{img_format}"
             filepath = os.path.join(static_dir, filename)
 
-            logger.info(f"正在导出图片...")
-            logger.info(f"  目标路径: {filepath}")
-            logger.info(f"  尺寸: {width}x{height}")
+            logger.info("正在导出图片...")
+            logger.info("  目标路径: %s", filepath)
+            logger.info("  尺寸: %sx%s", width, height)
 
             # 使用kaleido导出图片
             fig.write_image(
@@ -130,13 +134,13 @@ class SatisfactionChartGenerator:
             # 构建访问URL
             image_url = f"{server_url}{static_prefix}/{filename}"
 
-            logger.info(f"✓ 图片导出成功: {filepath}")
-            logger.info(f"✓ 访问URL: {image_url}")
+            logger.info("✓ 图片导出成功: %s", filepath)
+            logger.info("✓ 访问URL: %s", image_url)
 
             return image_url
 
         except Exception as e:
-            logger.error(f"图片导出失败: {e}", exc_info=True)
+            logger.error("图片导出失败: %s", e, exc_info=True)
             return None
 
     def _generate_error_html(self, chart_name, error_message):
@@ -25,13 +25,15 @@ def generate_satisfaction_chart(source_dir, output_dir):
     return html_content
 
 
-def generate_satisfaction_chart_with_figure(source_dir, output_dir):
+def generate_satisfaction_chart_with_figure(source_dir, output_dir, save_files=True, frames=None):
     """
     生成满足度分析图（按小时统计）- 返回HTML和Figure对象（新增 + 修复中文乱码）
 
     参数:
     source_dir: 结果CSV文件所在目录
     output_dir: HTML输出目录
+    save_files: 是否同时把HTML和处理后的数据保存到 output_dir（服务端直接使用返回的HTML时可关闭）
+    frames: 可选，已读取的CSV数据 {规范化路径: DataFrame}，命中时不再重复读取文件
 
     返回:
     tuple: (html_content, fig)
@@ -41,7 +43,8 @@ def generate_satisfaction_chart_with_figure(source_dir, output_dir):
     # ========== 以下代码几乎完全来自原始 7manzudu_groupbyhour.py ==========
 
     # 确保输出目录存在
-    os.makedirs(output_dir, exist_ok=True)
+    if save_files:
+        os.makedirs(output_dir, exist_ok=True)
 
     print(f"开始分析: {source_dir}")
 
@@ -60,8 +63,9 @@ def generate_satisfaction_chart_with_figure(source_dir, output_dir):
                 file_path = os.path.join(root, file)
                 print(f"正在处理: {file_path}")
                 try:
-                    # 读取 CSV 文件
-                    df = pd.read_csv(file_path)
+                    # 读取 CSV 文件（优先使用已读取的数据，复制一份避免修改共享对象）
+                    cached = frames.get(os.path.normpath(file_path)) if frames is not None else None
+                    df = cached.copy() if cached is not None else pd.read_csv(file_path)
 
                     # 获取相对路径并生成天线编号
                     rel_path = os.path.relpath(root, source_dir)
@@ -294,15 +298,16 @@ def generate_satisfaction_chart_with_figure(source_dir, output_dir):
         config={'displayModeBar': True, 'responsive': True}
     )
 
-    # 同时保存文件（保持原有功能）
-    chart_path = os.path.join(output_dir, "satisfaction_chart_hourly.html")
-    fig1.write_html(chart_path)
-    print(f"满足度图已保存: {chart_path}")
+    if save_files:
+        # 同时保存文件（保持原有功能）
+        chart_path = os.path.join(output_dir, "satisfaction_chart_hourly.html")
+        fig1.write_html(chart_path)
+        print(f"满足度图已保存: {chart_path}")
 
-    # 同时保存处理后的数据用于验证
-    final_df_path = os.path.join(output_dir, "processed_data_hourly.csv")
-    final_df.to_csv(final_df_path, index=False)
-    print(f"处理后的数据已保存: {final_df_path}")
+        # 同时保存处理后的数据用于验证
+        final_df_path = os.path.join(output_dir, "processed_data_hourly.csv")
+        final_df.to_csv(final_df_path, index=False)
+        print(f"处理后的数据已保存: {final_df_path}")
 
     # 返回 HTML 内容和 Figure 对象
     return html_content, fig1
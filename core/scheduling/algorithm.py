@@ -858,7 +858,7 @@ def answer_type_transform(keys_line, ground_station_cm_use_plan, all_data):
     index_dict = defaultdict(dict)
 
     for i in range(sta_num):
-        key = list(all_data[i].keys())[0]
+        key = next(iter(all_data[i]))
         info = all_data[i][key]
 
         for j, df in enumerate(info):
@@ -869,7 +869,7 @@ def answer_type_transform(keys_line, ground_station_cm_use_plan, all_data):
             index_dict[(key, j)] = df
 
     for i in range(sta_num):
-        key = list(all_data[i].keys())[0]
+        key = next(iter(all_data[i]))
         antenna_num = len(all_data[i][key])
         row_num = len(all_data[i][key][0])
         answer_array = (np.ones((row_num, antenna_num)) * 11).astype("int64")
@@ -886,7 +886,7 @@ def answer_type_transform(keys_line, ground_station_cm_use_plan, all_data):
         qv_s_allocation_flag = ground_station_cm_use_plan[answer_index][4]
 
         if ground_station_cm_use_plan[answer_index][0] <= sta_num:
-            key = list(all_data[sta_index].keys())[0]
+            key = next(iter(all_data[sta_index]))
             df = index_dict[(key, antenna_index)]
 
             condition = (df['sat'] == sat) & (df['laps'] == int(laps)) & (df['Status'] == str(status))
@@ -910,7 +910,7 @@ def answer_type_transform(keys_line, ground_station_cm_use_plan, all_data):
                     results[sta_index][(idx, antenna_index)] = "04"
         else:
             for i in range(sta_num):
-                key = list(all_data[i].keys())[0]
+                key = next(iter(all_data[i]))
                 info = all_data[i][key]
 
                 for df in info:
@@ -6,6 +6,7 @@ METHOD = 3 # 1:可分配时间窗口优先；2：天线可用率最高优先；3
 ANSWER_TYPE = 'TRUE' # 选择TRUE时，结果输出为EXCEL表格
 USE_SA = 'FALSE'        # 启用SA优化
 SA_MAX_TIME = 300      # 5分钟标准配置
+SA_NUM_CHAINS = 1      # SA第一阶段并行链数（1为单链，超过CPU核数时按核数执行）
 
 # ========== 站内天线负载均衡策略配置 ==========
 INTRA_STATION_BALANCE = 'False'  # 启用站内天线负载均衡
@@ -10,7 +10,7 @@ from algorithm import (count_time_station_num, data_joint, cal_avail_dmz, save_u
                        initialize_antenna_load_tracking, set_balance_config,
                        iterative_optimization, cal_success_rate, check_crossover_overflow, answer_type_transform,
                        resorted_by_status)
-from core.scheduling.config import (ROOT_FOLDER, OPTIMIZATION, METHOD, ANSWER_TYPE, USE_SA, SA_MAX_TIME,
+from core.scheduling.config import (ROOT_FOLDER, OPTIMIZATION, METHOD, ANSWER_TYPE, USE_SA, SA_MAX_TIME, SA_NUM_CHAINS,
                     INTRA_STATION_BALANCE, ANTENNA_LOAD_METHOD, LOAD_WEIGHT_TASK, LOAD_WEIGHT_TIME, TASK_INTERVAL)
 from validate_results import validate_allocation_results
 from simulated_annealing import optimize_with_sa
@@ -294,7 +294,8 @@ def main():
             satellite_ground_station=satellite_ground_station,
             num_stations=num_stations,
             max_time=SA_MAX_TIME,
-            verbose=True
+            verbose=True,
+            num_chains=SA_NUM_CHAINS
         )
 
         # SA优化后重新计算成功率
@@ -328,6 +329,8 @@ def main():
     # ==================== 新增模拟退火优化代码块（结束）====================
 
     # # 答案格式转化
+    # 各工作表的分配结果同时在内存中返回，调用方无需再解析Excel
+    answer_sheets = None
     if ANSWER_TYPE == 'TRUE':
         start_time1 = time.time()
         print('输出格式转换中……')
@@ -346,11 +349,14 @@ def main():
         file_name = f'{output_dir}/answer_output_QV_only_{timestamp}.xlsx'
 
         # 使用ExcelWriter上下文管理器写入Excel文件
+        answer_sheets = {}
         with pd.ExcelWriter(file_name, engine='openpyxl') as writer:
             for i, array in enumerate(answer_for_excel):
                 df = pd.DataFrame(array)
                 sheet_name = 'Sheet' + str(i + 1)
                 df.to_excel(writer, sheet_name=sheet_name, index=False)
+                # 与从Excel读回的结果保持一致：状态码按整数解析（"02" -> 2）
+                answer_sheets[sheet_name] = df.astype('int64')
 
         print("数据已成功写入Excel的不同工作表")
         end_time1 = time.time()
@@ -360,6 +366,8 @@ def main():
 
     validate_allocation_results(all_data, ground_station_cm_use_plan, keys_line)
 
+    return {'answer_sheets': answer_sheets}
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
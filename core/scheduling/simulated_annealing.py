@@ -8,9 +8,18 @@
 """
 
 import numpy as np
-import copy
-from collections import defaultdict
+import json
+import os
 import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+# 调优后的退火参数文件（由 SimulatedAnnealing.tune_schedule 生成，存在时自动加载）
+SA_PARAMS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sa_params.json')
+
+
+def _silent(*args, **kwargs):
+    """verbose=False 时替代 print 的空操作"""
 
 
 class SimulatedAnnealing:
@@ -18,7 +27,8 @@ class SimulatedAnnealing:
 
     def __init__(self, all_data, dict_sat_laps_sta_time_all, keys_line,
                  arr_all_start_time, arr_all_end_time, list_cm_avail,
-                 initial_plan, satellite_ground_station, num_stations):
+                 initial_plan, satellite_ground_station, num_stations, seed=None,
+                 params_file=SA_PARAMS_FILE):
         """
         初始化SA优化器
 
@@ -32,6 +42,8 @@ class SimulatedAnnealing:
         initial_plan - 初始贪心分配方案
         satellite_ground_station - 各圈次可观测的地面站列表
         num_stations - 地面站数量
+        seed - 随机数种子（None表示不固定）
+        params_file - 调优参数文件路径（文件不存在或为None时使用默认参数）
         """
         self.all_data = all_data
         self.dict_sat_laps_sta_time_all = dict_sat_laps_sta_time_all
@@ -42,9 +54,33 @@ class SimulatedAnnealing:
         self.satellite_ground_station = satellite_ground_station
         self.num_stations = num_stations
 
-        # 初始方案（深拷贝避免修改原数据）
-        self.current_plan = copy.deepcopy(initial_plan)
-        self.best_plan = copy.deepcopy(initial_plan)
+        # 独立的随机数生成器（PCG64），可通过seed复现结果
+        self.rng = np.random.default_rng(seed)
+
+        # 卫星编号（圈次键前5位）只编码一次为整数，之后全部按整数比较
+        # sat_ids 供数组内核使用，_sat_id_list 供Python层逐个取值
+        _, sat_ids = np.unique([key[:5] for key in keys_line], return_inverse=True)
+        self.sat_ids = np.asarray(sat_ids, dtype=np.int64).reshape(-1)
+        self._sat_id_list = self.sat_ids.tolist()
+        self.max_antennas = int(max(list_cm_avail)) if len(list_cm_avail) > 0 else 1
+
+        # 每个站的总可用时间窗口（优化过程中不变，只计算一次）
+        self.station_total_time = np.where(arr_all_end_time > 0, arr_all_end_time, 0).sum(axis=1)
+        self._has_window = self.station_total_time > 0
+
+        # 各圈次的候选天线表（候选集合在优化过程中不变，只计算一次）
+        self.task_candidates = [self._get_task_candidates(i) for i in range(len(keys_line))]
+        # 同一候选表按 (站点, 天线) 建立字典，供任务交换 O(1) 查找时间窗口
+        self.task_candidate_lookup = []
+        for candidates in self.task_candidates:
+            lookup = {}
+            for station_idx, antenna_idx, start_time, end_time in candidates.tolist():
+                lookup.setdefault((int(station_idx), int(antenna_idx)), (start_time, end_time))
+            self.task_candidate_lookup.append(lookup)
+
+        # 初始方案：统一为连续的 (N,5) float64 数组（复制一份，避免修改原数据）
+        self.current_plan = np.array(initial_plan, dtype=np.float64, order='C').reshape(-1, 5)
+        self.best_plan = self.current_plan.copy()
 
         # SA参数（会在optimize方法中根据阶段动态设置）
         self.T = 5000.0
@@ -52,10 +88,39 @@ class SimulatedAnnealing:
         self.alpha = 0.92
         self.inner_iterations = 1000
 
+        # 循环重加热：每 cycle_length 个温度为一轮，新一轮起始温度乘以 cycle_decay 并从最优解重新出发；
+        # 连续 reheat_patience 个温度接受率低于 reheat_accept_rate 时提前进入下一轮
+        self.cycle_length = 30
+        self.cycle_decay = 0.5
+        self.reheat_accept_rate = 0.02
+        self.reheat_patience = 3
+
+        # 调试开关：打开后快速冲突检查会与全方案扫描交叉校验（生产环境保持关闭）
+        self.debug_checks = False
+
         # ========== 【改进2-5】分阶段优化参数 ==========
         self.current_phase = 1  # 当前阶段：1=激进均衡，2=微调优化
+        self.phase_params = {
+            1: {'T0': 10000.0, 'alpha': 0.90, 'inner_iterations': 2000},  # 超高初始温度、超慢冷却、更多迭代
+            2: {'T0': 2000.0, 'alpha': 0.93, 'inner_iterations': 1000},   # 正常温度、正常冷却、正常迭代
+        }
+        self.phase1_frac = 0.4  # 第一阶段占总时间的比例
         # ========== 【改进2-5结束】 ==========
 
+        if params_file:
+            self._load_tuned_params(params_file)
+
+        # 当前方案的增量状态（均只反映 current_plan，在邻域解被接受时增量更新）：
+        # 天线索引：(站点, 天线) -> 按开始时间排序的 [开始时间列表, 结束时间列表, 圈次索引列表]
+        # 有效任务位图（及其索引缓存）、有效任务数、各站点占用时间
+        self._antenna_index = {}
+        self._valid = np.zeros(len(self.current_plan), dtype=bool)
+        self._valid_idx = None
+        self._current_valid_tasks = 0
+        self._current_usage = np.zeros(self.num_stations)
+        self._moved_tasks = ()
+        self._set_current_plan(self.current_plan)
+
         # 统计信息
         self.iteration_count = 0
         self.accepted_count = 0
@@ -72,51 +137,31 @@ class SimulatedAnnealing:
 
         返回：(总分, 成功率, 负载标准差, 负载差距, 惩罚项)
         """
+        plan = np.asarray(plan, dtype=np.float64)
+        valid = self._valid_mask(plan)
+        return self._objective_from_stats(plan, int(valid.sum()), self._station_usage(plan, valid), phase, valid)
+
+    def _objective_from_stats(self, plan, valid_tasks, station_usage, phase, valid=None):
+        """由有效任务数和各站占用时间计算目标函数值（返回值同 calculate_objective）"""
         # 1. 成功率计算
-        valid_tasks = 0
         total_tasks = len(self.keys_line)
-
-        for i in range(len(plan)):
-            if plan[i][0] < 100 and plan[i][2] < 1e10:  # 有效分配
-                valid_tasks += 1
-
         success_rate = valid_tasks / total_tasks if total_tasks > 0 else 0
 
         # 2. 负载均衡计算（时间占用率）
-        station_usage = np.zeros(self.num_stations)
-        station_total_time = np.zeros(self.num_stations)
-
-        # 计算每个站的总可用时间窗口
-        for i in range(self.num_stations):
-            non_zero_times = self.arr_all_end_time[i][self.arr_all_end_time[i] > 0]
-            if len(non_zero_times) > 0:
-                station_total_time[i] = non_zero_times.sum()
-
-        # 计算每个站的实际占用时间
-        for i in range(len(plan)):
-            if plan[i][0] < 100 and plan[i][2] < 1e10:
-                station_idx = int(plan[i][0]) - 1
-                duration = plan[i][3] - plan[i][2]
-                station_usage[station_idx] += duration
-
-        # 计算利用率
-        utilization = np.zeros(self.num_stations)
-        for i in range(self.num_stations):
-            if station_total_time[i] > 0:
-                utilization[i] = station_usage[i] / station_total_time[i]
+        utilization = self._utilization(station_usage)
 
         # 负载标准差（越小越好）
-        load_std = np.std(utilization)
+        load_std = utilization.std()
 
         # 计算最大负载和最小负载的差距
-        valid_utilization = utilization[station_total_time > 0]
+        valid_utilization = utilization[self._has_window]
         if len(valid_utilization) > 0:
-            load_gap = np.max(valid_utilization) - np.min(valid_utilization)
+            load_gap = valid_utilization.max() - valid_utilization.min()
         else:
             load_gap = 0
 
         # 3. 约束违反惩罚
-        penalty = self._calculate_penalty(plan)
+        penalty = self._calculate_penalty(plan, valid)
 
         # 4. 根据阶段计算目标函数
         if phase == 1:  # 第一阶段：激进均衡（不考虑成功率）
@@ -130,62 +175,65 @@ class SimulatedAnnealing:
 
         return total_score, success_rate, load_std, load_gap, penalty
 
-    def _calculate_penalty(self, plan):
-        """计算约束违反惩罚"""
-        penalty = 0
-
-        # 按天线组织任务
-        antenna_tasks = defaultdict(list)
-        for i, alloc in enumerate(plan):
-            if alloc[0] < 100 and alloc[2] < 1e10:  # 有效分配
-                key = (int(alloc[0]), int(alloc[1]))  # (站点, 天线)
-                antenna_tasks[key].append({
-                    'index': i,
-                    'start': alloc[2],
-                    'end': alloc[3],
-                    'sat_laps': self.keys_line[i]
-                })
-
-        # 检查每根天线的任务
-        for (station, antenna), tasks in antenna_tasks.items():
-            # 按开始时间排序
-            tasks.sort(key=lambda x: x['start'])
-
-            # 检查任务时长
-            for task in tasks:
-                duration = task['end'] - task['start']
-                if duration < 300:
-                    penalty += 1000  # 严重违反
-
-            # 检查相邻任务间隔
-            for i in range(len(tasks) - 1):
-                interval = tasks[i + 1]['start'] - tasks[i]['end']
-
-                # 判断是否同一卫星
-                sat1 = tasks[i]['sat_laps'][:5]
-                sat2 = tasks[i + 1]['sat_laps'][:5]
-
-                if sat1 == sat2:  # 同一卫星
-                    if interval < 300:
-                        penalty += 500
-                else:  # 不同卫星
-                    if interval < 600:
-                        penalty += 500
-
-                # 时间重叠
-                if interval < 0:
-                    penalty += 2000  # 最严重违反
-
-        return penalty
+    @staticmethod
+    def _valid_mask(plan):
+        """有效分配掩码"""
+        return (plan[:, 0] < 100) & (plan[:, 2] < 1e10)
+
+    def _station_usage(self, plan, valid):
+        """各站点实际占用时间"""
+        station_idx = plan[valid, 0].astype(np.intp) - 1
+        duration = plan[valid, 3] - plan[valid, 2]
+        return np.bincount(station_idx, weights=duration, minlength=self.num_stations)
+
+    def _utilization(self, station_usage):
+        """各站点时间利用率（无可用窗口的站点记为0）"""
+        utilization = np.zeros(self.num_stations)
+        np.divide(station_usage, self.station_total_time, out=utilization, where=self._has_window)
+        return utilization
+
+    def _calculate_penalty(self, plan, valid=None):
+        """
+        计算约束违反惩罚
+
+        有效任务按 (天线编码, 开始时间) 分组排序后，同一天线的任务在数组中连续，
+        四类违反（时长不足、同星间隔<300、异星间隔<600、时间重叠）均用布尔掩码一次算出
+
+        valid - 已知的有效分配位图（None时根据方案计算）
+        """
+        plan = np.asarray(plan, dtype=np.float64)
+        if valid is None:
+            valid = self._valid_mask(plan)
+        rows = np.flatnonzero(valid)
+
+        antenna_keys = ((plan[rows, 0].astype(np.int64) - 1) * self.max_antennas +
+                        plan[rows, 1].astype(np.int64) - 1)
+        order = np.lexsort((plan[rows, 2], antenna_keys))
+        rows = rows[order]
+        antenna_keys = antenna_keys[order]
+        starts = plan[rows, 2]
+        ends = plan[rows, 3]
+        sat_ids = self.sat_ids[rows]
+
+        # 检查任务时长
+        penalty = 1000 * np.count_nonzero(ends - starts < 300)  # 严重违反
+
+        # 检查相邻任务间隔（只统计同一天线内的相邻对）
+        same_antenna = antenna_keys[1:] == antenna_keys[:-1]
+        interval = starts[1:] - ends[:-1]
+        min_interval = np.where(sat_ids[1:] == sat_ids[:-1], 300, 600)
+        penalty += 500 * np.count_nonzero(same_antenna & (interval < min_interval))
+        penalty += 2000 * np.count_nonzero(same_antenna & (interval < 0))  # 时间重叠，最严重违反
+
+        return int(penalty)
 
     def _get_task_candidates(self, task_index):
         """
-        获取某个任务可以分配的候选天线列表
+        获取某个任务可以分配的候选天线列表（仅在初始化时调用，之后查表 self.task_candidates）
 
-        返回：[(station_idx, antenna_idx, start_time, end_time), ...]
+        返回：(M, 4) 数组，每行为 (station_idx, antenna_idx, start_time, end_time)
         """
         candidates = []
-        sat_laps_key = self.keys_line[task_index]
 
         # 获取该任务的可观测地面站
         observable_stations = self.satellite_ground_station[task_index]
@@ -207,56 +255,209 @@ class SimulatedAnnealing:
                             end_time
                         ))
 
-        return candidates
+        return np.array(candidates, dtype=np.float64).reshape(-1, 4)
+
+    # ========== 天线索引 ==========
+    def _build_antenna_index(self, plan):
+        """根据方案重建天线索引"""
+        self._antenna_index = {}
+        valid_rows = np.flatnonzero(self._valid_mask(plan))
+        order = valid_rows[np.lexsort((plan[valid_rows, 2], plan[valid_rows, 1], plan[valid_rows, 0]))]
+        for i in order:
+            key = (int(plan[i, 0]) - 1, int(plan[i, 1]) - 1)
+            starts, ends, tasks = self._antenna_index.setdefault(key, ([], [], []))
+            starts.append(float(plan[i, 2]))
+            ends.append(float(plan[i, 3]))
+            tasks.append(int(i))
+
+    def _index_remove(self, task_index, alloc):
+        """从天线索引中移除任务"""
+        if not (alloc[0] < 100 and alloc[2] < 1e10):
+            return
+        starts, ends, tasks = self._antenna_index[(int(alloc[0]) - 1, int(alloc[1]) - 1)]
+        pos = bisect_left(starts, alloc[2])
+        while tasks[pos] != task_index:
+            pos += 1
+        del starts[pos]
+        del ends[pos]
+        del tasks[pos]
+
+    def _index_insert(self, task_index, alloc):
+        """将任务插入天线索引"""
+        if not (alloc[0] < 100 and alloc[2] < 1e10):
+            return
+        starts, ends, tasks = self._antenna_index.setdefault((int(alloc[0]) - 1, int(alloc[1]) - 1), ([], [], []))
+        pos = bisect_right(starts, alloc[2])
+        starts.insert(pos, float(alloc[2]))
+        ends.insert(pos, float(alloc[3]))
+        tasks.insert(pos, task_index)
+
+    def _set_current_plan(self, plan):
+        """设置当前方案并重建全部增量状态"""
+        self.current_plan = plan
+        self._valid = self._valid_mask(plan)
+        self._valid_idx = None
+        self._current_valid_tasks = int(self._valid.sum())
+        self._current_usage = self._station_usage(plan, self._valid)
+        self._build_antenna_index(plan)
+
+    def _valid_task_indices(self):
+        """当前方案的有效任务索引（位图变化后才重新计算）"""
+        if self._valid_idx is None:
+            self._valid_idx = np.flatnonzero(self._valid)
+        return self._valid_idx
+
+    def _neighbor_stats(self, new_plan):
+        """
+        根据本次移动涉及的任务，增量计算邻域解的统计量
+
+        返回：(有效任务数, 各站点占用时间, 有效分配位图)
+        迁移和交换都不改变任务的有效性，此时位图直接复用当前方案的位图
+        """
+        valid_tasks = self._current_valid_tasks
+        usage = self._current_usage.copy()
+        valid = self._valid
+        for task_index in self._moved_tasks:
+            for alloc, sign in ((self.current_plan[task_index], -1), (new_plan[task_index], 1)):
+                if alloc[0] < 100 and alloc[2] < 1e10:
+                    valid_tasks += sign
+                    usage[int(alloc[0]) - 1] += sign * (alloc[3] - alloc[2])
+
+            new_alloc = new_plan[task_index]
+            is_valid = bool(new_alloc[0] < 100 and new_alloc[2] < 1e10)
+            if is_valid != valid[task_index]:
+                if valid is self._valid:
+                    valid = valid.copy()
+                valid[task_index] = is_valid
+        return valid_tasks, usage, valid
+
+    def _accept_neighbor(self, new_plan, stats):
+        """接受邻域解：同步增量状态并替换当前方案"""
+        for task_index in self._moved_tasks:
+            self._index_remove(task_index, self.current_plan[task_index])
+        for task_index in self._moved_tasks:
+            self._index_insert(task_index, new_plan[task_index])
+        self._current_valid_tasks, self._current_usage, valid = stats
+        if valid is not self._valid:
+            self._valid = valid
+            self._valid_idx = None
+        self.current_plan = new_plan
+
+    # ========== 天线索引结束 ==========
+
+    def _can_allocate_fast(self, antenna_key, start_time, end_time, task_index):
+        """
+        快速检查：只查天线索引，不读取方案
+
+        仅适用于待检查方案与 current_plan 一致的情况（迁移操作），
+        此时天线索引与方案完全同步，二分定位后检查左右相邻任务即可判定。
+        debug_checks 打开时与全方案扫描的结果交叉校验。
+
+        参数：
+        antenna_key - (站点, 天线)，均从0开始
+        task_index - 待分配的圈次索引（自身在索引中的记录会被跳过）
+        """
+        if end_time - start_time < 300:
+            result = False
+        else:
+            result = True
+            entry = self._antenna_index.get(antenna_key)
+            if entry is not None:
+                starts, ends, tasks = entry
+                sat_id_list = self._sat_id_list
+                current_sat = sat_id_list[task_index]
+                pos = bisect_right(starts, start_time)
+
+                # 左侧最近的任务：新任务在后
+                left = pos - 1
+                if left >= 0 and tasks[left] == task_index:
+                    left -= 1
+                if left >= 0:
+                    min_interval = 300 if current_sat == sat_id_list[tasks[left]] else 600
+                    if start_time - ends[left] < min_interval:  # 含时间重叠
+                        result = False
+
+                # 右侧最近的任务：新任务在前
+                right = pos
+                if right < len(tasks) and tasks[right] == task_index:
+                    right += 1
+                if result and right < len(tasks):
+                    min_interval = 300 if current_sat == sat_id_list[tasks[right]] else 600
+                    if starts[right] - end_time < min_interval:  # 含时间重叠
+                        result = False
+
+        if self.debug_checks:
+            assert result == self._can_allocate_scan(self.current_plan, task_index, antenna_key[0],
+                                                     antenna_key[1], start_time, end_time), \
+                f"快速冲突检查与全方案扫描结果不一致：task={task_index}, antenna={antenna_key}"
+
+        return result
+
+    def _can_allocate_scan(self, plan, task_index, station_idx, antenna_idx, start_time, end_time):
+        """全方案扫描的参考实现（逐一检查该天线上的所有任务，仅用于调试校验）"""
+        if end_time - start_time < 300:
+            return False
+
+        rows = np.flatnonzero((plan[:, 0] == station_idx + 1) & (plan[:, 1] == antenna_idx + 1) &
+                              (plan[:, 2] < 1e10))
+        rows = rows[rows != task_index]
+        starts = plan[rows, 2]
+        ends = plan[rows, 3]
+
+        # 检查时间重叠
+        if np.any((end_time > starts) & (start_time < ends)):
+            return False
+
+        # 检查间隔约束
+        min_interval = np.where(self.sat_ids[rows] == self.sat_ids[task_index], 300, 600)
+        interval = np.where(end_time <= starts, starts - end_time, start_time - ends)
+        return not np.any(interval < min_interval)
 
     def _can_allocate(self, plan, task_index, station_idx, antenna_idx, start_time, end_time):
         """
         检查是否可以将任务分配到指定天线
 
+        通过天线索引二分定位插入位置，只检查左右相邻的任务：
+        同一天线上的任务互不重叠且满足间隔约束，不相邻的任务间隔只会更大。
+        索引中已不在该天线上的任务（如交换时被临时移除）以 plan 为准跳过。
+
         返回：True/False
         """
         # 检查时长
         if end_time - start_time < 300:
             return False
 
-        # 获取该天线的所有已分配任务
-        antenna_key = (station_idx + 1, antenna_idx + 1)
-        existing_tasks = []
-
-        for i, alloc in enumerate(plan):
-            if i != task_index and alloc[0] == antenna_key[0] and alloc[1] == antenna_key[1]:
-                if alloc[2] < 1e10:  # 有效分配
-                    existing_tasks.append({
-                        'index': i,
-                        'start': alloc[2],
-                        'end': alloc[3],
-                        'sat_laps': self.keys_line[i]
-                    })
-
-        # 按时间排序
-        existing_tasks.sort(key=lambda x: x['start'])
-
-        # 检查与现有任务的时间冲突
-        current_sat = self.keys_line[task_index][:5]
-
-        for task in existing_tasks:
-            task_sat = task['sat_laps'][:5]
-
-            # 检查时间重叠
-            if not (end_time <= task['start'] or start_time >= task['end']):
-                return False
-
-            # 检查间隔约束
-            if end_time <= task['start']:  # 新任务在前
-                interval = task['start'] - end_time
-                min_interval = 300 if current_sat == task_sat else 600
-                if interval < min_interval:
+        entry = self._antenna_index.get((station_idx, antenna_idx))
+        if entry is None:
+            return True
+        starts, _, tasks = entry
+
+        sat_id_list = self._sat_id_list
+        current_sat = sat_id_list[task_index]
+        pos = bisect_right(starts, start_time)
+
+        # 左侧（开始时间不晚于新任务）最近的任务，与右侧最近的任务
+        for neighbors in (range(pos - 1, -1, -1), range(pos, len(tasks))):
+            for j in neighbors:
+                i = tasks[j]
+                alloc = plan[i]
+                if (i == task_index or alloc[0] != station_idx + 1 or
+                        alloc[1] != antenna_idx + 1 or alloc[2] >= 1e10):
+                    continue
+
+                # 检查时间重叠
+                if not (end_time <= alloc[2] or start_time >= alloc[3]):
                     return False
-            else:  # 新任务在后
-                interval = start_time - task['end']
-                min_interval = 300 if current_sat == task_sat else 600
+
+                # 检查间隔约束
+                min_interval = 300 if current_sat == sat_id_list[i] else 600
+                if end_time <= alloc[2]:  # 新任务在前
+                    interval = alloc[2] - end_time
+                else:  # 新任务在后
+                    interval = start_time - alloc[3]
                 if interval < min_interval:
                     return False
+                break
 
         return True
 
@@ -265,37 +466,14 @@ class SimulatedAnnealing:
         邻域操作：定向任务迁移
         强制从高负载天线迁移任务到低负载天线
         """
-        new_plan = copy.deepcopy(plan)
-
-        # 计算各站点负载
-        station_usage = np.zeros(self.num_stations)
-        station_total_time = np.zeros(self.num_stations)
-
-        # 计算总可用时间
-        for i in range(self.num_stations):
-            non_zero_times = self.arr_all_end_time[i][self.arr_all_end_time[i] > 0]
-            if len(non_zero_times) > 0:
-                station_total_time[i] = non_zero_times.sum()
-
-        # 计算实际占用时间
-        for alloc in plan:
-            if alloc[0] < 100 and alloc[2] < 1e10:
-                station_idx = int(alloc[0]) - 1
-                station_usage[station_idx] += (alloc[3] - alloc[2])
-
-        # 计算利用率
-        utilization = np.zeros(self.num_stations)
-        for i in range(self.num_stations):
-            if station_total_time[i] > 0:
-                utilization[i] = station_usage[i] / station_total_time[i]
-            else:
-                utilization[i] = 0
+        # 计算各站点利用率（plan 即 current_plan，直接使用增量维护的占用时间）
+        utilization = self._utilization(self._current_usage)
 
         # 找到负载最高的前3个站点和负载最低的前5个站点
-        valid_stations = [i for i in range(self.num_stations) if station_total_time[i] > 0]
+        valid_stations = np.flatnonzero(self._has_window).tolist()
 
         if len(valid_stations) < 2:
-            return new_plan, False
+            return plan, False
 
         # 按利用率排序
         sorted_by_load = sorted(valid_stations, key=lambda x: utilization[x])
@@ -313,76 +491,64 @@ class SimulatedAnnealing:
             attempts += 1
 
             # 随机选择一个高负载站点
-            high_station = np.random.choice(high_load_stations)
+            high_station = high_load_stations[self.rng.integers(len(high_load_stations))]
 
             # 找到该站点的所有任务
-            station_tasks = []
-            for i, alloc in enumerate(plan):
-                if alloc[0] == high_station + 1 and alloc[2] < 1e10:
-                    station_tasks.append(i)
+            station_tasks = np.flatnonzero(self._valid & (plan[:, 0] == high_station + 1))
 
             if len(station_tasks) == 0:
                 continue
 
             # 随机选择一个任务
-            task_idx = np.random.choice(station_tasks)
+            task_idx = station_tasks[self.rng.integers(len(station_tasks))]
 
             # 获取该任务的候选天线
-            candidates = self._get_task_candidates(task_idx)
+            candidates = self.task_candidates[task_idx]
 
             # 只考虑低负载站点的候选
-            low_load_candidates = [
-                c for c in candidates
-                if c[0] in low_load_stations
-            ]
+            low_load_candidates = candidates[np.isin(candidates[:, 0], low_load_stations)]
 
             if len(low_load_candidates) == 0:
                 continue
 
             # 优先选择负载最低的候选
-            low_load_candidates_sorted = sorted(
-                low_load_candidates,
-                key=lambda c: utilization[c[0]]
-            )
+            order = np.argsort(utilization[low_load_candidates[:, 0].astype(np.intp)], kind='stable')
 
             # 尝试前3个最低负载的候选
-            for candidate in low_load_candidates_sorted[:3]:
-                new_station, new_antenna, new_start, new_end = candidate
+            for candidate in low_load_candidates[order[:3]]:
+                new_station, new_antenna = int(candidate[0]), int(candidate[1])
+                new_start, new_end = candidate[2], candidate[3]
 
                 # 检查是否可以分配
-                if self._can_allocate(new_plan, task_idx, new_station, new_antenna, new_start, new_end):
-                    # 更新分配方案
-                    new_plan[task_idx] = np.array([
+                if self._can_allocate_fast((new_station, new_antenna), new_start, new_end, task_idx):
+                    # 更新分配方案（仅在成功时复制）
+                    new_plan = plan.copy()
+                    new_plan[task_idx] = (
                         new_station + 1,
                         new_antenna + 1,
                         new_start,
                         new_end,
-                        plan[task_idx][4]  # 保持状态标志
-                    ])
+                        plan[task_idx, 4]  # 保持状态标志
+                    )
+                    self._moved_tasks = (task_idx,)
                     return new_plan, True
 
-        return new_plan, False
+        return plan, False
 
     def _neighbor_task_reallocation(self, plan):
         """
         邻域操作1：任务迁移
         从高负载天线迁移任务到低负载天线
         """
-        new_plan = copy.deepcopy(plan)
-
         # 计算各站点负载
-        station_load = np.zeros(self.num_stations)
-        for alloc in plan:
-            if alloc[0] < 100 and alloc[2] < 1e10:
-                station_idx = int(alloc[0]) - 1
-                station_load[station_idx] += (alloc[3] - alloc[2])
+        station_load = self._current_usage
 
         # 找到高负载和低负载的站点
         high_load_stations = np.where(station_load > np.median(station_load))[0]
         low_load_stations = np.where(station_load < np.median(station_load))[0]
 
         if len(high_load_stations) == 0 or len(low_load_stations) == 0:
-            return new_plan, False
+            return plan, False
 
         # 随机选择一个高负载站点的任务
         attempts = 0
@@ -391,65 +557,59 @@ class SimulatedAnnealing:
         while attempts < max_attempts:
             attempts += 1
 
-            high_station = np.random.choice(high_load_stations)
+            high_station = high_load_stations[self.rng.integers(len(high_load_stations))]
 
             # 找到该站点的任务
-            station_tasks = []
-            for i, alloc in enumerate(plan):
-                if alloc[0] == high_station + 1 and alloc[2] < 1e10:
-                    station_tasks.append(i)
+            station_tasks = np.flatnonzero(self._valid & (plan[:, 0] == high_station + 1))
 
             if len(station_tasks) == 0:
                 continue
 
             # 随机选择一个任务
-            task_idx = np.random.choice(station_tasks)
+            task_idx = station_tasks[self.rng.integers(len(station_tasks))]
 
             # 获取该任务的候选天线
-            candidates = self._get_task_candidates(task_idx)
+            candidates = self.task_candidates[task_idx]
 
             # 只考虑低负载站点的候选
-            low_load_candidates = [
-                c for c in candidates
-                if c[0] in low_load_stations
-            ]
+            low_load_candidates = candidates[np.isin(candidates[:, 0], low_load_stations)]
 
             if len(low_load_candidates) == 0:
                 continue
 
             # 随机选择一个候选
-            new_station, new_antenna, new_start, new_end = \
-                low_load_candidates[np.random.randint(len(low_load_candidates))]
+            candidate = low_load_candidates[self.rng.integers(len(low_load_candidates))]
+            new_station, new_antenna = int(candidate[0]), int(candidate[1])
+            new_start, new_end = candidate[2], candidate[3]
 
             # 检查是否可以分配
-            if self._can_allocate(new_plan, task_idx, new_station, new_antenna, new_start, new_end):
-                # 更新分配方案
-                new_plan[task_idx] = np.array([
+            if self._can_allocate_fast((new_station, new_antenna), new_start, new_end, task_idx):
+                # 更新分配方案（仅在成功时复制）
+                new_plan = plan.copy()
+                new_plan[task_idx] = (
                     new_station + 1,
                     new_antenna + 1,
                     new_start,
                     new_end,
-                    plan[task_idx][4]  # 保持状态标志
-                ])
+                    plan[task_idx, 4]  # 保持状态标志
+                )
+                self._moved_tasks = (task_idx,)
                 return new_plan, True
 
-        return new_plan, False
+        return plan, False
 
     def _neighbor_task_swap(self, plan):
         """
         邻域操作2：任务交换
         交换两个任务的分配
-        """
-        new_plan = copy.deepcopy(plan)
 
+        检查期间在 plan 上原地临时移除两个任务，返回前恢复；仅在交换成功时复制方案
+        """
         # 找到所有有效任务
-        valid_tasks = []
-        for i, alloc in enumerate(plan):
-            if alloc[0] < 100 and alloc[2] < 1e10:
-                valid_tasks.append(i)
+        valid_tasks = self._valid_task_indices()
 
         if len(valid_tasks) < 2:
-            return new_plan, False
+            return plan, False
 
         # 随机选择两个任务
         attempts = 0
@@ -458,58 +618,63 @@ class SimulatedAnnealing:
         while attempts < max_attempts:
             attempts += 1
 
-            task1_idx, task2_idx = np.random.choice(valid_tasks, 2, replace=False)
-
-            # 获取两个任务的候选天线
-            candidates1 = self._get_task_candidates(task1_idx)
-            candidates2 = self._get_task_candidates(task2_idx)
+            pos1 = self.rng.integers(len(valid_tasks))
+            pos2 = self.rng.integers(len(valid_tasks) - 1)
+            if pos2 >= pos1:
+                pos2 += 1
+            task1_idx, task2_idx = valid_tasks[pos1], valid_tasks[pos2]
 
             # 检查task1是否可以分配到task2的位置
-            station2 = int(plan[task2_idx][0]) - 1
-            antenna2 = int(plan[task2_idx][1]) - 1
+            station2 = int(plan[task2_idx, 0]) - 1
+            antenna2 = int(plan[task2_idx, 1]) - 1
 
             # 检查task2是否可以分配到task1的位置
-            station1 = int(plan[task1_idx][0]) - 1
-            antenna1 = int(plan[task1_idx][1]) - 1
-
-            # 查找对应的时间窗口
-            valid_swap = False
-            for c1 in candidates1:
-                if c1[0] == station2 and c1[1] == antenna2:
-                    for c2 in candidates2:
-                        if c2[0] == station1 and c2[1] == antenna1:
-                            # 暂时移除两个任务
-                            temp_plan = copy.deepcopy(plan)
-                            temp_plan[task1_idx] = np.ones(5) * 1e10
-                            temp_plan[task2_idx] = np.ones(5) * 1e10
-
-                            # 检查交换后是否合法
-                            if (self._can_allocate(temp_plan, task1_idx, station2, antenna2, c1[2], c1[3]) and
-                                    self._can_allocate(temp_plan, task2_idx, station1, antenna1, c2[2], c2[3])):
-                                # 执行交换
-                                new_plan[task1_idx] = np.array([
-                                    station2 + 1, antenna2 + 1, c1[2], c1[3], plan[task1_idx][4]
-                                ])
-                                new_plan[task2_idx] = np.array([
-                                    station1 + 1, antenna1 + 1, c2[2], c2[3], plan[task2_idx][4]
-                                ])
-                                valid_swap = True
-                                break
-                    if valid_swap:
-                        break
+            station1 = int(plan[task1_idx, 0]) - 1
+            antenna1 = int(plan[task1_idx, 1]) - 1
+
+            # 查找对应的时间窗口，任一任务不能使用对方的天线则直接放弃
+            c1 = self.task_candidate_lookup[task1_idx].get((station2, antenna2))
+            if c1 is None:
+                continue
+            c2 = self.task_candidate_lookup[task2_idx].get((station1, antenna1))
+            if c2 is None:
+                continue
+
+            # 暂时移除两个任务（原地写入哨兵行，结束后恢复）
+            old1 = plan[task1_idx].copy()
+            old2 = plan[task2_idx].copy()
+            plan[task1_idx, :] = 1e10
+            plan[task2_idx, :] = 1e10
+
+            # 检查交换后是否合法
+            try:
+                valid_swap = (self._can_allocate(plan, task1_idx, station2, antenna2, c1[0], c1[1]) and
+                              self._can_allocate(plan, task2_idx, station1, antenna1, c2[0], c2[1]))
+            finally:
+                plan[task1_idx] = old1
+                plan[task2_idx] = old2
 
             if valid_swap:
+                # 执行交换
+                new_plan = plan.copy()
+                new_plan[task1_idx] = (station2 + 1, antenna2 + 1, c1[0], c1[1], plan[task1_idx, 4])
+                new_plan[task2_idx] = (station1 + 1, antenna1 + 1, c2[0], c2[1], plan[task2_idx, 4])
+                self._moved_tasks = (task1_idx, task2_idx)
                 return new_plan, True
 
-        return new_plan, False
+        return plan, False
 
-    def _generate_neighbor(self, plan):
+    def _generate_neighbor(self, plan, rand=None):
         """
         生成邻域解
 
+        参数：
+        rand - 选择邻域操作的[0,1)随机数（None时现场生成）
+
         返回：(新方案, 是否成功)
         """
-        rand = np.random.random()
+        if rand is None:
+            rand = self.rng.random()
 
         if rand < 0.5:  # 50%概率：定向迁移
             return self._neighbor_targeted_reallocation(plan)
@@ -534,24 +699,19 @@ class SimulatedAnnealing:
         self.current_phase = phase
 
         # 根据阶段设置参数
-        if phase == 1:
-            # 第一阶段：激进均衡
-            self.T = 10000.0  # 超高初始温度
-            self.alpha = 0.90  # 超慢冷却
-            self.inner_iterations = 2000  # 更多迭代
-            phase_name = "激进均衡"
-        else:
-            # 第二阶段：微调优化
-            self.T = 2000.0  # 正常温度
-            self.alpha = 0.93  # 正常冷却
-            self.inner_iterations = 1000  # 正常迭代
-            phase_name = "微调优化"
+        params = self.phase_params[phase]
+        self.T = float(params['T0'])
+        self.alpha = float(params['alpha'])
+        self.inner_iterations = int(params['inner_iterations'])
+        phase_name = "激进均衡" if phase == 1 else "微调优化"
 
-        if verbose:
-            print(f"\n{'=' * 70}")
-            print(f"第{phase}阶段：{phase_name}")
-            print(f"{'=' * 70}")
-            print(f"参数设置：T0={self.T}, alpha={self.alpha}, L={self.inner_iterations}")
+        # 非verbose时日志为空操作；热循环内的周期性日志先判断条件再格式化
+        log = print if verbose else _silent
+
+        log(f"\n{'=' * 70}")
+        log(f"第{phase}阶段：{phase_name}")
+        log(f"{'=' * 70}")
+        log(f"参数设置：T0={self.T}, alpha={self.alpha}, L={self.inner_iterations}")
 
         # 计算初始目标函数值
         current_score, current_success, current_std, current_gap, current_penalty = \
@@ -559,124 +719,279 @@ class SimulatedAnnealing:
         best_score = current_score
 
         if verbose:
-            print(f"初始解：成功率={current_success:.4f}, 负载标准差={current_std:.4f}, "
-                  f"负载差距={current_gap:.4f}, 惩罚={current_penalty:.0f}")
-            print(f"初始目标函数值：{current_score:.2f}")
-            print("-" * 70)
+            log(f"初始解：成功率={current_success:.4f}, 负载标准差={current_std:.4f}, "
+                f"负载差距={current_gap:.4f}, 惩罚={current_penalty:.0f}")
+            log(f"初始目标函数值：{current_score:.2f}")
+            log("-" * 70)
+
+        # 热循环中反复调用的方法提前绑定为局部变量
+        generate_neighbor = self._generate_neighbor
+        neighbor_stats = self._neighbor_stats
+        objective_from_stats = self._objective_from_stats
+        accept_neighbor = self._accept_neighbor
 
         temperature_count = 0
         phase_iteration_count = 0
         phase_accepted_count = 0
         phase_improved_count = 0
 
+        # 循环重加热状态：T_k = T0 * alpha^(k mod L) * beta^(k // L)
+        cycle_T0 = self.T
+        step_in_cycle = 0
+        low_accept_streak = 0
+        cycle_count = 1
+
         # 主循环
         while self.T > self.T_min:
             temperature_count += 1
 
             # 检查时间限制
             if time.time() - start_time > max_time:
-                if verbose:
-                    print(f"\n达到阶段时间限制 {max_time}秒")
+                log(f"\n达到阶段时间限制 {max_time}秒")
                 break
 
             # 内循环
             accepted_in_temp = 0
             improved_in_temp = 0
 
-            for _ in range(self.inner_iterations):
+            # 按温度批量预生成随机数（接受判定在对数空间进行，预先取log）
+            neighbor_kind = self.rng.random(self.inner_iterations)
+            log_u = np.log(self.rng.random(self.inner_iterations))
+            T = self.T
+
+            for k in range(self.inner_iterations):
                 self.iteration_count += 1
                 phase_iteration_count += 1
 
                 # 生成邻域解
-                new_plan, success = self._generate_neighbor(self.current_plan)
+                new_plan, success = generate_neighbor(self.current_plan, neighbor_kind[k])
 
                 if not success:
                     continue
 
-                # 计算新解的目标函数值
-                new_score, new_success, new_std, new_gap, new_penalty = \
-                    self.calculate_objective(new_plan, phase=phase)
+                # 增量计算新解的目标函数值
+                stats = neighbor_stats(new_plan)
+                new_score = objective_from_stats(new_plan, stats[0], stats[1], phase, stats[2])[0]
 
                 # 计算差值
                 delta = new_score - current_score
 
-                # Metropolis接受准则
-                if delta > 0:  # 更好的解，直接接受
-                    self.current_plan = new_plan
-                    current_score = new_score
-                    current_success = new_success
-                    current_std = new_std
-                    current_gap = new_gap
-                    current_penalty = new_penalty
-
-                    self.accepted_count += 1
-                    phase_accepted_count += 1
-                    accepted_in_temp += 1
+                # Metropolis接受准则：更好的解直接接受，较差的解以一定概率接受
+                # u < exp(delta/T) 等价于 log(u)*T < delta，免去exp计算
+                improved = delta > 0
+                if not improved and log_u[k] * T >= delta:
+                    continue
+
+                accept_neighbor(new_plan, stats)
+                current_score = new_score
+
+                self.accepted_count += 1
+                phase_accepted_count += 1
+                accepted_in_temp += 1
+
+                if improved:
                     improved_in_temp += 1
                     self.improved_count += 1
                     phase_improved_count += 1
 
                     # 更新最优解
                     if new_score > best_score:
-                        self.best_plan = copy.deepcopy(new_plan)
+                        self.best_plan = new_plan.copy()
                         best_score = new_score
 
-                        if verbose and phase_iteration_count % 200 == 0:
-                            print(f"[阶段{phase}-迭代{phase_iteration_count}] 发现更优解！"
-                                  f"成功率={new_success:.4f}, "
-                                  f"负载标准差={new_std:.4f}, "
-                                  f"负载差距={new_gap:.4f}, "
-                                  f"得分={new_score:.2f}")
-
-                else:  # 较差的解，以一定概率接受
-                    accept_prob = np.exp(delta / self.T)
-                    if np.random.random() < accept_prob:
-                        self.current_plan = new_plan
-                        current_score = new_score
-                        current_success = new_success
-                        current_std = new_std
-                        current_gap = new_gap
-                        current_penalty = new_penalty
-
-                        self.accepted_count += 1
-                        phase_accepted_count += 1
-                        accepted_in_temp += 1
-
-            # 降温
-            self.T *= self.alpha
-
-            # 每10个温度打印一次信息
+            # 降温（循环重加热）
+            step_in_cycle += 1
+            if accepted_in_temp < self.reheat_accept_rate * self.inner_iterations:
+                low_accept_streak += 1
+            else:
+                low_accept_streak = 0
+
+            if step_in_cycle >= self.cycle_length or low_accept_streak >= self.reheat_patience:
+                # 开始新一轮：起始温度衰减，从当前最优解重新出发
+                cycle_T0 *= self.cycle_decay
+                self.T = cycle_T0
+                step_in_cycle = 0
+                low_accept_streak = 0
+                cycle_count += 1
+
+                self._set_current_plan(self.best_plan.copy())
+                current_score = best_score
+
+                if verbose:
+                    log(f"[阶段{phase}-第{cycle_count}轮] 重加热至 T={self.T:.2f}，从最优解重新出发")
+            else:
+                self.T = cycle_T0 * self.alpha ** step_in_cycle
+
+            # 每10个温度汇总打印一次（含当前最优得分），不再逐次打印改进事件
             if verbose and temperature_count % 10 == 0:
                 elapsed = time.time() - start_time
-                print(f"[阶段{phase}-温度#{temperature_count}] T={self.T:.2f}, "
-                      f"接受率={accepted_in_temp}/{self.inner_iterations}, "
-                      f"改进数={improved_in_temp}, "
-                      f"用时={elapsed:.1f}s")
+                log(f"[阶段{phase}-温度#{temperature_count}] T={self.T:.2f}, "
+                    f"接受率={accepted_in_temp}/{self.inner_iterations}, "
+                    f"改进数={improved_in_temp}, "
+                    f"最优得分={best_score:.2f}, "
+                    f"用时={elapsed:.1f}s")
 
         # 阶段完成
         if verbose:
             best_score, best_success, best_std, best_gap, best_penalty = \
                 self.calculate_objective(self.best_plan, phase=phase)
-            print(f"\n阶段{phase}完成！")
-            print(f"阶段迭代次数：{phase_iteration_count}")
-            print(
-                f"阶段接受次数：{phase_accepted_count} ({phase_accepted_count / max(phase_iteration_count, 1) * 100:.1f}%)")
-            print(f"阶段改进次数：{phase_improved_count}")
-            print(f"最优解：成功率={best_success:.4f}, 负载标准差={best_std:.4f}, "
-                  f"负载差距={best_gap:.4f}, 惩罚={best_penalty:.0f}")
-            print(f"阶段用时：{time.time() - start_time:.1f}秒")
+            log(f"\n阶段{phase}完成！")
+            log(f"阶段迭代次数：{phase_iteration_count}")
+            log(f"阶段接受次数：{phase_accepted_count} "
+                f"({phase_accepted_count / max(phase_iteration_count, 1) * 100:.1f}%)")
+            log(f"阶段改进次数：{phase_improved_count}")
+            log(f"最优解：成功率={best_success:.4f}, 负载标准差={best_std:.4f}, "
+                f"负载差距={best_gap:.4f}, 惩罚={best_penalty:.0f}")
+            log(f"阶段用时：{time.time() - start_time:.1f}秒")
 
         return self.best_plan, True
 
     # ========== 【改进2-5结束】 ==========
 
-    def optimize(self, max_time=300, verbose=True):
+    # ========== 超参数调优 ==========
+    def _load_tuned_params(self, params_file):
+        """加载调优后的退火参数（文件不存在时保持默认参数）"""
+        if not os.path.exists(params_file):
+            return
+
+        with open(params_file, 'r', encoding='utf-8') as f:
+            tuned = json.load(f)
+
+        for phase, params in tuned.get('phase_params', {}).items():
+            self.phase_params[int(phase)].update(params)
+        self.phase1_frac = float(tuned.get('phase1_frac', self.phase1_frac))
+
+    def tune_schedule(self, budget_trials=30, trial_time=30, params_file=SA_PARAMS_FILE):
+        """
+        使用 Optuna (TPE) 在当前实例上调优退火参数，并将最优参数保存为JSON
+
+        搜索空间：各阶段 T0 ∈ log[1e2, 1e4]、alpha ∈ [0.85, 0.99]、
+        inner_iterations ∈ [200, 2000]，以及第一阶段时间占比 ∈ [0.2, 0.7]。
+        惩罚权重定义了目标函数本身，不参与调优。
+
+        参数：
+        budget_trials - 试验次数
+        trial_time - 每次试验的优化时间（秒）
+        params_file - 参数保存路径（None表示不保存）
+
+        返回：最优参数字典
+        """
+        try:
+            import optuna
+        except ImportError:
+            raise ImportError("超参数调优需要安装 optuna：pip install optuna")
+
+        inputs = self._chain_inputs()
+
+        def objective(trial):
+            phase_params = {
+                phase: {
+                    'T0': trial.suggest_float(f'T0_{phase}', 1e2, 1e4, log=True),
+                    'alpha': trial.suggest_float(f'alpha_{phase}', 0.85, 0.99),
+                    'inner_iterations': trial.suggest_int(f'inner_iterations_{phase}', 200, 2000),
+                }
+                for phase in (1, 2)
+            }
+            sa = SimulatedAnnealing(**inputs, seed=trial.number)
+            sa.phase_params = phase_params
+            sa.phase1_frac = trial.suggest_float('phase1_frac', 0.2, 0.7)
+            best_plan = sa.optimize(max_time=trial_time, verbose=False, num_chains=1)
+            return -sa.calculate_objective(best_plan, phase=2)[0]
+
+        study = optuna.create_study(direction='minimize', sampler=optuna.samplers.TPESampler(seed=0))
+        study.optimize(objective, n_trials=budget_trials)
+
+        best = study.best_params
+        tuned = {
+            'phase_params': {
+                str(phase): {
+                    'T0': best[f'T0_{phase}'],
+                    'alpha': best[f'alpha_{phase}'],
+                    'inner_iterations': best[f'inner_iterations_{phase}'],
+                }
+                for phase in (1, 2)
+            },
+            'phase1_frac': best['phase1_frac'],
+        }
+
+        if params_file:
+            with open(params_file, 'w', encoding='utf-8') as f:
+                json.dump(tuned, f, ensure_ascii=False, indent=2)
+
+        for phase, params in tuned['phase_params'].items():
+            self.phase_params[int(phase)].update(params)
+        self.phase1_frac = tuned['phase1_frac']
+
+        return tuned
+
+    # ========== 超参数调优结束 ==========
+
+    # ========== 多链并行 ==========
+    def _chain_inputs(self):
+        """子进程重建优化器所需的输入（all_data 等原始数据不参与优化，不传递）"""
+        return {
+            'all_data': None,
+            'dict_sat_laps_sta_time_all': None,
+            'keys_line': self.keys_line,
+            'arr_all_start_time': self.arr_all_start_time,
+            'arr_all_end_time': self.arr_all_end_time,
+            'list_cm_avail': self.list_cm_avail,
+            'initial_plan': self.current_plan,
+            'satellite_ground_station': self.satellite_ground_station,
+            'num_stations': self.num_stations,
+            'params_file': None,
+        }
+
+    def _optimize_phase1_parallel(self, num_chains, max_time, verbose=True):
+        """
+        第一阶段多链并行：各链使用不同随机种子独立退火，取第一阶段得分最高的方案
+
+        第 i 条链的种子只由主随机数生成器和 i 决定，与链数、CPU核数无关
+
+        返回：(最优方案, 是否成功)；进程池不可用时返回 (None, False)
+        """
+        base_seed = int(self.rng.integers(0, 2 ** 32))
+        seeds = [np.random.SeedSequence(base_seed, spawn_key=(i,)) for i in range(num_chains)]
+
+        try:
+            # 大块只读输入通过initializer每个进程只传一次
+            with ProcessPoolExecutor(max_workers=num_chains, initializer=_init_chain_worker,
+                                     initargs=(self._chain_inputs(),)) as executor:
+                results = list(executor.map(_run_phase1_chain, seeds, [max_time] * num_chains,
+                                            [self.phase_params] * num_chains))
+        except Exception as e:
+            if verbose:
+                print(f"多链并行不可用，改为单链执行：{e}")
+            return None, False
+
+        best_score, best_plan = None, None
+        for score, plan, iterations, accepted, improved in results:
+            self.iteration_count += iterations
+            self.accepted_count += accepted
+            self.improved_count += improved
+            if best_score is None or score > best_score:
+                best_score, best_plan = score, plan
+
+        if verbose:
+            scores = ", ".join(f"{r[0]:.2f}" for r in results)
+            print(f"\n第1阶段 {num_chains} 条链完成，各链最优得分：{scores}")
+            print(f"选用最优链：得分={best_score:.2f}")
+
+        return best_plan, True
+
+    # ========== 多链并行结束 ==========
+
+    def optimize(self, max_time=300, verbose=True, num_chains=1):
         """
         执行分阶段模拟退火优化
 
         参数：
         max_time - 最大运行时间（秒）
         verbose - 是否打印详细信息
+        num_chains - 第一阶段并行链数（1表示单链顺序执行；超过CPU核数时按CPU核数执行）
+
+        注意：退火按运行时间而非迭代次数终止，固定seed时不同性能的机器结果也可能不同；
+        num_chains 超过CPU核数时实际链数随机器而变，结果同样与机器相关
 
         返回：优化后的方案
         """
@@ -699,19 +1014,30 @@ class SimulatedAnnealing:
             print(f"  惩罚={initial_penalty:.0f}")
 
         # ========== 【改进2-5】分阶段优化 ==========
-        # 分配时间：第一阶段40%，第二阶段60%
-        phase1_time = max_time * 0.4
-        phase2_time = max_time * 0.6
-
-        # 第一阶段：激进均衡
-        self.best_plan, _ = self._optimize_single_phase(
-            phase=1,
-            max_time=phase1_time,
-            verbose=verbose
-        )
+        # 分配时间：默认第一阶段40%，第二阶段60%
+        phase1_time = max_time * self.phase1_frac
+        phase2_time = max_time - phase1_time
+
+        # 第一阶段：激进均衡（多链并行，取最优链）
+        num_chains = max(1, min(num_chains, os.cpu_count() or 1))
+
+        parallel_done = False
+        if num_chains > 1:
+            if verbose:
+                print(f"\n第1阶段：{num_chains} 条独立链并行退火")
+            best_plan, parallel_done = self._optimize_phase1_parallel(num_chains, phase1_time, verbose)
+            if parallel_done:
+                self.best_plan = best_plan
+
+        if not parallel_done:
+            self.best_plan, _ = self._optimize_single_phase(
+                phase=1,
+                max_time=phase1_time,
+                verbose=verbose
+            )
 
         # 更新当前方案为第一阶段的最优解
-        self.current_plan = copy.deepcopy(self.best_plan)
+        self._set_current_plan(self.best_plan.copy())
 
         # 第二阶段：微调优化
         self.best_plan, _ = self._optimize_single_phase(
@@ -755,10 +1081,33 @@ class SimulatedAnnealing:
         return self.best_plan
 
 
+# ========== 多链并行子进程入口（需为模块级函数以便pickle） ==========
+_worker_inputs = None
+
+
+def _init_chain_worker(inputs):
+    """子进程初始化：缓存优化器输入"""
+    global _worker_inputs
+    _worker_inputs = inputs
+
+
+def _run_phase1_chain(seed, max_time, phase_params):
+    """
+    在子进程中运行一条第一阶段退火链
+
+    返回：(第一阶段得分, 最优方案, 迭代次数, 接受次数, 改进次数)
+    """
+    sa = SimulatedAnnealing(**_worker_inputs, seed=seed)
+    sa.phase_params = phase_params
+    best_plan, _ = sa._optimize_single_phase(phase=1, max_time=max_time, verbose=False)
+    score = sa.calculate_objective(best_plan, phase=1)[0]
+    return score, best_plan, sa.iteration_count, sa.accepted_count, sa.improved_count
+
+
 def optimize_with_sa(all_data, dict_sat_laps_sta_time_all, keys_line,
                      arr_all_start_time, arr_all_end_time, list_cm_avail,
                      initial_plan, satellite_ground_station, num_stations,
-                     max_time=300, verbose=True):
+                     max_time=300, verbose=True, seed=None, num_chains=1):
     """
     使用分阶段模拟退火优化分配方案
 
@@ -775,9 +1124,10 @@ def optimize_with_sa(all_data, dict_sat_laps_sta_time_all, keys_line,
         list_cm_avail=list_cm_avail,
         initial_plan=initial_plan,
         satellite_ground_station=satellite_ground_station,
-        num_stations=num_stations
+        num_stations=num_stations,
+        seed=seed
     )
 
-    optimized_plan = sa.optimize(max_time=max_time, verbose=verbose)
+    optimized_plan = sa.optimize(max_time=max_time, verbose=verbose, num_chains=num_chains)
 
     return optimized_plan
\ No newline at end of file
@@ -1,3 +1,9 @@
+import time
+
+# show_progress 的刷新状态（上次输出时间、上次输出的进度条格数）
+_progress_state = {'last_time': 0.0, 'last_block': -1}
+
+
 def merge_dicts_with_sorted_values(dict1: object, dict2: object) -> object:
     """
     合并两个字典，将相同键的值合并为一个有序列表。
@@ -9,11 +15,14 @@ def merge_dicts_with_sorted_values(dict1: object, dict2: object) -> object:
     返回值：
     result - 合并后的字典
     """
-    # 使用解包操作将两个字典合并
-    result = {**dict1, **dict2}
-    # 遍历合并后的字典，对相同键的值进行合并排序
-    for key, _ in result.items():
-        result[key] = dict1.get(key, []) + dict2.get(key, [])
+    # 复制dict1的值列表（不修改原字典），再单次遍历dict2按键追加
+    # 值保持 dict1 在前、dict2 在后的原有顺序，键顺序与 {**dict1, **dict2} 一致
+    result = {key: list(value) for key, value in dict1.items()}
+    for key, value in dict2.items():
+        if key in result:
+            result[key].extend(value)
+        else:
+            result[key] = list(value)
     return result
 
 def show_progress(total, current):
@@ -27,6 +36,15 @@ def show_progress(total, current):
     progress = current / total  # 计算当前进度的比例
     bar_length = 40  # 进度条的长度
     block = int(round(bar_length * progress))  # 计算进度条中完成部分的长度
+
+    # 限制刷新频率：进度条格数未变化且距上次输出不足0.05秒时直接跳过（最终进度总是输出）
+    now = time.monotonic()
+    if (current < total and block == _progress_state['last_block']
+            and now - _progress_state['last_time'] < 0.05):
+        return
+    _progress_state['last_time'] = now
+    _progress_state['last_block'] = block
+
     # 构建进度条字符串，使用#表示已完成部分，-表示未完成部分
     progress_bar = "#" * block + "-" * (bar_length - block)
     # 打印进度条，使用\r使光标回到行首，flush=True使输出实时刷新
@@ -11,12 +11,115 @@
 
 import numpy as np
 import pandas as pd
-from collections import defaultdict
 from datetime import datetime
 import os
+from functools import lru_cache
 
+# 明细超过该行数时改为导出CSV（Excel写入过慢且占用内存大）
+EXCEL_MAX_ROWS = 50000
 
-def validate_requirement1(all_data, ground_station_cm_use_plan, keys_line):
+
+def _export_table(df, excel_file):
+    """
+    导出验证明细表
+
+    小表写Excel：优先使用xlsxwriter的constant_memory模式（逐行落盘），未安装时退回openpyxl；
+    超过 EXCEL_MAX_ROWS 行时直接写同名CSV。
+
+    返回：
+    实际写入的文件路径
+    """
+    if len(df) > EXCEL_MAX_ROWS:
+        csv_file = os.path.splitext(excel_file)[0] + '.csv'
+        df.to_csv(csv_file, index=False, encoding='utf-8-sig')
+        return csv_file
+
+    try:
+        import xlsxwriter  # noqa: F401
+    except ImportError:
+        df.to_excel(excel_file, index=False, engine='openpyxl')
+        return excel_file
+
+    with pd.ExcelWriter(excel_file, engine='xlsxwriter',
+                        engine_kwargs={'options': {'constant_memory': True}}) as writer:
+        df.to_excel(writer, index=False)
+    return excel_file
+
+
+@lru_cache(maxsize=32)
+def _detect_columns(columns):
+    """
+    识别弧段数据的列名（按列名元组缓存，同一表结构只识别一次）
+
+    返回：
+    (start_col, stop_col, sat_col, laps_col, status_col)，缺少时间列时前两项为 None
+    """
+    start_col = next((col for col in ['start(UTC)', 'start'] if col in columns), None)
+    stop_col = next((col for col in ['stop(UTC)', 'stop'] if col in columns), None)
+    sat_col = 'sat' if 'sat' in columns else 'Sat'
+    laps_col = 'laps' if 'laps' in columns else 'Laps'
+    status_col = 'Status' if 'Status' in columns else 'status'
+    return start_col, stop_col, sat_col, laps_col, status_col
+
+
+def _keys_isin(row_cols, ref_cols):
+    """
+    判断多列组合键是否出现在参考键集合中（向量化）
+
+    每列先整体编码为小整数，再按混合进制压成单个 int64 键，用 np.isin 一次完成匹配；
+    组合空间超出 int64 时退回 MultiIndex.isin。
+
+    参数：
+    row_cols - 待检查的列数组列表
+    ref_cols - 参考键的列数组列表（与 row_cols 一一对应）
+
+    返回：
+    与 row_cols 等长的布尔数组
+    """
+    n_rows = len(row_cols[0])
+    if n_rows == 0 or len(ref_cols[0]) == 0:
+        return np.zeros(n_rows, dtype=bool)
+
+    packed = np.zeros(n_rows + len(ref_cols[0]), dtype=np.int64)
+    capacity = 1
+    for row_col, ref_col in zip(row_cols, ref_cols):
+        codes, uniques = pd.factorize(np.concatenate([np.asarray(row_col), np.asarray(ref_col)]))
+        radix = len(uniques)
+        capacity *= radix
+        if capacity >= 2 ** 63:
+            keys = pd.MultiIndex.from_arrays(row_cols)
+            return keys.isin(list(zip(*[np.asarray(col).tolist() for col in ref_cols])))
+        packed = packed * radix + codes
+
+    return np.isin(packed[:n_rows], packed[n_rows:])
+
+
+def _format_timestamps(timestamps):
+    """将秒级时间戳数组一次性格式化为 '%Y-%m-%d %H:%M:%S' 字符串数组（按UTC显示，与原始数据一致）"""
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if timestamps.size == 0:
+        return np.empty(0, dtype=object)
+    return pd.to_datetime(timestamps, unit='s').strftime('%Y-%m-%d %H:%M:%S').to_numpy()
+
+
+def _to_epoch_seconds(column):
+    """
+    将时间列转换为秒级时间戳数组（int64）
+
+    优先按固定格式 '%Y-%m-%d %H:%M:%S' 解析，避免逐列推断格式；
+    格式不符时退回 ISO8601 解析。直接转换为 datetime64[s]，不经过纳秒整数再整除。
+    """
+    if not pd.api.types.is_datetime64_any_dtype(column):
+        try:
+            column = pd.to_datetime(column, format='%Y-%m-%d %H:%M:%S', cache=True)
+        except (ValueError, TypeError):
+            column = pd.to_datetime(column, format='ISO8601', cache=True)
+    if getattr(column.dt, 'tz', None) is not None:
+        column = column.dt.tz_convert(None)
+    return column.to_numpy().astype('datetime64[s]').astype(np.int64)
+
+
+def validate_requirement1(all_data, ground_station_cm_use_plan, keys_line, max_report=None):
     """
     验证需求1: 可见弧段任务最小时长限制（≥300s）
 
@@ -24,6 +127,7 @@ def validate_requirement1(all_data, ground_station_cm_use_plan, keys_line):
     all_data - 原始数据列表（来自main.py）
     ground_station_cm_use_plan - 分配方案数组（来自main.py）
     keys_line - 圈次键列表（来自main.py）
+    max_report - 异常明细最多保留条数（None 为全部；计数始终为全量）
 
     返回：
     验证结果字典
@@ -32,76 +136,87 @@ def validate_requirement1(all_data, ground_station_cm_use_plan, keys_line):
     print("【需求1验证】可见弧段任务最小时长限制（≥300秒）")
     print("=" * 70)
 
-    # 构建分配索引：(站点, 天线, 卫星, 圈次, 状态) -> 是否分配
-    allocation_index = {}
-    for idx, alloc in enumerate(ground_station_cm_use_plan):
-        if alloc[0] < 1e9:  # 有效分配
-            sat, laps, status = keys_line[idx].split('-')
-            key = (int(alloc[0]), int(alloc[1]), sat, int(laps), status)
-            allocation_index[key] = True
-
-    # 遍历原始数据，检查时长不足的记录
-    total_records = 0
-    duration_insufficient = 0
-    correctly_rejected = 0
-    anomalies = []
-
+    # 构建分配索引：已分配的 (站点, 天线, 卫星, 圈次, 状态) 各列
+    plan = np.asarray(ground_station_cm_use_plan, dtype=np.float64).reshape(-1, 5)
+    valid = plan[:, 0] < 1e9  # 有效分配
+    allocation_cols = [np.empty(0, dtype=np.int64)] * 5
+    if valid.any():
+        kl = pd.Series(keys_line).str.split('-', n=2, expand=True)
+        allocation_cols = [
+            plan[valid, 0].astype(np.int64),
+            plan[valid, 1].astype(np.int64),
+            kl[0].to_numpy()[valid],
+            kl[1].astype(np.int64).to_numpy()[valid],
+            kl[2].to_numpy()[valid],
+        ]
+
+    # 将所有 (站点, 天线) 的弧段数据统一列名后合并为一张表，一次性完成计算
+    station_names = []
+    frames = []
     for station_idx, folder_data in enumerate(all_data, start=1):
-        folder_name = list(folder_data.keys())[0]
-        data_list = folder_data[folder_name]
+        folder_name = next(iter(folder_data))
+        station_names.append(folder_name)
 
-        for antenna_idx, df in enumerate(data_list, start=1):
-            # 处理列名
-            start_col = next((col for col in ['start(UTC)', 'start'] if col in df.columns), None)
-            stop_col = next((col for col in ['stop(UTC)', 'stop'] if col in df.columns), None)
+        for antenna_idx, df in enumerate(folder_data[folder_name], start=1):
+            # 处理列名（时间、卫星、圈次、状态）
+            start_col, stop_col, sat_col, laps_col, status_col = _detect_columns(tuple(df.columns))
 
             if start_col is None or stop_col is None:
                 continue
 
-            # 计算时长
-            start_times = pd.to_datetime(df[start_col]).astype('int64') // 10 ** 9
-            stop_times = pd.to_datetime(df[stop_col]).astype('int64') // 10 ** 9
-            durations = stop_times - start_times
-
-            # 获取卫星、圈次、状态信息
-            sat_col = 'sat' if 'sat' in df.columns else 'Sat'
-            laps_col = 'laps' if 'laps' in df.columns else 'Laps'
-            status_col = 'Status' if 'Status' in df.columns else 'status'
-
-            for row_idx in range(len(df)):
-                total_records += 1
-                duration = durations.iloc[row_idx]
-
-                if duration < 300:
-                    duration_insufficient += 1
-
-                    # 检查是否被分配
-                    sat = str(df.iloc[row_idx][sat_col])
-                    laps = int(df.iloc[row_idx][laps_col])
-                    status = str(df.iloc[row_idx][status_col])
-
-                    key = (station_idx, antenna_idx, sat, laps, status)
-
-                    if key in allocation_index:
-                        # 异常：时长不足但被分配
-                        anomalies.append({
-                            '站点': folder_name,
-                            '天线': antenna_idx,
-                            '卫星-圈次-状态': f"{sat}-{laps}-{status}",
-                            '可见时长(秒)': int(duration),
-                            '开始时间': datetime.fromtimestamp(start_times.iloc[row_idx]).strftime('%Y-%m-%d %H:%M:%S'),
-                            '结束时间': datetime.fromtimestamp(stop_times.iloc[row_idx]).strftime('%Y-%m-%d %H:%M:%S'),
-                            '问题': '时长不足但仍被分配'
-                        })
-                    else:
-                        correctly_rejected += 1
+            frames.append(pd.DataFrame({
+                'station': station_idx,
+                'antenna': antenna_idx,
+                'sat': df[sat_col].astype(str).to_numpy(),
+                'laps': df[laps_col].to_numpy(dtype=np.int64),
+                'status': df[status_col].astype(str).to_numpy(),
+                'start': df[start_col].to_numpy(),
+                'stop': df[stop_col].to_numpy(),
+            }))
+
+    if frames:
+        big = pd.concat(frames, ignore_index=True)
+
+        # 计算时长
+        start_arr = _to_epoch_seconds(big['start'])
+        stop_arr = _to_epoch_seconds(big['stop'])
+        dur_arr = stop_arr - start_arr
+
+        # 只检查时长不足的行是否被分配
+        bad = np.where(dur_arr < 300)[0]
+        bad_cols = [big[col].to_numpy()[bad] for col in ('station', 'antenna', 'sat', 'laps', 'status')]
+        hit_rows = bad[_keys_isin(bad_cols, allocation_cols)]
+
+        total_records = len(big)
+        duration_insufficient = int(bad.size)
+        anomaly_count = int(hit_rows.size)
+        correctly_rejected = duration_insufficient - anomaly_count
+
+        # 异常：时长不足但被分配，按列一次性构建明细表（只构建需要输出的部分）
+        hit_rows = hit_rows[:max_report]
+        hits = big.iloc[hit_rows]
+        anomalies = pd.DataFrame({
+            '站点': np.array(station_names, dtype=object)[hits['station'].to_numpy() - 1],
+            '天线': hits['antenna'].to_numpy(),
+            '卫星-圈次-状态': (hits['sat'] + '-' + hits['laps'].astype(str) + '-' + hits['status']).to_numpy(),
+            '可见时长(秒)': dur_arr[hit_rows],
+            '开始时间': _format_timestamps(start_arr[hit_rows]),
+            '结束时间': _format_timestamps(stop_arr[hit_rows]),
+            '问题': '时长不足但仍被分配'
+        })
+    else:
+        total_records = 0
+        duration_insufficient = 0
+        correctly_rejected = 0
+        anomaly_count = 0
+        anomalies = pd.DataFrame(columns=['站点', '天线', '卫星-圈次-状态', '可见时长(秒)', '开始时间', '结束时间', '问题'])
 
     # 生成结果
     results = {
         'total_records': total_records,
         'duration_insufficient': duration_insufficient,
         'correctly_rejected': correctly_rejected,
-        'anomaly_count': len(anomalies),
+        'anomaly_count': anomaly_count,
         'anomalies': anomalies,
         'pass_rate': correctly_rejected / duration_insufficient * 100 if duration_insufficient > 0 else 100
     }
@@ -111,28 +226,28 @@ def validate_requirement1(all_data, ground_station_cm_use_plan, keys_line):
     print(f"可见时长不足(<300s)：{duration_insufficient:,} 条 ({duration_insufficient / total_records * 100:.1f}%)")
     print(f"正确拒绝数量：{correctly_rejected:,} 条")
 
-    if len(anomalies) == 0:
+    if anomaly_count == 0:
         print(f"✓ 异常数量：0 条")
         print("\n【验证结论】✓ 完全通过：所有时长不足的弧段都被正确拒绝")
     else:
-        print(f"✗ 异常数量：{len(anomalies):,} 条 ({len(anomalies) / duration_insufficient * 100:.1f}%)")
+        print(f"✗ 异常数量：{anomaly_count:,} 条 ({anomaly_count / duration_insufficient * 100:.1f}%)")
         print(f"\n【验证结论】通过率：{results['pass_rate']:.2f}%")
-        print(f"发现问题：{len(anomalies)}条时长不足的弧段仍被分配了资源")
+        print(f"发现问题：{anomaly_count}条时长不足的弧段仍被分配了资源")
 
         print("\n【异常详情】（显示前10条）：")
-        for i, anomaly in enumerate(anomalies[:10], 1):
+        for i, anomaly in enumerate(anomalies.head(10).to_dict('records'), 1):
             print(f"\n{i}. {anomaly['站点']}-天线{anomaly['天线']:02d}")
             print(f"   {anomaly['卫星-圈次-状态']}")
             print(f"   可见时长：{anomaly['可见时长(秒)']}秒 < 300秒")
             print(f"   时间：{anomaly['开始时间']} ~ {anomaly['结束时间']}")
 
-        if len(anomalies) > 10:
-            print(f"\n   ... 还有 {len(anomalies) - 10} 条异常未显示")
+        if anomaly_count > 10:
+            print(f"\n   ... 还有 {anomaly_count - 10} 条异常未显示")
 
     return results
 
 
-def validate_requirement2(ground_station_cm_use_plan, keys_line, all_data):
+def validate_requirement2(ground_station_cm_use_plan, keys_line, all_data, max_report=None):
     """
     验证需求2: 任务间隔约束时间（同一天线≥300s）
 
@@ -140,6 +255,7 @@ def validate_requirement2(ground_station_cm_use_plan, keys_line, all_data):
     ground_station_cm_use_plan - 分配方案数组（来自main.py）
     keys_line - 圈次键列表（来自main.py）
     all_data - 原始数据列表（用于获取站点名称）
+    max_report - 重叠/冲突明细各自最多保留条数（None 为全部；计数始终为全量）
 
     返回：
     验证结果字典
@@ -149,89 +265,86 @@ def validate_requirement2(ground_station_cm_use_plan, keys_line, all_data):
     print("=" * 70)
 
     # 构建站点名称映射
-    station_names = []
-    for folder_data in all_data:
-        station_names.append(list(folder_data.keys())[0])
-
-    # 提取所有成功分配的任务
-    successful_tasks = []
-    for idx, alloc in enumerate(ground_station_cm_use_plan):
-        if alloc[0] < 100 and alloc[2] < 1e10:  # 有效分配
-            sat, laps, status = keys_line[idx].split('-')
-            successful_tasks.append({
-                'station': int(alloc[0]),
-                'antenna': int(alloc[1]),
-                'sat_laps': f"{sat}-{laps}",
-                'start_time': int(alloc[2]),
-                'end_time': int(alloc[3])
-            })
-
-    print(f"成功分配的任务数：{len(successful_tasks)} 个")
-
-    # 按（站点, 天线）分组
-    antenna_tasks = defaultdict(list)
-    for task in successful_tasks:
-        key = (task['station'], task['antenna'])
-        antenna_tasks[key].append(task)
-
-    print(f"涉及的天线数：{len(antenna_tasks)} 根")
-
-    # 对每根天线的任务按开始时间排序
-    for key in antenna_tasks:
-        antenna_tasks[key].sort(key=lambda x: x['start_time'])
+    station_names = tuple(next(iter(folder_data)) for folder_data in all_data)
+
+    # 提取所有成功分配的任务，存为结构化数组
+    plan = np.asarray(ground_station_cm_use_plan, dtype=np.float64).reshape(-1, 5)
+    valid_idx = np.flatnonzero((plan[:, 0] < 100) & (plan[:, 2] < 1e10))  # 有效分配，先掩码再取数
+
+    tasks = np.empty(valid_idx.size, dtype=[('station', 'i4'), ('antenna', 'i4'),
+                                            ('start', 'i8'), ('end', 'i8'), ('idx', 'i4')])
+    tasks['station'] = plan[valid_idx, 0]
+    tasks['antenna'] = plan[valid_idx, 1]
+    tasks['start'] = plan[valid_idx, 2]
+    tasks['end'] = plan[valid_idx, 3]
+    tasks['idx'] = valid_idx
+
+    print(f"成功分配的任务数：{len(tasks)} 个")
+
+    # 按（站点, 天线, 开始时间）排序，相邻且同天线的两条即为一个任务对
+    tasks = tasks[np.lexsort((tasks['start'], tasks['antenna'], tasks['station']))]
+    new_group = np.ones(len(tasks), dtype=bool)
+    new_group[1:] = (tasks['station'][1:] != tasks['station'][:-1]) | (tasks['antenna'][1:] != tasks['antenna'][:-1])
+    checked_antennas = int(new_group.sum())
+
+    print(f"涉及的天线数：{checked_antennas} 根")
 
     # 检查间隔
-    conflicts = []
-    overlaps = []
-    total_pairs = 0
-    valid_pairs = 0
-
-    for (station, antenna), tasks in antenna_tasks.items():
-        if len(tasks) < 2:
-            continue
-
-        station_name = station_names[station - 1] if station <= len(station_names) else f"站点{station}"
-
-        for i in range(len(tasks) - 1):
-            total_pairs += 1
-            prev_task = tasks[i]
-            next_task = tasks[i + 1]
-
-            interval = next_task['start_time'] - prev_task['end_time']
-
-            if interval < 0:
-                # 时间重叠
-                overlaps.append({
-                    '站点': station_name,
-                    '天线': antenna,
-                    '前任务': prev_task['sat_laps'],
-                    '前任务结束时间': datetime.fromtimestamp(prev_task['end_time']).strftime('%Y-%m-%d %H:%M:%S'),
-                    '后任务': next_task['sat_laps'],
-                    '后任务开始时间': datetime.fromtimestamp(next_task['start_time']).strftime('%Y-%m-%d %H:%M:%S'),
-                    '重叠时长(秒)': abs(interval)
-                })
-            elif interval < 300:
-                # 间隔不足
-                conflicts.append({
-                    '站点': station_name,
-                    '天线': antenna,
-                    '前任务': prev_task['sat_laps'],
-                    '前任务结束时间': datetime.fromtimestamp(prev_task['end_time']).strftime('%Y-%m-%d %H:%M:%S'),
-                    '后任务': next_task['sat_laps'],
-                    '后任务开始时间': datetime.fromtimestamp(next_task['start_time']).strftime('%Y-%m-%d %H:%M:%S'),
-                    '实际间隔(秒)': interval,
-                    '缺少间隔(秒)': 300 - interval
-                })
-            else:
-                valid_pairs += 1
+    same_group = ~new_group[1:]
+    interval = tasks['start'][1:] - tasks['end'][:-1]
+    total_pairs = int(same_group.sum())
+    valid_pairs = int((same_group & (interval >= 300)).sum())
+    flagged = np.where(same_group & (interval < 300))[0]  # 任务对 (flagged, flagged+1)
+
+    # 计数取全量，明细只保留需要输出的部分
+    overlap_pairs = flagged[interval[flagged] < 0]
+    conflict_pairs = flagged[interval[flagged] >= 0]
+    overlap_count = int(overlap_pairs.size)
+    conflict_count = int(conflict_pairs.size)
+    flagged = np.concatenate([overlap_pairs[:max_report], conflict_pairs[:max_report]])
+
+    # 有问题的任务对按列一次性构建明细表
+    prev_tasks = tasks[flagged]
+    next_tasks = tasks[flagged + 1]
+    gaps = interval[flagged]
+
+    # 每个涉及的站点只解析一次名称
+    station_name_map = {
+        station: station_names[station - 1] if 0 < station <= len(station_names) else f"站点{station}"
+        for station in np.unique(prev_tasks['station']).tolist()
+    }
+
+    # 圈次键 "卫星-圈次-状态" 去掉状态，得到 "卫星-圈次"
+    keys_arr = np.asarray(keys_line, dtype=object)
+
+    def sat_laps(task_idx):
+        return pd.Series(keys_arr[task_idx], dtype=object).str.rsplit('-', n=1).str[0].to_numpy()
+
+    pairs = pd.DataFrame({
+        '站点': [station_name_map[station] for station in prev_tasks['station'].tolist()],
+        '天线': prev_tasks['antenna'].astype(np.int64),
+        '前任务': sat_laps(prev_tasks['idx']),
+        '前任务结束时间': _format_timestamps(prev_tasks['end']),
+        '后任务': sat_laps(next_tasks['idx']),
+        '后任务开始时间': _format_timestamps(next_tasks['start']),
+    })
+
+    # 时间重叠
+    is_overlap = gaps < 0
+    overlaps = pairs[is_overlap].assign(**{'重叠时长(秒)': np.abs(gaps[is_overlap])}).reset_index(drop=True)
+    # 间隔不足
+    conflicts = pairs[~is_overlap].assign(**{
+        '实际间隔(秒)': gaps[~is_overlap],
+        '缺少间隔(秒)': 300 - gaps[~is_overlap]
+    }).reset_index(drop=True)
 
     # 生成结果
     results = {
-        'checked_antennas': len(antenna_tasks),
+        'checked_antennas': checked_antennas,
         'total_task_pairs': total_pairs,
         'valid_pairs': valid_pairs,
-        'conflict_count': len(conflicts),
-        'overlap_count': len(overlaps),
+        'conflict_count': conflict_count,
+        'overlap_count': overlap_count,
         'conflicts': conflicts,
         'overlaps': overlaps,
         'pass_rate': valid_pairs / total_pairs * 100 if total_pairs > 0 else 100
@@ -241,48 +354,48 @@ def validate_requirement2(ground_station_cm_use_plan, keys_line, all_data):
     print(f"\n检查的任务对数：{total_pairs:,} 对")
     print(f"符合约束的任务对：{valid_pairs:,} 对 ({results['pass_rate']:.1f}%)")
 
-    if len(overlaps) > 0:
-        print(f"✗✗ 时间重叠：{len(overlaps):,} 对（严重问题！）")
+    if overlap_count > 0:
+        print(f"✗✗ 时间重叠：{overlap_count:,} 对（严重问题！）")
     else:
         print(f"✓ 时间重叠：0 对")
 
-    if len(conflicts) > 0:
-        print(f"✗ 间隔不足：{len(conflicts):,} 对")
+    if conflict_count > 0:
+        print(f"✗ 间隔不足：{conflict_count:,} 对")
     else:
         print(f"✓ 间隔不足：0 对")
 
     # 打印详情
-    if len(overlaps) > 0:
+    if overlap_count > 0:
         print("\n【严重问题：时间重叠详情】（显示前5条）：")
-        for i, overlap in enumerate(overlaps[:5], 1):
+        for i, overlap in enumerate(overlaps.head(5).to_dict('records'), 1):
             print(f"\n{i}. {overlap['站点']}-天线{overlap['天线']:02d}")
             print(f"   前任务：{overlap['前任务']} (结束: {overlap['前任务结束时间']})")
             print(f"   后任务：{overlap['后任务']} (开始: {overlap['后任务开始时间']})")
             print(f"   ✗✗ 时间重叠：{overlap['重叠时长(秒)']}秒")
 
-        if len(overlaps) > 5:
-            print(f"\n   ... 还有 {len(overlaps) - 5} 处重叠未显示")
+        if overlap_count > 5:
+            print(f"\n   ... 还有 {overlap_count - 5} 处重叠未显示")
 
-    if len(conflicts) > 0:
+    if conflict_count > 0:
         print("\n【间隔不足详情】（显示前10条）：")
-        for i, conflict in enumerate(conflicts[:10], 1):
+        for i, conflict in enumerate(conflicts.head(10).to_dict('records'), 1):
             print(f"\n{i}. {conflict['站点']}-天线{conflict['天线']:02d}")
             print(f"   前任务：{conflict['前任务']} (结束: {conflict['前任务结束时间']})")
             print(f"   后任务：{conflict['后任务']} (开始: {conflict['后任务开始时间']})")
             print(f"   ✗ 实际间隔：{conflict['实际间隔(秒)']}秒 < 300秒（缺少{conflict['缺少间隔(秒)']}秒）")
 
-        if len(conflicts) > 10:
-            print(f"\n   ... 还有 {len(conflicts) - 10} 处冲突未显示")
+        if conflict_count > 10:
+            print(f"\n   ... 还有 {conflict_count - 10} 处冲突未显示")
 
     # 验证结论
     print("\n【验证结论】")
-    if len(overlaps) == 0 and len(conflicts) == 0:
+    if overlap_count == 0 and conflict_count == 0:
         print("✓ 完全通过：所有任务间隔都符合300秒约束")
     else:
-        if len(overlaps) > 0:
-            print(f"✗✗ 严重问题：发现{len(overlaps)}处时间重叠")
-        if len(conflicts) > 0:
-            print(f"✗ 发现问题：{len(conflicts)}处间隔不足的情况")
+        if overlap_count > 0:
+            print(f"✗✗ 严重问题：发现{overlap_count}处时间重叠")
+        if conflict_count > 0:
+            print(f"✗ 发现问题：{conflict_count}处间隔不足的情况")
         print(f"通过率：{results['pass_rate']:.2f}%")
 
     return results
@@ -305,25 +418,25 @@ def export_validation_report(req1_results, req2_results, output_dir='./validatio
     print("=" * 70)
 
     # 导出需求1异常详情
-    if req1_results and req1_results['anomalies']:
-        df = pd.DataFrame(req1_results['anomalies'])
+    if req1_results and not req1_results['anomalies'].empty:
+        df = req1_results['anomalies']
         excel_file = os.path.join(output_dir, f'需求1_时长不足异常_{timestamp}.xlsx')
-        df.to_excel(excel_file, index=False, engine='openpyxl')
-        print(f"✓ 需求1异常详情已导出: {excel_file}")
+        saved_file = _export_table(df, excel_file)
+        print(f"✓ 需求1异常详情已导出: {saved_file}")
 
     # 导出需求2冲突详情
     if req2_results:
-        if req2_results['conflicts']:
-            df = pd.DataFrame(req2_results['conflicts'])
+        if not req2_results['conflicts'].empty:
+            df = req2_results['conflicts']
             excel_file = os.path.join(output_dir, f'需求2_间隔不足冲突_{timestamp}.xlsx')
-            df.to_excel(excel_file, index=False, engine='openpyxl')
-            print(f"✓ 需求2间隔不足详情已导出: {excel_file}")
+            saved_file = _export_table(df, excel_file)
+            print(f"✓ 需求2间隔不足详情已导出: {saved_file}")
 
-        if req2_results['overlaps']:
-            df = pd.DataFrame(req2_results['overlaps'])
+        if not req2_results['overlaps'].empty:
+            df = req2_results['overlaps']
             excel_file = os.path.join(output_dir, f'需求2_时间重叠_{timestamp}.xlsx')
-            df.to_excel(excel_file, index=False, engine='openpyxl')
-            print(f"✓ 需求2时间重叠详情已导出: {excel_file}")
+            saved_file = _export_table(df, excel_file)
+            print(f"✓ 需求2时间重叠详情已导出: {saved_file}")
 
     # 导出汇总报告
     summary_file = os.path.join(output_dir, f'验证汇总报告_{timestamp}.txt')
@@ -353,7 +466,7 @@ def export_validation_report(req1_results, req2_results, output_dir='./validatio
     print("=" * 70)
 
 
-def validate_allocation_results(all_data, ground_station_cm_use_plan, keys_line):
+def validate_allocation_results(all_data, ground_station_cm_use_plan, keys_line, export=True):
     """
     验证分配结果的主函数
 
@@ -361,6 +474,7 @@ def validate_allocation_results(all_data, ground_station_cm_use_plan, keys_line)
     all_data - 原始数据列表（来自main.py）
     ground_station_cm_use_plan - 分配方案数组（来自main.py）
     keys_line - 圈次键列表（来自main.py）
+    export - 是否导出报告；不导出时只构建打印所需的前10条明细
 
     使用示例：
     在main.py的最后添加：
@@ -371,14 +485,18 @@ def validate_allocation_results(all_data, ground_station_cm_use_plan, keys_line)
     print("║" + " " * 20 + "开始验证分配结果" + " " * 20 + "║")
     print("╚" + "═" * 68 + "╝")
 
+    # 导出报告需要完整明细，仅打印时最多构建10条
+    max_report = None if export else 10
+
     # 验证需求1
-    req1_results = validate_requirement1(all_data, ground_station_cm_use_plan, keys_line)
+    req1_results = validate_requirement1(all_data, ground_station_cm_use_plan, keys_line, max_report=max_report)
 
     # 验证需求2
-    req2_results = validate_requirement2(ground_station_cm_use_plan, keys_line, all_data)
+    req2_results = validate_requirement2(ground_station_cm_use_plan, keys_line, all_data, max_report=max_report)
 
     # 导出报告
-    export_validation_report(req1_results, req2_results)
+    if export:
+        export_validation_report(req1_results, req2_results)
 
     # 总结
     print("\n" + "╔" + "═" * 68 + "╗")
@@ -399,7 +517,8 @@ def validate_allocation_results(all_data, ground_station_cm_use_plan, keys_line)
             issues.append(f"需求2: {req2_results['conflict_count']}个间隔不足")
 
         print(f"⚠ 发现问题：{', '.join(issues)}")
-        print("\n详细报告已保存到 ./validation_reports/ 目录")
+        if export:
+            print("\n详细报告已保存到 ./validation_reports/ 目录")
 
     print("=" * 70 + "\n")
 
@@ -5,7 +5,7 @@
 ========== 修改说明 v2 - 简化版 ==========
 核心变化：
 1. 不再负责生成 config.py（由 SchedulingService 负责）
-2. 假设 config.py 已经存在于 core/scheduling/
+2. 算法配置由 SchedulingService 以字典传入并在进程内注入（仍兼容读取 core/scheduling/config.py）
 3. 简化 sys.path 控制（仍需要，但逻辑更清晰）
 4. 移除 _setup_environment() 方法
 """
@@ -14,21 +14,66 @@ import sys
 import configparser
 import logging
 import importlib
+import shutil
+import threading
+import types
+from collections import OrderedDict
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# config.ini 解析结果缓存（LRU）：(真实路径, mtime_ns) -> (config.ini 中的 ROOT_FOLDER 或 None, qv_config)
+# 按真实路径缓存，共用同一份缓存数据集（任务目录为符号链接）的任务可以命中
+_CONFIG_CACHE = OrderedDict()
+_CONFIG_CACHE_MAXSIZE = 32
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# 统计信息字段及算法结果中缺失该字段时的默认值
+_STATISTICS_DEFAULTS = types.MappingProxyType({
+    'success_rate_all': 0.0,
+    'success_rate_filtered': 0.0,
+    'climb_success_rate': 0.0,
+    'operation_success_rate': 0.0,
+    'total_tasks': 0,
+    'successful_tasks': 0,
+    'load_std': 0.0,
+})
+
+# 算法未返回字典时使用的统计信息（只读，使用时复制）
+_FALLBACK_STATISTICS = types.MappingProxyType({
+    'success_rate_all': 0.85,
+    'success_rate_filtered': 0.90,
+    'climb_success_rate': 0.88,
+    'operation_success_rate': 0.87,
+    'total_tasks': 0,
+    'successful_tasks': 0,
+    'load_std': 0.15,
+})
+
 
 class SchedulingAlgorithm:
     """
     调度算法封装类 - 仅QV频段（简化版）
     负责调用底层算法模块执行实际的调度计算
 
-    前提条件：
-    - core/scheduling/config.py 已由 SchedulingService 生成
+    算法配置来源（二选一）：
+    - 传入 algorithm_config 字典：在进程内注入为 core.scheduling.config 模块，不落盘
+    - 未传入时沿用旧方式：读取 core/scheduling/config.py
     """
 
-    def __init__(self, dataset_dir, output_dir, time_window):
+    # 已加载的算法配置版本（注入配置为其内容，config.py 为 (mtime_ns, size)），进程内所有实例共享
+    _loaded_config_version = None
+
+    # 算法模块通过模块级常量读取配置，同一进程内的调度必须串行执行
+    _run_lock = threading.Lock()
+
+    # 已解析的 (config 模块, 算法入口 main 函数)，首次调用后复用
+    _scheduling_entry = None
+
+    # config 变化时需要按依赖顺序重载的模块（algorithm/main 在导入时绑定了 config 常量）
+    _RELOAD_MODULES = ('core.scheduling.config', 'algorithm', 'main')
+
+    def __init__(self, dataset_dir, output_dir, time_window, algorithm_config=None):
         """
         初始化调度算法
 
@@ -36,10 +81,14 @@ class SchedulingAlgorithm:
             dataset_dir: 数据集目录 (包含config.ini和QV/目录)
             output_dir: 输出目录
             time_window: 最小观测时间窗口(秒)
+            algorithm_config: 算法配置字典（ROOT_FOLDER、METHOD 等），为 None 时读取 config.py
         """
         self.dataset_dir = dataset_dir
         self.output_dir = output_dir
         self.time_window = time_window
+        self.algorithm_config = dict(algorithm_config) if algorithm_config is not None else None
+        # 算法在内存中返回的分配结果 {工作表名: DataFrame}，run() 后可用（未返回时为 None）
+        self.answer_sheets = None
 
         # 读取配置文件（用于验证路径）
         self.config_path = os.path.join(dataset_dir, 'config.ini')
@@ -50,32 +99,48 @@ class SchedulingAlgorithm:
 
         logger.info("=" * 60)
         logger.info("调度算法初始化 (仅QV频段 - 简化版)")
-        logger.info(f"  数据集目录: {dataset_dir}")
-        logger.info(f"  输出目录: {output_dir}")
-        logger.info(f"  时间窗口: {time_window}秒")
+        logger.info("  数据集目录: %s", dataset_dir)
+        logger.info("  输出目录: %s", output_dir)
+        logger.info("  时间窗口: %s秒", time_window)
         logger.info("=" * 60)
 
     def _load_config(self):
-        """从config.ini读取配置（仅用于验证）"""
-        if not os.path.exists(self.config_path):
-            raise FileNotFoundError(f"配置文件不存在: {self.config_path}")
-
-        config = configparser.ConfigParser()
-        config.read(self.config_path, encoding='utf-8')
-
-        # 读取ROOT_FOLDER（这是动态生成的数据集路径）
-        self.root_folder = config.get('DEFAULT', 'ROOT_FOLDER', fallback=None)
-        if not self.root_folder:
-            # 如果config中没有，使用默认路径
-            self.root_folder = os.path.join(self.dataset_dir, 'QV')
-
-        # 读取QV站点配置
-        if 'QV' in config:
-            self.qv_config = dict(config['QV'])
+        """从config.ini读取配置（仅用于验证），按 (路径, mtime) 缓存解析结果"""
+        # 一次 stat 同时判断是否存在并取得 mtime
+        try:
+            config_mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"配置文件不存在: {self.config_path}") from None
+
+        cache_key = (os.path.realpath(self.config_path), config_mtime_ns)
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                _CONFIG_CACHE.move_to_end(cache_key)
+
+        if cached is None:
+            config = configparser.ConfigParser()
+            config.read(self.config_path, encoding='utf-8')
+
+            # 读取QV站点配置
+            if 'QV' not in config:
+                raise ValueError("config.ini中缺少QV频段配置")
+
+            # 读取ROOT_FOLDER（这是动态生成的数据集路径）
+            cached = (config.get('DEFAULT', 'ROOT_FOLDER', fallback=None), dict(config['QV']))
+            with _CONFIG_CACHE_LOCK:
+                _CONFIG_CACHE[cache_key] = cached
+                if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAXSIZE:
+                    _CONFIG_CACHE.popitem(last=False)
+            source = ""
         else:
-            raise ValueError("config.ini中缺少QV频段配置")
+            source = "(缓存)"
 
-        logger.info(f"✓ 读取配置完成: ROOT_FOLDER={self.root_folder}")
+        # 如果config中没有，使用本任务的默认路径（不缓存，各任务的 dataset_dir 不同）
+        self.root_folder = cached[0] or os.path.join(self.dataset_dir, 'QV')
+        self.qv_config = dict(cached[1])
+
+        logger.info("✓ 读取配置完成%s: ROOT_FOLDER=%s", source, self.root_folder)
 
     def run(self):
         """
@@ -88,8 +153,9 @@ class SchedulingAlgorithm:
         """
         logger.info("开始执行调度算法...")
 
-        # ========== 检查 config.py 是否存在 ==========
-        self._verify_algorithm_config()
+        # ========== 未传入配置时，检查 config.py 是否存在 ==========
+        if self.algorithm_config is None:
+            self._verify_algorithm_config()
 
         # ========== 管理 sys.path 并导入算法 ==========
         scheduling_module_path = os.path.abspath(os.path.join(
@@ -97,6 +163,8 @@ class SchedulingAlgorithm:
             'scheduling'
         ))
 
+        self._run_lock.acquire()
+
         # 保存原始 sys.path
         original_sys_path = sys.path.copy()
 
@@ -104,20 +172,49 @@ class SchedulingAlgorithm:
             # 临时将 scheduling/ 目录插入到 sys.path 最前面
             if scheduling_module_path not in sys.path:
                 sys.path.insert(0, scheduling_module_path)
-                logger.info(f"✓ 已将算法模块路径添加到 sys.path[0]: {scheduling_module_path}")
+                logger.info("✓ 已将算法模块路径添加到 sys.path[0]: %s", scheduling_module_path)
 
-            # 导入算法模块
-            try:
-                import config
-                import main as scheduling_main
-            except ImportError:
-                # 如果第一次导入失败，尝试直接 import（应对首次运行）
-                import config
-                import main as scheduling_main
+            if self.algorithm_config is not None:
+                # 注入的配置模块没有源文件，只需重载绑定了配置常量的算法模块
+                config_version = ('injected', tuple(sorted(self.algorithm_config.items())))
+                reload_modules = ('algorithm', 'main')
+                self._install_config_module(self.algorithm_config)
+            else:
+                config_stat = os.stat(os.path.join(scheduling_module_path, 'config.py'))
+                config_version = (config_stat.st_mtime_ns, config_stat.st_size)
+                reload_modules = self._RELOAD_MODULES
+                # 之前注入过配置模块时先移除，使其重新从 config.py 导入
+                config_module = sys.modules.get('core.scheduling.config')
+                if config_module is not None and config_module.__spec__ is None:
+                    del sys.modules['core.scheduling.config']
+
+            # 1. 首次调用时导入算法模块并缓存入口，之后直接复用
+            if SchedulingAlgorithm._scheduling_entry is None:
+                first_import = 'main' not in sys.modules
+                # 顶层 config 是 Flask 配置模块，算法配置始终按完整包名导入
+                scheduling_config = importlib.import_module('core.scheduling.config')
+                try:
+                    import main as scheduling_main
+                except ImportError:
+                    # 如果第一次导入失败，尝试直接 import（应对首次运行）
+                    import main as scheduling_main
+
+                SchedulingAlgorithm._scheduling_entry = (scheduling_config, scheduling_main.main)
+                if first_import:
+                    SchedulingAlgorithm._loaded_config_version = config_version
+
+            # 2. 仅当算法配置变化时才重载，避免每次调用都重新执行整个算法模块
+            if config_version != SchedulingAlgorithm._loaded_config_version:
+                for module_name in reload_modules:
+                    if module_name in sys.modules:
+                        importlib.reload(sys.modules[module_name])
+                SchedulingAlgorithm._scheduling_entry = (importlib.import_module('core.scheduling.config'), sys.modules['main'].main)
+                SchedulingAlgorithm._loaded_config_version = config_version
+                logger.info("✓ 算法配置已变化，算法模块已重载")
+            else:
+                logger.info("✓ 算法配置未变化，复用已加载的算法模块")
 
-            # 2. 强制重载, 确保读取磁盘上最新的 config.py
-            importlib.reload(config)
-            importlib.reload(scheduling_main)
+            config, run_scheduling = SchedulingAlgorithm._scheduling_entry
 
             # 输出当前使用的算法配置
             current_method = getattr(config, 'METHOD', '未知')
@@ -136,32 +233,38 @@ class SchedulingAlgorithm:
             print("="*50 + "\n")
             
             # 同时记录到日志
-            logger.info(f"最终确认算法策略: {strategy_name} (METHOD={current_method})")
+            logger.info("最终确认算法策略: %s (METHOD=%s)", strategy_name, current_method)
             
-            logger.info(f"!!! 已强制重载算法配置: METHOD={config.METHOD} (策略切换生效检查)")
+            logger.info("!!! 当前算法配置: METHOD=%s (策略切换生效检查)", config.METHOD)
 
             # ========== 执行调度算法 ==========
             logger.info("调用底层调度算法...")
-            result = scheduling_main.main()
+            result = run_scheduling()
             logger.info("✓ 调度算法执行完成")
 
         except ImportError as e:
-            logger.error(f"✗ 无法导入底层算法模块: {e}")
-            logger.error(f"  当前 sys.path[0]: {sys.path[0]}")
-            logger.error(f"  算法目录: {scheduling_module_path}")
+            logger.error("✗ 无法导入底层算法模块: %s", e)
+            logger.error("  当前 sys.path[0]: %s", sys.path[0])
+            logger.error("  算法目录: %s", scheduling_module_path)
             raise ImportError(
                 f"底层调度算法模块导入失败: {e}\n"
                 "请确保已将算法文件放置在 core/scheduling/ 目录下"
             ) from e
 
         except Exception as e:
-            logger.error(f"✗ 调度算法执行失败: {e}", exc_info=True)
+            logger.error("✗ 调度算法执行失败: %s", e, exc_info=True)
             raise
 
         finally:
             # ========== 恢复 sys.path ==========
             sys.path = original_sys_path
             logger.info("✓ sys.path 已恢复")
+            self._run_lock.release()
+
+        # 分配结果已在内存中返回时单独取出，剩余部分才是统计信息
+        if isinstance(result, dict):
+            self.answer_sheets = result.pop('answer_sheets', None)
+            result = result or None
 
         # 查找生成的Excel文件
         excel_path = self._find_output_excel()
@@ -169,11 +272,26 @@ class SchedulingAlgorithm:
         # 构建统计信息
         statistics = self._build_statistics(result)
 
-        logger.info(f"✓ Excel结果文件: {excel_path}")
-        logger.info(f"✓ 成功率: {statistics.get('success_rate_all', 0):.2%}")
+        logger.info("✓ Excel结果文件: %s", excel_path)
+        logger.info("✓ 成功率: %.2f%%", statistics.get('success_rate_all', 0) * 100)
 
         return excel_path, statistics
 
+    @staticmethod
+    def _install_config_module(algorithm_config):
+        """
+        将算法配置字典注入为 core.scheduling.config 模块
+
+        algorithm.py / main.py 通过 `from core.scheduling.config import ...` 读取配置，
+        import 时会直接命中 sys.modules 中的注入模块，无需生成 config.py 文件。
+        """
+        config_module = types.ModuleType('core.scheduling.config')
+        config_module.__dict__.update(algorithm_config)
+
+        # 只注入完整包名，顶层 config 属于 Flask 配置，不能被覆盖
+        sys.modules['core.scheduling.config'] = config_module
+        setattr(importlib.import_module('core.scheduling'), 'config', config_module)
+
     def _verify_algorithm_config(self):
         """
         验证算法配置文件是否存在
@@ -196,10 +314,10 @@ class SchedulingAlgorithm:
                 "  3. 文件生成路径错误\n"
                 "解决方案: 检查 SchedulingService.execute() 日志，确认步骤1.5是否执行"
             )
-            logger.error(f"✗ {error_msg}")
+            logger.error("✗ %s", error_msg)
             raise FileNotFoundError(error_msg)
 
-        logger.info(f"✓ 算法配置文件已存在: {config_path}")
+        logger.info("✓ 算法配置文件已存在: %s", config_path)
 
         # 可选：验证配置文件内容
         try:
@@ -213,6 +331,7 @@ class SchedulingAlgorithm:
                 'ANSWER_TYPE',
                 'USE_SA',
                 'SA_MAX_TIME',
+                'SA_NUM_CHAINS',
                 'INTRA_STATION_BALANCE',
                 'ANTENNA_LOAD_METHOD',
                 'LOAD_WEIGHT_TASK',
@@ -222,12 +341,12 @@ class SchedulingAlgorithm:
             missing_vars = [var for var in required_vars if var not in content]
 
             if missing_vars:
-                logger.warning(f"⚠ 配置文件缺少变量: {', '.join(missing_vars)}")
+                logger.warning("⚠ 配置文件缺少变量: %s", ', '.join(missing_vars))
             else:
-                logger.info(f"✓ 配置文件包含所有必需变量")
+                logger.info("✓ 配置文件包含所有必需变量")
 
         except Exception as e:
-            logger.warning(f"⚠ 验证配置文件内容失败: {e}")
+            logger.warning("⚠ 验证配置文件内容失败: %s", e)
 
     def _find_output_excel(self):
         """
@@ -236,40 +355,49 @@ class SchedulingAlgorithm:
         Returns:
             str: Excel文件路径
         """
-        # 在输出目录查找Excel文件
-        output_files = [
-            f for f in os.listdir(self.output_dir)
-            if f.endswith('.xlsx') and 'answer_output' in f
-        ]
+        # 在输出目录查找Excel文件（文件名带时间戳，按名称取最大即为最新）
+        output_name = self._newest_answer_output(self.output_dir)
 
-        if not output_files:
+        if output_name is None:
             # 如果output_dir中没有，尝试在当前目录的output子目录查找
             alt_output_dir = os.path.join(os.getcwd(), 'output')
             if os.path.exists(alt_output_dir):
-                output_files = [
-                    f for f in os.listdir(alt_output_dir)
-                    if f.endswith('.xlsx') and 'answer_output' in f
-                ]
-                if output_files:
+                output_name = self._newest_answer_output(alt_output_dir)
+                if output_name is not None:
                     # 找到了，移动到正确的输出目录
-                    src_path = os.path.join(alt_output_dir, output_files[0])
-                    dst_path = os.path.join(self.output_dir, output_files[0])
-                    import shutil
-                    shutil.move(src_path, dst_path)
-                    logger.info(f"✓ Excel文件已移动到输出目录: {dst_path}")
+                    src_path = os.path.join(alt_output_dir, output_name)
+                    dst_path = os.path.join(self.output_dir, output_name)
+                    try:
+                        # 同一文件系统下直接重命名（单次系统调用）
+                        os.replace(src_path, dst_path)
+                    except OSError:
+                        # 跨文件系统时退回复制+删除
+                        shutil.move(src_path, dst_path)
+                    logger.info("✓ Excel文件已移动到输出目录: %s", dst_path)
                     return dst_path
 
-        if not output_files:
+        if output_name is None:
             raise FileNotFoundError(
                 f"未找到生成的Excel结果文件 (搜索目录: {self.output_dir})"
             )
 
-        # 如果有多个文件，选择最新的
-        output_files.sort(reverse=True)
-        excel_path = os.path.join(self.output_dir, output_files[0])
+        excel_path = os.path.join(self.output_dir, output_name)
 
         return excel_path
 
+    @staticmethod
+    def _newest_answer_output(directory):
+        """
+        单次遍历目录，返回最新的算法结果Excel文件名（answer_output_*.xlsx），没有时返回 None
+        """
+        with os.scandir(directory) as entries:
+            return max(
+                (entry.name for entry in entries
+                 if entry.name.startswith('answer_output') and entry.name.endswith('.xlsx')
+                 and entry.is_file()),
+                default=None
+            )
+
     def _build_statistics(self, result):
         """
         构建统计信息
@@ -280,20 +408,16 @@ class SchedulingAlgorithm:
         Returns:
             dict: 统计信息
         """
-        # 从result中提取统计信息
-        statistics = {
-            'success_rate_all': result.get('success_rate_all', 0.0) if isinstance(result, dict) else 0.85,
-            'success_rate_filtered': result.get('success_rate_filtered', 0.0) if isinstance(result, dict) else 0.90,
-            'climb_success_rate': result.get('climb_success_rate', 0.0) if isinstance(result, dict) else 0.88,
-            'operation_success_rate': result.get('operation_success_rate', 0.0) if isinstance(result, dict) else 0.87,
-            'total_tasks': result.get('total_tasks', 0) if isinstance(result, dict) else 0,
-            'successful_tasks': result.get('successful_tasks', 0) if isinstance(result, dict) else 0,
-            'load_std': result.get('load_std', 0.0) if isinstance(result, dict) else 0.15,
-            'validation': {
-                'no_overflow': True,
-                'no_overlap': True,
-                'message': '验证通过'
-            }
+        # 从result中提取统计信息（类型判断只做一次）
+        if isinstance(result, dict):
+            statistics = {key: result.get(key, default) for key, default in _STATISTICS_DEFAULTS.items()}
+        else:
+            statistics = dict(_FALLBACK_STATISTICS)
+
+        statistics['validation'] = {
+            'no_overflow': True,
+            'no_overlap': True,
+            'message': '验证通过'
         }
 
         return statistics
\ No newline at end of file
@@ -3,12 +3,21 @@
 包含通用的辅助函数
 """
 import os
-import shutil
+import sys
+import time
 import logging
-from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# 待删除的任务工作目录前缀（清理时先重命名再后台删除）
+TRASH_DIR_PREFIX = '.trash_'
+
+# 缓存根目录名（位于 TEMP_DATA_DIR 下），以及其中按类型划分的共享子目录
+CACHE_DIR_NAME = '_cache'
+_CACHE_SUBDIRS = ('datasets', 'charts')
+
 
 def ensure_dir(directory):
     """
@@ -20,39 +29,261 @@ def ensure_dir(directory):
     os.makedirs(directory, exist_ok=True)
 
 
-def cleanup_old_tasks(temp_dir, keep_days=7):
+def _rmtree_onexc(func, path, exc):
+    """rmtree 出错时的处理：只读文件（Windows 常见）去掉只读属性后重试一次，其余错误照常抛出"""
+    import stat
+
+    if not isinstance(exc, PermissionError):
+        raise exc
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _rmtree_onerror(func, path, exc_info):
+    """Python 3.12 之前 rmtree 的 onerror 回调，参数为 exc_info 三元组"""
+    _rmtree_onexc(func, path, exc_info[1])
+
+
+def remove_tree(path):
+    """
+    删除目录树，遇到只读文件时去掉只读属性后重试
+
+    Args:
+        path: 目录路径
+    """
+    import shutil
+
+    # onerror 自 3.12 起弃用，改用接收异常实例的 onexc
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_rmtree_onexc)
+    else:
+        shutil.rmtree(path, onerror=_rmtree_onerror)
+
+
+def _remove_task_dir(task_path):
+    """删除单个任务目录，返回异常（成功时为 None）"""
+    try:
+        remove_tree(task_path)
+        return None
+    except Exception as e:
+        return e
+
+
+def cleanup_old_tasks(temp_dir, keep_days=7, max_workers=8):
     """
     清理旧的任务临时文件
     
     Args:
         temp_dir: 临时目录路径
         keep_days: 保留天数
+        max_workers: 并行删除的线程数（删除以系统调用等待为主，多线程可重叠 I/O）
+
+    缓存目录 _cache 不按任务清理：其中的共享数据集目录被运行中任务的 dataset 符号链接引用，
+    整体删除会使这些任务失效，缓存条目由 prune_cache_entries 单独按条目清理。
     """
     if not os.path.exists(temp_dir):
         return
     
-    cutoff_time = datetime.now() - timedelta(days=keep_days)
+    cutoff_ts = time.time() - keep_days * 86400
     cleaned_count = 0
     
-    for task_dir in os.listdir(temp_dir):
-        task_path = os.path.join(temp_dir, task_dir)
-        
-        if not os.path.isdir(task_path):
-            continue
-        
-        # 获取目录修改时间
-        mtime = datetime.fromtimestamp(os.path.getmtime(task_path))
-        
-        if mtime < cutoff_time:
-            try:
-                shutil.rmtree(task_path)
+    # scandir 一次遍历即可拿到类型与 stat 信息，直接比较原始 mtime
+    with os.scandir(temp_dir) as entries:
+        expired = [
+            entry for entry in entries
+            if entry.name != CACHE_DIR_NAME
+            and entry.is_dir(follow_symlinks=False)
+            and entry.stat(follow_symlinks=False).st_mtime < cutoff_ts
+        ]
+    
+    if not expired:
+        return
+    
+    # 清理不在请求路径上，相关模块延迟到此处导入以缩短启动时间
+    from concurrent.futures import ThreadPoolExecutor
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(expired))) as executor:
+        errors = executor.map(_remove_task_dir, [entry.path for entry in expired])
+        for entry, error in zip(expired, errors):
+            if error is None:
                 cleaned_count += 1
-                logger.info(f"已清理过期任务: {task_dir}")
-            except Exception as e:
-                logger.warning(f"清理失败: {task_dir} - {str(e)}")
+                logger.info("已清理过期任务: %s", entry.name)
+            else:
+                logger.warning("清理失败: %s - %s", entry.name, error)
     
     if cleaned_count > 0:
-        logger.info(f"清理完成，共删除 {cleaned_count} 个过期任务")
+        logger.info("清理完成，共删除 %d 个过期任务", cleaned_count)
+
+
+def scan_dataset_files(root_dir):
+    """
+    遍历一次目录树，列出所有文件（供统计、压缩等多个步骤共享，避免重复遍历）
+
+    Args:
+        root_dir: 根目录
+
+    Returns:
+        list: [(绝对路径, 相对路径), ...]，相对路径使用 '/' 分隔
+    """
+    listing = []
+    # scandir 直接给出条目类型，无需对每个条目单独 stat；相对路径随遍历拼接
+    stack = [(root_dir, '')]
+    while stack:
+        directory, prefix = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                arcname = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, arcname + '/'))
+                elif entry.is_file():
+                    listing.append((entry.path, arcname))
+    return listing
+
+
+def load_csv_tree(root_dir):
+    """
+    读取目录树下的所有 CSV 文件（供多个图表生成步骤共享，避免重复解析）
+
+    Args:
+        root_dir: 根目录
+
+    Returns:
+        dict: {规范化文件路径: DataFrame}，读取失败的文件不包含在内
+    """
+    import pandas as pd
+
+    frames = {}
+    for root, dirs, files in os.walk(root_dir):
+        for name in files:
+            if not name.endswith('.csv'):
+                continue
+            path = os.path.join(root, name)
+            try:
+                frames[os.path.normpath(path)] = pd.read_csv(path)
+            except Exception as e:
+                logger.warning("读取CSV失败: %s - %s", path, e)
+    return frames
+
+
+def remove_trash_dirs(temp_dir):
+    """
+    在后台线程中删除遗留的 .trash_* 目录（进程在后台删除完成前退出时会留下）
+
+    Args:
+        temp_dir: 临时目录路径
+    """
+    if not os.path.isdir(temp_dir):
+        return
+
+    with os.scandir(temp_dir) as entries:
+        leftovers = [
+            entry.path for entry in entries
+            if entry.name.startswith(TRASH_DIR_PREFIX) and entry.is_dir(follow_symlinks=False)
+        ]
+
+    if not leftovers:
+        return
+
+    import threading
+
+    def _worker():
+        for path in leftovers:
+            error = _remove_task_dir(path)
+            if error is not None:
+                logger.warning("清理遗留目录失败: %s - %s", path, error)
+
+    threading.Thread(target=_worker, name='remove-trash-dirs', daemon=True).start()
+
+
+def prune_cache_entries(cache_dir, keep_days, skip=()):
+    """
+    按每个缓存条目（文件或目录）自身的 mtime 删除过期条目
+
+    Args:
+        cache_dir: 缓存目录路径
+        keep_days: 保留天数
+        skip: 不参与清理的条目名
+
+    Returns:
+        int: 删除的条目数
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    cutoff_ts = time.time() - keep_days * 86400
+    with os.scandir(cache_dir) as entries:
+        expired = [
+            entry for entry in entries
+            if entry.name not in skip
+            and entry.stat(follow_symlinks=False).st_mtime < cutoff_ts
+        ]
+
+    removed_count = 0
+    for entry in expired:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                remove_tree(entry.path)
+            else:
+                os.remove(entry.path)
+            removed_count += 1
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("清理缓存失败: %s - %s", entry.path, e)
+    return removed_count
+
+
+def start_cache_pruning(temp_dir, keep_days, interval=3600):
+    """
+    启动后台线程，按 keep_days 定期清理 TEMP_DATA_DIR/_cache 下的过期结果缓存、数据集缓存和图表缓存
+
+    数据集缓存每次被链接时都会刷新 mtime，引用它的任务目录按同样的保留期清理，
+    因此仍被任务链接的数据集不会被删除。
+
+    Args:
+        temp_dir: 临时目录路径
+        keep_days: 保留天数
+        interval: 两次清理之间的间隔（秒）
+    """
+    import threading
+
+    cache_dir = os.path.join(temp_dir, CACHE_DIR_NAME)
+
+    def _worker():
+        while True:
+            removed_count = prune_cache_entries(cache_dir, keep_days, skip=_CACHE_SUBDIRS)
+            for subdir in _CACHE_SUBDIRS:
+                removed_count += prune_cache_entries(os.path.join(cache_dir, subdir), keep_days)
+            if removed_count > 0:
+                logger.info("缓存清理完成，共删除 %d 个过期条目", removed_count)
+            time.sleep(interval)
+
+    threading.Thread(target=_worker, name='prune-cache', daemon=True).start()
+
+
+def warm_up_image_export(image_format='jpeg'):
+    """
+    在后台线程中预先启动 kaleido 图片导出进程
+
+    kaleido 首次导出图片时需要启动渲染进程，之后在进程内复用；
+    启动时预热一次，避免由第一个请求承担这部分开销
+
+    Args:
+        image_format: 预热时导出的图片格式（与 IMAGE_FORMAT 一致）
+    """
+    import threading
+
+    def _worker():
+        try:
+            import plotly.graph_objects as go
+            import plotly.io as pio
+
+            pio.to_image(go.Figure(), format=image_format, width=16, height=16, engine='kaleido')
+            logger.info("图片导出引擎预热完成")
+        except Exception as e:
+            logger.warning("图片导出引擎预热失败: %s", e)
+
+    threading.Thread(target=_worker, name='warm-up-image-export', daemon=True).start()
 
 
 def format_duration(seconds):
@@ -89,10 +320,9 @@ def get_file_size(filepath):
         return "0B"
     
     size = os.path.getsize(filepath)
+    if size == 0:
+        return "0.0B"
     
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size < 1024.0:
-            return f"{size:.1f}{unit}"
-        size /= 1024.0
-    
-    return f"{size:.1f}TB"
+    # 1024 的幂次即二进制位数每 10 位一级
+    idx = min((size.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size / (1 << (idx * 10)):.1f}{_SIZE_UNITS[idx]}"
@@ -4,9 +4,13 @@
 """
 import requests
 import json
+import sys
 import time
 from datetime import datetime
 
+# 复用同一连接池（健康检查与调度请求共用 TCP 连接）
+SESSION = requests.Session()
+
 
 # ============================================================
 # 写死的测试参数（模拟前端发送的数据）
@@ -60,8 +64,12 @@ def main():
     BASE_URL = "http://localhost:5000"
     API_URL = f"{BASE_URL}/api/simulations"
 
+    # 测试开始时间只取一次，显示时间与结果文件名共用
+    started_at = datetime.now()
+    timestamp = started_at.strftime('%Y%m%d_%H%M%S')
+
     print_section("卫星资源调度系统 - 简化版测试")
-    print(f"测试时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"测试时间: {started_at.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"后端地址: {BASE_URL}")
 
     # ========================================
@@ -71,7 +79,7 @@ def main():
 
     try:
         print("正在连接服务器...")
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/health", timeout=5)
 
         if response.status_code == 200:
             print("✓ 服务器连接成功")
@@ -116,7 +124,7 @@ def main():
     start_time = time.time()
 
     try:
-        response = requests.post(
+        response = SESSION.post(
             API_URL,
             json=TEST_PARAMS,
             headers={'Content-Type': 'application/json'},
@@ -179,7 +187,9 @@ def main():
     print("=" * 80)
     print("以下是后端返回给前端的完整JSON数据:")
     print("=" * 80)
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    # 直接流式写到 stdout，避免为大响应（含图表HTML）先构建完整字符串
+    json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write('\n')
     print("=" * 80)
 
     # ========================================
@@ -260,8 +270,6 @@ def main():
     # ========================================
     print_section("步骤8: 保存结果到文件")
 
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
     # 保存完整JSON
     full_json_file = f"test_result_{timestamp}_full.json"
     save_json_to_file(result, full_json_file)
@@ -274,15 +282,15 @@ def main():
     # 保存甘特图HTML
     if charts.get('gantt_chart_html'):
         gantt_file = f"test_result_{timestamp}_gantt.html"
-        with open(gantt_file, 'w', encoding='utf-8') as f:
-            f.write(charts['gantt_chart_html'])
+        with open(gantt_file, 'wb') as f:
+            f.write(charts['gantt_chart_html'].encode('utf-8'))
         print(f"✓ 甘特图HTML已保存到: {gantt_file}")
 
     # 保存满足度图HTML
     if charts.get('satisfaction_chart_html'):
         satisfaction_file = f"test_result_{timestamp}_satisfaction.html"
-        with open(satisfaction_file, 'w', encoding='utf-8') as f:
-            f.write(charts['satisfaction_chart_html'])
+        with open(satisfaction_file, 'wb') as f:
+            f.write(charts['satisfaction_chart_html'].encode('utf-8'))
         print(f"✓ 满足度图HTML已保存到: {satisfaction_file}")
 
     # ========================================
@@ -6,9 +6,10 @@
 """
 import sys
 import os
-import subprocess
-import json
-from pathlib import Path
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # 颜色代码
 GREEN = '\033[92m'
@@ -17,32 +18,104 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# 分隔线（预先拼好颜色，标题/横幅直接复用）
+_RULE = '=' * 70
+_STARS = '*' * 70
+_BLUE_RULE = f"{BLUE}{_RULE}{RESET}"
+_GREEN_RULE = f"{GREEN}{_RULE}{RESET}"
+_RED_RULE = f"{RED}{_RULE}{RESET}"
+_BLUE_STARS = f"{BLUE}{_STARS}{RESET}"
+
+
+@lru_cache(maxsize=None)
+def _is_installed(package):
+    """检查包是否已安装（只查找模块规格，不执行包的初始化代码），结果按包名缓存"""
+    try:
+        return importlib.util.find_spec(package.replace('-', '_')) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=4)
+def _get_app(env):
+    """按环境名缓存 Flask 应用实例（配置变化后需调用 _get_app.cache_clear()）"""
+    from app import create_app
+    return create_app(env)
+
+
+def _existing_paths(paths):
+    """
+    批量检查路径是否存在：按父目录分组，每个目录只列举一次
+
+    Returns:
+        set: 存在的路径集合
+    """
+    by_parent = {}
+    for path in paths:
+        parent, name = os.path.split(path)
+        by_parent.setdefault(parent or '.', []).append((path, name))
+
+    existing = set()
+    for parent, items in by_parent.items():
+        try:
+            names = set(os.listdir(parent))
+        except OSError:
+            continue
+        existing.update(path for path, name in items if name in names)
+    return existing
+
 
 class ProjectTester:
-    def __init__(self):
+    def __init__(self, create_missing=False):
+        """
+        Args:
+            create_missing: 是否自动创建缺失的目录（默认只检查，不修改项目结构）
+        """
+        self.create_missing = create_missing
         self.passed = 0
         self.failed = 0
         self.warnings = 0
+        # 并行执行时：计数器加锁，输出先写入各线程自己的缓冲区
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _emit(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            print(text)
+        else:
+            buffer.append(text)
+
+    def _count(self, attr):
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
 
     def print_header(self, text):
-        print(f"\n{BLUE}{'=' * 70}{RESET}")
-        print(f"{BLUE}{text:^70}{RESET}")
-        print(f"{BLUE}{'=' * 70}{RESET}\n")
+        self._emit(f"\n{_BLUE_RULE}\n{BLUE}{text:^70}{RESET}\n{_BLUE_RULE}\n")
 
     def print_success(self, text):
-        print(f"{GREEN}✓{RESET} {text}")
-        self.passed += 1
+        self._emit(f"{GREEN}✓{RESET} {text}")
+        self._count('passed')
 
     def print_failure(self, text):
-        print(f"{RED}✗{RESET} {text}")
-        self.failed += 1
+        self._emit(f"{RED}✗{RESET} {text}")
+        self._count('failed')
 
     def print_warning(self, text):
-        print(f"{YELLOW}⚠{RESET} {text}")
-        self.warnings += 1
+        self._emit(f"{YELLOW}⚠{RESET} {text}")
+        self._count('warnings')
 
     def print_info(self, text):
-        print(f"  {text}")
+        self._emit(f"  {text}")
+
+    def _run_captured(self, test):
+        """在工作线程中执行单个测试，返回其输出行"""
+        self._local.buffer = []
+        try:
+            test()
+            return self._local.buffer
+        finally:
+            self._local.buffer = None
 
     def test_python_version(self):
         """测试Python版本"""
@@ -69,10 +142,9 @@ class ProjectTester:
         ]
 
         for package in required_packages:
-            try:
-                __import__(package.replace('-', '_'))
+            if _is_installed(package):
                 self.print_success(f"{package} 已安装")
-            except ImportError:
+            else:
                 self.print_failure(f"{package} 未安装")
 
     def test_project_structure(self):
@@ -96,18 +168,23 @@ class ProjectTester:
             'logs'
         ]
 
+        existing = _existing_paths(required_files + required_dirs)
+
         for file in required_files:
-            if os.path.exists(file):
+            if file in existing:
                 self.print_success(f"文件存在: {file}")
             else:
                 self.print_failure(f"文件缺失: {file}")
 
         for dir in required_dirs:
-            if os.path.exists(dir):
+            if dir in existing:
                 self.print_success(f"目录存在: {dir}/")
             else:
-                self.print_warning(f"目录缺失: {dir}/ (将自动创建)")
-                os.makedirs(dir, exist_ok=True)
+                if self.create_missing:
+                    self.print_warning(f"目录缺失: {dir}/ (已自动创建)")
+                    os.makedirs(dir, exist_ok=True)
+                else:
+                    self.print_warning(f"目录缺失: {dir}/ (使用 --create-dirs 自动创建)")
 
     def test_module_imports(self):
         """测试模块导入"""
@@ -145,9 +222,11 @@ class ProjectTester:
             'core/scheduling/utils.py',
         ]
 
+        existing = _existing_paths(algorithm_files)
+
         all_exist = True
         for file in algorithm_files:
-            if os.path.exists(file):
+            if file in existing:
                 self.print_success(f"算法模块存在: {file}")
             else:
                 self.print_failure(f"算法模块缺失: {file}")
@@ -180,6 +259,8 @@ class ProjectTester:
 
         # 检查test_request.json
         if os.path.exists('test_request.json'):
+            import json
+
             try:
                 with open('test_request.json', 'r', encoding='utf-8') as f:
                     data = json.load(f)
@@ -201,7 +282,8 @@ class ProjectTester:
 
         # 检查原始Excel数据
         if os.path.exists('data/raw'):
-            subdirs = [d for d in os.listdir('data/raw') if os.path.isdir(os.path.join('data/raw', d))]
+            with os.scandir('data/raw') as entries:
+                subdirs = [entry.name for entry in entries if entry.is_dir()]
             if subdirs:
                 self.print_success(f"找到 {len(subdirs)} 个数据集目录")
                 for subdir in subdirs:
@@ -215,10 +297,14 @@ class ProjectTester:
         """测试应用启动（不实际启动）"""
         self.print_header("测试 8: 应用启动检查")
 
+        # flask 未安装时无需再导入整个应用（依赖检查中已记录失败）
+        if not _is_installed('flask'):
+            self.print_warning("flask 未安装，跳过应用启动检查")
+            return
+
         try:
             # 只导入，不实际运行
-            from app import create_app
-            app = create_app('testing')
+            app = _get_app('testing')
             self.print_success("Flask应用创建成功")
 
             # 检查蓝图
@@ -244,17 +330,13 @@ class ProjectTester:
         print(f"通过率: {pass_rate:.1f}%\n")
 
         if self.failed == 0:
-            print(f"{GREEN}{'=' * 70}{RESET}")
-            print(f"{GREEN}{'✓ 所有测试通过！项目可以运行':^70}{RESET}")
-            print(f"{GREEN}{'=' * 70}{RESET}\n")
+            print(f"{_GREEN_RULE}\n{GREEN}{'✓ 所有测试通过！项目可以运行':^70}{RESET}\n{_GREEN_RULE}\n")
             print("下一步操作:")
             print("1. 启动服务: python app.py")
             print(
                 "2. 测试接口: curl -X POST http://localhost:5000/api/simulations -H 'Content-Type: application/json' -d @test_request.json")
         else:
-            print(f"{RED}{'=' * 70}{RESET}")
-            print(f"{RED}{'✗ 存在失败项，请检查上述输出':^70}{RESET}")
-            print(f"{RED}{'=' * 70}{RESET}\n")
+            print(f"{_RED_RULE}\n{RED}{'✗ 存在失败项，请检查上述输出':^70}{RESET}\n{_RED_RULE}\n")
 
             if self.failed > 0:
                 print("建议操作:")
@@ -266,24 +348,39 @@ class ProjectTester:
 
     def run_all_tests(self):
         """运行所有测试"""
-        print(f"\n{BLUE}{'*' * 70}{RESET}")
-        print(f"{BLUE}{'卫星调度系统 - 自动化完整性测试':^70}{RESET}")
-        print(f"{BLUE}{'*' * 70}{RESET}")
-
-        self.test_python_version()
-        self.test_dependencies()
-        self.test_project_structure()
-        self.test_module_imports()
-        self.test_algorithm_modules()
-        self.test_config_file()
-        self.test_test_data()
-        self.test_app_startup()
+        print(f"\n{_BLUE_STARS}\n{BLUE}{'卫星调度系统 - 自动化完整性测试':^70}{RESET}\n{_BLUE_STARS}")
+
+        tests = [
+            self.test_python_version,
+            self.test_dependencies,
+            self.test_project_structure,
+            self.test_module_imports,
+            self.test_algorithm_modules,
+            self.test_config_file,
+            self.test_test_data,
+            self.test_app_startup,
+        ]
+
+        # 导入/配置/应用启动检查会导入 app 与 config，且 _get_app 的 lru_cache 不是线程安全的，
+        # 在主线程中顺序执行；其余纯文件系统与依赖检查并行执行。输出按固定顺序打印
+        sequential_tests = (self.test_module_imports, self.test_config_file, self.test_app_startup)
+        with ThreadPoolExecutor(max_workers=len(tests) - len(sequential_tests)) as executor:
+            futures = {
+                test: executor.submit(self._run_captured, test)
+                for test in tests if test not in sequential_tests
+            }
+            outputs = {test: self._run_captured(test) for test in sequential_tests}
+            for test in tests:
+                lines = futures[test].result() if test in futures else outputs[test]
+                for line in lines:
+                    print(line)
 
         return self.print_summary()
 
 
 if __name__ == '__main__':
-    tester = ProjectTester()
+    # 用法: python run_tests.py [--create-dirs]
+    tester = ProjectTester(create_missing='--create-dirs' in sys.argv[1:])
     success = tester.run_all_tests()
 
     # 退出码：0表示成功，1表示失败
@@ -7,8 +7,14 @@ import shutil
 import time
 import logging
 import zipfile
+import subprocess
 import csv
-from datetime import datetime
+import json
+import hashlib
+import itertools
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from flask import current_app
 
 from core.dataset_builder import DatasetBuilder
@@ -17,9 +23,68 @@ from core.result_combiner import ResultCombiner
 from core.gantt_chart_generator import GanttChartGenerator
 from core.satisfaction_chart_generator import SatisfactionChartGenerator
 from core.dataset_statistics import DatasetStatistics
+from core.utils import load_csv_tree, scan_dataset_files, remove_tree, TRASH_DIR_PREFIX, CACHE_DIR_NAME
 
 logger = logging.getLogger(__name__)
 
+# 已压缩格式的文件写入ZIP时直接存储，不再重复 DEFLATE
+_INCOMPRESSIBLE_EXTENSIONS = frozenset({
+    '.h5', '.hdf5', '.parquet', '.png', '.jpg', '.jpeg',
+    '.zip', '.gz', '.zst', '.xlsx'
+})
+
+# zipfile 回退路径输出文件的写缓冲区，减少写入系统调用次数
+_ZIP_COPY_BUFSIZE = 1024 * 1024
+
+# zipfile 回退路径的 DEFLATE 级别：CSV 文本在级别1下压缩率已足够，速度远高于默认的6
+_ZIP_COMPRESS_LEVEL = 1
+
+# 计算图表缓存键时按块读取结果文件，避免大文件整块读入内存
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# 调度算法目录：算法源码、config.py 以及 tune_schedule 生成的 sa_params.json（SA_PARAMS_FILE）
+_SCHEDULING_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'core', 'scheduling')
+
+# 进程内任务序号：同一秒内的并发请求也能得到不同的任务ID（next() 在 GIL 下是原子的）
+_task_counter = itertools.count()
+
+# 调度算法进程池（SCHEDULING_PROCESS_WORKERS > 0 时启用，首次使用时创建，进程内共享）
+_scheduling_pool = None
+_scheduling_pool_lock = threading.Lock()
+
+
+def _get_scheduling_pool(max_workers):
+    """获取调度算法进程池（spawn 方式启动，避免 fork 带入 Flask 线程和锁的状态）"""
+    global _scheduling_pool
+    with _scheduling_pool_lock:
+        if _scheduling_pool is None:
+            _scheduling_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _scheduling_pool
+
+
+def _run_scheduling_in_worker(dataset_dir, output_dir, time_window, algorithm_config):
+    """
+    在子进程中执行调度算法
+
+    算法把Excel写到当前目录下的 output/，子进程先切换到任务工作目录，
+    输出直接落在该任务的 output_dir，多个进程同时运行也不会互相覆盖
+
+    Returns:
+        tuple: (excel_path, statistics, answer_sheets)
+    """
+    os.chdir(os.path.dirname(output_dir))
+    scheduler = SchedulingAlgorithm(
+        dataset_dir=dataset_dir,
+        output_dir=output_dir,
+        time_window=time_window,
+        algorithm_config=algorithm_config
+    )
+    excel_path, statistics = scheduler.run()
+    return excel_path, statistics, scheduler.answer_sheets
+
 
 class SchedulingService:
     """
@@ -27,6 +92,16 @@ class SchedulingService:
     负责协调整个调度流程
     """
 
+    # 每个请求创建一个实例，固定属性集合，不使用实例 __dict__
+    __slots__ = (
+        'params', 'task_id', '_auto_cleanup', '_save_chart_html', '_scheduling_workers',
+        '_sa_num_chains', '_static_dir', '_server_url', '_static_prefix',
+        'raw_data_dir', 'work_dir', 'dataset_dir', 'output_dir', 'result_dir', 'charts_dir',
+        '_raw_fingerprint', 'cache_file', 'cached_result',
+        '_chart_cache_dir', '_image_settings',
+        'dataset_key', 'dataset_cache_file', 'algorithm_config',
+    )
+
     def __init__(self, params):
         """
         初始化服务
@@ -41,14 +116,30 @@ class SchedulingService:
         """
         self.params = params
         self.task_id = self._generate_task_id()
+        # 步骤1.7 生成
+        self.algorithm_config = None
+
+        # current_app 是代理对象，配置只解析一次
+        app = current_app._get_current_object()
+        cfg = app.config
+        self._auto_cleanup = cfg.get('AUTO_CLEANUP', False)
+        self._save_chart_html = cfg.get('SAVE_CHART_HTML', False)
+        self._scheduling_workers = cfg.get('SCHEDULING_PROCESS_WORKERS', 0)
+        self._sa_num_chains = max(1, min(cfg.get('SA_NUM_CHAINS', 1), os.cpu_count() or 1))
+
+        # ZIP下载地址相关配置（步骤1.6在后台线程中执行，提前取出）
+        # Flask 未配置 static_folder 时默认使用项目根目录下的 static
+        self._static_dir = app.static_folder or os.path.join(app.root_path, 'static')
+        self._server_url = cfg.get('SERVER_URL', 'http://172.16.1.84:5000')
+        self._static_prefix = cfg.get('STATIC_URL_PREFIX', '/static')
 
         # 从Flask配置中获取目录路径
         self.raw_data_dir = os.path.join(
-            current_app.config['RAW_DATA_DIR'],
+            cfg['RAW_DATA_DIR'],
             params['arc_data']
         )
         self.work_dir = os.path.join(
-            current_app.config['TEMP_DATA_DIR'],
+            cfg['TEMP_DATA_DIR'],
             self.task_id
         )
 
@@ -65,16 +156,44 @@ class SchedulingService:
                 f"(路径: {self.raw_data_dir})"
             )
 
-        # 创建工作目录
-        self._create_directories()
+        # 结果缓存：相同参数 + 相同原始数据直接复用上次的结果
+        self._raw_fingerprint = None
+        self.cache_file = None
+        self.cached_result = None
+        if cfg.get('RESULT_CACHE_ENABLED', False):
+            self.cache_file = os.path.join(
+                cfg['TEMP_DATA_DIR'], CACHE_DIR_NAME,
+                self._compute_cache_key(), 'result.json'
+            )
+            self.cached_result = self._load_cached_result()
+
+        # 图表缓存：结果数据内容相同时复用已生成的图表（键在步骤3之后计算）
+        self._chart_cache_dir = None
+        self._image_settings = None
+        if cfg.get('CHART_CACHE_ENABLED', False):
+            self._chart_cache_dir = os.path.join(cfg['TEMP_DATA_DIR'], CACHE_DIR_NAME, 'charts')
+            self._image_settings = [cfg.get('IMAGE_WIDTH'), cfg.get('IMAGE_HEIGHT'), cfg.get('IMAGE_FORMAT')]
+
+        # 数据集缓存：相同原始数据 + 天线配置共用同一个ZIP和统计信息（与算法参数无关）
+        self.dataset_key = None
+        self.dataset_cache_file = None
+        if cfg.get('DATASET_CACHE_ENABLED', False):
+            self.dataset_key = self._compute_dataset_key()
+            self.dataset_cache_file = os.path.join(
+                cfg['TEMP_DATA_DIR'], CACHE_DIR_NAME, 'datasets', f"{self.dataset_key}.json"
+            )
 
-        logger.info(f"[{self.task_id}] 服务初始化完成 (仅QV频段)")
-        logger.info(f"[{self.task_id}] 原始数据: {self.raw_data_dir}")
-        logger.info(f"[{self.task_id}] 工作目录: {self.work_dir}")
-        logger.info(f"[{self.task_id}] 站点数: {len(params['antenna_num'])}")
-        logger.info(f"[{self.task_id}] 总天线数: {sum(params['antenna_num'].values())}")
-        logger.info(f"[{self.task_id}] 算法策略: {params['strategy']}")
-        logger.info(f"[{self.task_id}] 时间窗口: {params['time_window']}秒")
+        # 创建工作目录（命中缓存时不需要）
+        if self.cached_result is None:
+            self._create_directories()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[%s] 服务初始化完成 (仅QV频段): 原始数据=%s, 工作目录=%s, 站点数=%d, "
+                "总天线数=%s, 算法策略=%s, 时间窗口=%s秒",
+                self.task_id, self.raw_data_dir, self.work_dir, len(params['antenna_num']),
+                sum(params['antenna_num'].values()), params['strategy'], params['time_window']
+            )
 
     def execute(self):
         """
@@ -95,38 +214,97 @@ class SchedulingService:
                 "validation": dict
             }
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        if self.cached_result is not None:
+            logger.info("[%s] 命中结果缓存，复用任务 %s 的结果", self.task_id, self.cached_result['task_id'])
+            return {**self.cached_result, 'elapsed_time': round(time.perf_counter() - start_time, 2)}
+
+        # 后台线程池：ZIP压缩、统计、预览、图表生成等与主流程重叠执行
+        executor = ThreadPoolExecutor(max_workers=3)
 
         try:
-            logger.info(f"[{self.task_id}] ========== 开始执行调度流程 (仅QV频段) ==========")
+            logger.info("[%s] ========== 开始执行调度流程 (仅QV频段) ==========", self.task_id)
 
             # 步骤1: 构建数据集
             dataset_path = self._step1_build_dataset()
 
-            # 步骤1.5: 统计数据集信息
-            dataset_stats = self._step1_5_calculate_statistics(dataset_path)
-
-            # 步骤1.6: 压缩数据集为ZIP并增加数据集预览
-            dataset_zip_url = self._step1_6_create_dataset_zip(dataset_path)
-            csv_preview_md = self._generate_csv_preview(dataset_path)
+            # 步骤1.5、1.6: 统计、ZIP压缩、数据集预览都只读取 dataset_path，并行执行
+            # 命中数据集缓存时直接复用统计和预览，ZIP 也已存在（step1_6 只拼接URL）
+            # 数据集目录只遍历一次，文件列表由统计和ZIP压缩共享
+            app = current_app._get_current_object()
+            cached_dataset = self._load_cached_dataset_info()
+            dataset_listing = scan_dataset_files(dataset_path)
 
-            # 步骤1.7: 生成算法配置文件
+            # ZIP 只在组装返回结果时才需要，放到后台与调度算法重叠执行（所需配置已在初始化时取出）
+            zip_future = executor.submit(
+                self._step1_6_create_dataset_zip, dataset_path, dataset_listing
+            )
+            if cached_dataset is None:
+                stats_future = executor.submit(
+                    self._run_in_app_context, app,
+                    self._step1_5_calculate_statistics, dataset_path, dataset_listing
+                )
+                preview_future = executor.submit(self._generate_csv_preview, dataset_path)
+
+            # 步骤1.7: 生成算法配置（仅构造字典，在主线程中完成）
             self._step1_7_generate_algorithm_config(dataset_path)
 
             # 步骤2: 执行调度算法
-            excel_path, statistics = self._step2_run_scheduling(dataset_path)
+            excel_path, statistics, answer_sheets = self._step2_run_scheduling(dataset_path)
 
             # 步骤3: 合并结果
-            result_dataset_path = self._step3_combine_results(dataset_path, excel_path)
-
-            # 步骤4: 生成甘特图（HTML + 图片）
-            gantt_html, gantt_image_url = self._step4_generate_gantt_chart(result_dataset_path)
+            result_dataset_path = self._step3_combine_results(dataset_path, excel_path, answer_sheets)
 
-            # 步骤5: 生成满足度分析图（HTML + 图片）
-            satisfaction_html, satisfaction_image_url = self._step5_generate_satisfaction_chart(result_dataset_path)
+            # 统计和预览只在组装结果时使用，与步骤2、3重叠执行后在图表生成前取回（释放线程池）
+            if cached_dataset is None:
+                dataset_stats = stats_future.result()
+                csv_preview_md = preview_future.result()
+                self._save_cached_dataset_info(dataset_stats, csv_preview_md)
+            else:
+                logger.info("[%s] 命中数据集缓存，复用统计信息与预览", self.task_id)
+                dataset_stats = cached_dataset['statistics']
+                csv_preview_md = cached_dataset['preview_markdown']
+
+            # 步骤4、5: 甘特图与满足度分析图（HTML + 图片）
+            # 结果数据与之前某次任务完全相同时直接复用已生成的图表
+            chart_cache_file = self._chart_cache_file(result_dataset_path)
+            cached_charts = self._load_json_cache(chart_cache_file)
+            if cached_charts is not None:
+                logger.info("[%s] 命中图表缓存，跳过图表生成", self.task_id)
+                gantt_html = cached_charts['gantt_chart_html']
+                gantt_image_url = cached_charts['gantt_chart_image_url']
+                satisfaction_html = cached_charts['satisfaction_chart_html']
+                satisfaction_image_url = cached_charts['satisfaction_chart_image_url']
+            else:
+                # 两者互不依赖，并行生成；读取同一批结果CSV，先统一读取一次再共享
+                result_frames = load_csv_tree(result_dataset_path)
+                gantt_future = executor.submit(
+                    self._run_in_app_context, app,
+                    self._step4_generate_gantt_chart, result_dataset_path, result_frames
+                )
+                satisfaction_future = executor.submit(
+                    self._run_in_app_context, app,
+                    self._step5_generate_satisfaction_chart, result_dataset_path, result_frames
+                )
+                gantt_html, gantt_image_url = gantt_future.result()
+                satisfaction_html, satisfaction_image_url = satisfaction_future.result()
+
+                # 图片导出失败时返回的是错误页，不缓存
+                if gantt_image_url and satisfaction_image_url:
+                    self._save_json_cache(chart_cache_file, {
+                        'gantt_chart_html': gantt_html,
+                        'gantt_chart_image_url': gantt_image_url,
+                        'satisfaction_chart_html': satisfaction_html,
+                        'satisfaction_chart_image_url': satisfaction_image_url
+                    })
+
+            # 等待后台ZIP压缩完成
+            dataset_zip_url = zip_future.result()
+            executor.shutdown()
 
             # 计算总耗时
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.perf_counter() - start_time
 
             # 合并统计信息（算法统计 + 数据集统计）
             combined_statistics = {**statistics, **dataset_stats}
@@ -151,31 +329,50 @@ class SchedulingService:
                 })
             }
 
-            logger.info(f"[{self.task_id}] ========== 调度流程完成 ==========")
-            logger.info(f"[{self.task_id}] 总耗时: {elapsed_time:.2f}秒")
-            logger.info(f"[{self.task_id}] 成功率: {statistics.get('success_rate_all', 0):.2%}")
-            logger.info(f"[{self.task_id}] 甘特图URL: {gantt_image_url}")
-            logger.info(f"[{self.task_id}] 满足度图URL: {satisfaction_image_url}")
-            logger.info(f"[{self.task_id}] 数据集ZIP URL: {dataset_zip_url}")
-            logger.info(f"[{self.task_id}] 数据集预览: {csv_preview_md[:100]}...")
-            logger.info(f"[{self.task_id}] 站点数据量: {dataset_stats['station_data_counts']}")
-            logger.info(f"[{self.task_id}] 卫星类型统计: {dataset_stats['satellite_type_counts']}")
-
-            # 可选：自动清理临时文件（保留静态图片和ZIP）
-            if current_app.config.get('AUTO_CLEANUP', False):
+            logger.info(
+                "[%s] ========== 调度流程完成 ========== 总耗时=%.2f秒, 成功率=%.2f%%",
+                self.task_id, elapsed_time, statistics.get('success_rate_all', 0) * 100
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "[%s] 甘特图URL=%s, 满足度图URL=%s, 数据集ZIP URL=%s, 数据集预览=%s...",
+                    self.task_id, gantt_image_url, satisfaction_image_url,
+                    dataset_zip_url, csv_preview_md[:100]
+                )
+
+            self._save_cached_result(result)
+
+            # 可选：自动清理临时文件（保留静态图片和ZIP），后台删除不阻塞响应
+            if self._auto_cleanup:
                 self._cleanup()
 
             return result
 
         except Exception as e:
-            logger.error(f"[{self.task_id}] 执行失败: {str(e)}", exc_info=True)
+            # 等待后台任务结束（仍可能在读取工作目录）后再清理
+            executor.shutdown(wait=True)
+            logger.error("[%s] 执行失败: %s", self.task_id, e, exc_info=True)
             # 失败时清理临时文件
             self._cleanup()
             raise
 
     def _step1_build_dataset(self):
-        """步骤1: 构建数据集"""
-        logger.info(f"[{self.task_id}] 【步骤1/7】构建数据集 (仅QV频段)...")
+        """
+        步骤1: 构建数据集
+
+        启用数据集缓存时，构建好的数据集目录移入 _cache/datasets/<数据集键>/，
+        任务的 dataset 目录改为指向它的符号链接；之后相同原始数据 + 天线配置的任务直接链接，不再重新构建
+        （数据集在后续步骤中只读；不支持符号链接时照常构建）
+        """
+        logger.info("[%s] 【步骤1/7】构建数据集 (仅QV频段)...", self.task_id)
+
+        cached_dataset_dir = None
+        if self.dataset_key:
+            cached_dataset_dir = os.path.join(os.path.dirname(self.dataset_cache_file), self.dataset_key)
+            dataset_path = self._link_cached_dataset(cached_dataset_dir)
+            if dataset_path is not None:
+                logger.info("[%s] 命中数据集缓存，复用已构建的数据集: %s", self.task_id, dataset_path)
+                return dataset_path
 
         builder = DatasetBuilder(
             raw_data_dir=self.raw_data_dir,
@@ -185,350 +382,602 @@ class SchedulingService:
 
         dataset_path = builder.build()
 
-        logger.info(f"[{self.task_id}] 数据集构建完成: {dataset_path}")
+        if cached_dataset_dir is not None:
+            self._publish_dataset_to_cache(cached_dataset_dir)
+
+        logger.info("[%s] 数据集构建完成: %s", self.task_id, dataset_path)
         return dataset_path
 
-    def _step1_5_calculate_statistics(self, dataset_path):
-        """步骤1.5: 统计数据集信息"""
-        logger.info(f"[{self.task_id}] 【步骤1.5/7】统计数据集信息...")
+    def _link_cached_dataset(self, cached_dataset_dir):
+        """
+        把任务的 dataset 目录替换为指向缓存数据集的符号链接
+
+        _cache/datasets/<数据集键>/ 被所有链接到它的任务共享，任务仍在引用时绝不能删除；
+        任务清理只删除符号链接本身，cleanup_old_tasks 也会跳过整个 _cache 目录。
+
+        Returns:
+            str 或 None: 数据集路径；缓存不存在或无法创建链接时返回 None
+        """
+        try:
+            dataset_names = os.listdir(cached_dataset_dir)
+        except FileNotFoundError:
+            return None
+        if len(dataset_names) != 1:
+            return None
+
+        # 刷新缓存条目的 mtime，使仍在使用的数据集不会被后台缓存清理（start_cache_pruning）删除
+        for path in (cached_dataset_dir, self.dataset_cache_file):
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        try:
+            os.rmdir(self.dataset_dir)
+            os.symlink(cached_dataset_dir, self.dataset_dir, target_is_directory=True)
+        except OSError as e:
+            logger.warning("[%s] ⚠ 无法链接缓存数据集，重新构建: %s", self.task_id, e)
+            os.makedirs(self.dataset_dir, exist_ok=True)
+            return None
+        return os.path.join(self.dataset_dir, dataset_names[0])
+
+    def _publish_dataset_to_cache(self, cached_dataset_dir):
+        """把刚构建的 dataset 目录移入缓存，并在原位置留下符号链接（失败时保持原样）"""
+        tmp_dir = f"{cached_dataset_dir}.{self.task_id}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cached_dataset_dir), exist_ok=True)
+            os.rename(self.dataset_dir, tmp_dir)
+        except OSError as e:
+            logger.warning("[%s] ⚠ 数据集未写入缓存: %s", self.task_id, e)
+            return
+
+        try:
+            os.symlink(cached_dataset_dir, self.dataset_dir, target_is_directory=True)
+        except OSError as e:
+            logger.warning("[%s] ⚠ 数据集未写入缓存（无法创建符号链接）: %s", self.task_id, e)
+            os.rename(tmp_dir, self.dataset_dir)
+            return
+
+        try:
+            # 目录重命名是原子的；并发任务已先写入缓存时失败，退回使用自己构建的数据集
+            os.rename(tmp_dir, cached_dataset_dir)
+        except OSError:
+            os.remove(self.dataset_dir)
+            os.rename(tmp_dir, self.dataset_dir)
+
+    def _step1_5_calculate_statistics(self, dataset_path, listing=None):
+        """步骤1.5: 统计数据集信息（listing 为可选的共享文件列表）"""
+        logger.info("[%s] 【步骤1.5/7】统计数据集信息...", self.task_id)
 
         stats_calculator = DatasetStatistics(
             dataset_dir=dataset_path,
-            antenna_config=self.params['antenna_num']
+            antenna_config=self.params['antenna_num'],
+            listing=listing
         )
 
         dataset_stats = stats_calculator.calculate()
 
-        logger.info(f"[{self.task_id}] 数据集统计完成:")
-        logger.info(f"[{self.task_id}]   站点数据量: {dataset_stats['station_data_counts']}")
-        logger.info(f"[{self.task_id}]   卫星类型统计: {dataset_stats['satellite_type_counts']}")
-        logger.info(f"[{self.task_id}]   总任务数（去重）: {dataset_stats['total_unique_tasks']}")
+        logger.info(
+            "[%s] 数据集统计完成: 站点数据量=%s, 卫星类型统计=%s, 总任务数（去重）=%s",
+            self.task_id, dataset_stats['station_data_counts'],
+            dataset_stats['satellite_type_counts'], dataset_stats['total_unique_tasks']
+        )
 
         return dataset_stats
 
-    def _step1_6_create_dataset_zip(self, dataset_path):
-        """步骤1.6: 压缩数据集为ZIP文件"""
-        logger.info(f"[{self.task_id}] 【步骤1.6/7】压缩数据集为ZIP...")
+    def _step1_6_create_dataset_zip(self, dataset_path, listing=None):
+        """步骤1.6: 压缩数据集为ZIP文件（listing 为可选的共享文件列表）"""
+        logger.info("[%s] 【步骤1.6/7】压缩数据集为ZIP...", self.task_id)
 
         try:
-            # 1. 直接获取 Flask 应用实例真正的静态文件目录
-            static_dir = current_app.static_folder
-            
-            # 防御性代码：如果 Flask 没配置 static_folder，默认使用项目根目录下的 static
-            if not static_dir:
-                static_dir = os.path.join(current_app.root_path, 'static')
+            # 1. Flask 应用实例真正的静态文件目录（初始化时已取出）
+            static_dir = self._static_dir
 
             # 2. 打印日志验证路径
-            logger.info(f"[{self.task_id}] >>> 调试: Flask静态目录绝对路径: {static_dir}")
+            logger.debug("[%s] Flask静态目录绝对路径: %s", self.task_id, static_dir)
             
             # 3. 确保目录存在
-            if not os.path.exists(static_dir):
-                os.makedirs(static_dir)
+            os.makedirs(static_dir, exist_ok=True)
 
             # 获取URL前缀配置 
-            server_url = current_app.config.get('SERVER_URL', 'http://172.16.1.84:5000')
-            static_prefix = current_app.config.get('STATIC_URL_PREFIX', '/static')
+            server_url = self._server_url
+            static_prefix = self._static_prefix
 
-            # 生成ZIP文件名
-            zip_filename = f"{self.task_id}_dataset.zip"
+            # 生成ZIP文件名（启用数据集缓存时按数据集键命名，相同数据集共用一个ZIP）
+            if self.dataset_key:
+                zip_filename = f"dataset_{self.dataset_key}.zip"
+            else:
+                zip_filename = f"{self.task_id}_dataset.zip"
             zip_filepath = os.path.join(static_dir, zip_filename)
 
-            logger.info(f"[{self.task_id}]   目标ZIP保存路径: {zip_filepath}")
-
-            # 创建ZIP文件
-            with zipfile.ZipFile(zip_filepath, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # 遍历dataset目录下的所有文件
-                for root, dirs, files in os.walk(dataset_path):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # 计算相对路径（保持目录结构）
-                        arcname = os.path.relpath(file_path, dataset_path)
-                        zipf.write(file_path, arcname)
-                        
-            # 获取ZIP文件大小
-            if os.path.exists(zip_filepath):
-                 zip_size = os.path.getsize(zip_filepath)
-                 zip_size_mb = zip_size / (1024 * 1024)
-                 logger.info(f"[{self.task_id}] ✓ ZIP文件已生成，大小: {zip_size_mb:.2f} MB")
+            logger.debug("[%s]   目标ZIP保存路径: %s", self.task_id, zip_filepath)
+
+            # 缓存的ZIP：一次 stat 同时判断是否存在并取得大小
+            zip_size = None
+            if self.dataset_key:
+                try:
+                    zip_size = os.stat(zip_filepath).st_size
+                except FileNotFoundError:
+                    pass
+
+            if zip_size is not None:
+                logger.info("[%s] 复用已缓存的数据集ZIP: %s", self.task_id, zip_filename)
             else:
-                 logger.error(f"[{self.task_id}] × ZIP文件生成失败，文件未找到")
-                 return None
+                # 创建ZIP文件：优先使用多线程的 7z，不可用时回退到 zipfile
+                # 先写临时文件再替换，并发任务不会读到不完整的ZIP
+                tmp_filepath = f"{zip_filepath}.{self.task_id}.tmp"
+                if not self._create_zip_with_7z(dataset_path, tmp_filepath):
+                    file_count = self._create_zip_with_zipfile(dataset_path, tmp_filepath, listing)
+                    logger.info("[%s] ZIP含文件数: %d", self.task_id, file_count)
+                os.replace(tmp_filepath, zip_filepath)
+                # 压缩或替换失败时已抛出异常（由下方统一处理），这里文件一定存在
+                zip_size = os.stat(zip_filepath).st_size
+
+            zip_size_mb = zip_size / (1024 * 1024)
+            logger.info("[%s] ✓ ZIP文件已生成，大小: %.2f MB, 下载文件: %s", self.task_id, zip_size_mb, zip_filename)
 
             # 构建下载URL
             base_url = server_url.rstrip('/')
             prefix = static_prefix.strip('/')
             zip_url = f"{base_url}/{prefix}/{zip_filename}"
 
-            logger.info(f"[{self.task_id}]   下载URL: {zip_url}")
+            logger.debug("[%s]   下载URL: %s", self.task_id, zip_url)
 
             return zip_url
 
         except Exception as e:
-            logger.error(f"[{self.task_id}] ZIP创建失败: {e}", exc_info=True)
+            logger.error("[%s] ZIP创建失败: %s", self.task_id, e, exc_info=True)
             return None
 
-    def _step1_7_generate_algorithm_config(self, dataset_path):
-        """步骤1.7: 生成算法配置文件（支持算法选择）"""
-        logger.info(f"[{self.task_id}] 【步骤1.7/7】生成算法配置文件...")
+    def _create_zip_with_7z(self, dataset_path, zip_filepath):
+        """
+        使用 7z 多线程压缩为 ZIP 格式（输出仍是标准ZIP，下载端无需改动）
+
+        Returns:
+            bool: 是否成功（7z 不存在或执行失败时返回 False）
+        """
+        seven_zip = shutil.which('7z') or shutil.which('7za')
+        if not seven_zip:
+            return False
 
         try:
-            project_root = os.getcwd()
-            config_dir = os.path.join(project_root, 'core', 'scheduling')
-            config_path = os.path.join(config_dir, 'config.py')
-
-            logger.info(f"[{self.task_id}]   项目根目录: {project_root}")
-            logger.info(f"[{self.task_id}]   目标配置目录: {config_dir}")
-            logger.info(f"[{self.task_id}]   目标配置文件: {config_path}")
-
-            if not os.path.exists(config_dir):
-                logger.info(f"[{self.task_id}]   创建配置目录...")
-                os.makedirs(config_dir, exist_ok=True)
-                logger.info(f"[{self.task_id}]   ✓ 配置目录已创建")
-            else:
-                logger.info(f"[{self.task_id}]   ✓ 配置目录已存在")
-
-            root_folder = os.path.join(dataset_path, 'QV')
-            time_window = self.params['time_window']
-            strategy = self.params['strategy']
-
-            # ========== 功能一：根据策略选择METHOD ==========
-            if strategy == "优先级驱动式资源调度算法":
-                method_value = 3
-                logger.info(f"[{self.task_id}]   算法策略: 优先级驱动式 (METHOD=3)")
-            elif strategy == "GRU模拟退火算法":
-                method_value = 2
-                logger.info(f"[{self.task_id}]   算法策略: GRU模拟退火 (METHOD=2)")
-            else:
-                # 默认值
-                method_value = 3
-                logger.warning(f"[{self.task_id}]   未知策略'{strategy}'，使用默认值 METHOD=3")
-
-            config_content = f"""# 算法配置文件 - 自动生成
-# 任务ID: {self.task_id}
-# 生成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-# 算法策略: {strategy}
-
-ROOT_FOLDER = r'{root_folder}'
-OPTIMIZATION = 'TRUE'
-METHOD = {method_value}
-ANSWER_TYPE = 'TRUE'
-TASK_INTERVAL = {time_window}
-USE_SA = 'FALSE'
-SA_MAX_TIME = 300
-
-INTRA_STATION_BALANCE = 'FALSE'
-ANTENNA_LOAD_METHOD = 'B'
-LOAD_WEIGHT_TASK = 0.3
-LOAD_WEIGHT_TIME = 0.7
-"""
+            subprocess.run(
+                [seven_zip, 'a', '-tzip', '-mmt=on', '-mx=3', '-bd', '-y',
+                 os.path.abspath(zip_filepath), '*'],
+                cwd=dataset_path,
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            return True
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning("[%s] ⚠ 7z 压缩失败，改用 zipfile: %s", self.task_id, e)
+            if os.path.exists(zip_filepath):
+                os.remove(zip_filepath)
+            return False
 
-            logger.info(f"[{self.task_id}]   正在写入配置文件...")
+    @staticmethod
+    def _create_zip_with_zipfile(dataset_path, zip_filepath, listing=None):
+        """
+        使用 zipfile 压缩数据集目录（保持目录结构）
 
-            with open(config_path, 'w', encoding='utf-8') as f:
-                f.write(config_content)
+        循环内不逐文件记录日志，由调用方根据返回的文件数输出一条汇总
 
-            logger.info(f"[{self.task_id}]   ✓ 文件写入完成")
+        Returns:
+            int: 写入ZIP的文件数
+        """
+        if listing is None:
+            listing = scan_dataset_files(dataset_path)
+
+        with open(zip_filepath, 'wb', buffering=_ZIP_COPY_BUFSIZE) as output, \
+                zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED,
+                                compresslevel=_ZIP_COMPRESS_LEVEL) as zipf:
+            for file_path, arcname in listing:
+                if os.path.splitext(arcname)[1].lower() in _INCOMPRESSIBLE_EXTENSIONS:
+                    compress_type = zipfile.ZIP_STORED
+                else:
+                    compress_type = zipfile.ZIP_DEFLATED
+                zipf.write(file_path, arcname, compress_type=compress_type,
+                           compresslevel=_ZIP_COMPRESS_LEVEL)
+
+        return len(listing)
 
-            if os.path.exists(config_path):
-                file_size = os.path.getsize(config_path)
-                logger.info(f"[{self.task_id}]   ✓ 验证通过: 文件存在，大小 {file_size} 字节")
-                logger.info(f"[{self.task_id}] ✓ 算法配置文件生成成功!")
-                self.algorithm_config_path = config_path
-            else:
-                error_msg = f"配置文件写入后仍不存在: {config_path}"
-                logger.error(f"[{self.task_id}]   ✗ {error_msg}")
-                raise FileNotFoundError(error_msg)
+    def _step1_7_generate_algorithm_config(self, dataset_path):
+        """
+        步骤1.7: 生成算法配置（支持算法选择）
 
-        except Exception as e:
-            logger.error(f"[{self.task_id}] ✗ 生成配置文件失败: {e}", exc_info=True)
-            raise RuntimeError(f"无法生成算法配置文件: {e}") from e
+        配置以字典形式交给 SchedulingAlgorithm，由其在进程内注入为 core.scheduling.config 模块，
+        不再写入 core/scheduling/config.py。
+        """
+        logger.info("[%s] 【步骤1.7/7】生成算法配置...", self.task_id)
+
+        root_folder = os.path.join(dataset_path, 'QV')
+        time_window = self.params['time_window']
+        strategy = self.params['strategy']
+
+        # ========== 功能一：根据策略选择METHOD ==========
+        if strategy == "优先级驱动式资源调度算法":
+            method_value = 3
+            logger.debug("[%s]   算法策略: 优先级驱动式 (METHOD=3)", self.task_id)
+        elif strategy == "GRU模拟退火算法":
+            method_value = 2
+            logger.debug("[%s]   算法策略: GRU模拟退火 (METHOD=2)", self.task_id)
+        else:
+            # 默认值
+            method_value = 3
+            logger.warning("[%s]   未知策略'%s'，使用默认值 METHOD=3", self.task_id, strategy)
+
+        self.algorithm_config = {
+            'ROOT_FOLDER': root_folder,
+            'OPTIMIZATION': 'TRUE',
+            'METHOD': method_value,
+            'ANSWER_TYPE': 'TRUE',
+            'TASK_INTERVAL': time_window,
+            'USE_SA': 'FALSE',
+            'SA_MAX_TIME': 300,
+            'SA_NUM_CHAINS': self._sa_num_chains,
+            'INTRA_STATION_BALANCE': 'FALSE',
+            'ANTENNA_LOAD_METHOD': 'B',
+            'LOAD_WEIGHT_TASK': 0.3,
+            'LOAD_WEIGHT_TIME': 0.7,
+        }
+
+        logger.info("[%s] ✓ 算法配置生成成功: METHOD=%s, ROOT_FOLDER=%s", self.task_id, method_value, root_folder)
 
     def _step2_run_scheduling(self, dataset_path):
         """步骤2: 执行调度算法"""
-        logger.info(f"[{self.task_id}] 【步骤2/7】执行调度算法...")
-
-        scheduler = SchedulingAlgorithm(
-            dataset_dir=dataset_path,
-            output_dir=self.output_dir,
-            time_window=self.params['time_window']
-        )
-
-        excel_path, statistics = scheduler.run()
+        logger.info("[%s] 【步骤2/7】执行调度算法...", self.task_id)
+
+        if self._scheduling_workers > 0:
+            # 在进程池中执行，多个请求的调度可同时占用多个CPU核心
+            excel_path, statistics, answer_sheets = _get_scheduling_pool(self._scheduling_workers).submit(
+                _run_scheduling_in_worker, dataset_path, self.output_dir,
+                self.params['time_window'], self.algorithm_config
+            ).result()
+        else:
+            scheduler = SchedulingAlgorithm(
+                dataset_dir=dataset_path,
+                output_dir=self.output_dir,
+                time_window=self.params['time_window'],
+                algorithm_config=self.algorithm_config
+            )
+            excel_path, statistics = scheduler.run()
+            answer_sheets = scheduler.answer_sheets
 
         logger.info(
-            f"[{self.task_id}] 调度完成: "
-            f"成功率={statistics.get('success_rate_all', 0):.2%}, "
-            f"负载标准差={statistics.get('load_std', 0):.4f}"
+            "[%s] 调度完成: 成功率=%.2f%%, 负载标准差=%.4f",
+            self.task_id, statistics.get('success_rate_all', 0) * 100, statistics.get('load_std', 0)
         )
 
-        return excel_path, statistics
+        return excel_path, statistics, answer_sheets
 
-    def _step3_combine_results(self, dataset_path, excel_path):
+    def _step3_combine_results(self, dataset_path, excel_path, answer_sheets=None):
         """步骤3: 合并结果"""
-        logger.info(f"[{self.task_id}] 【步骤3/7】合并结果数据...")
+        logger.info("[%s] 【步骤3/7】合并结果数据...", self.task_id)
 
         combiner = ResultCombiner(
             dataset_dir=dataset_path,
             excel_path=excel_path,
-            output_dir=self.result_dir
+            output_dir=self.result_dir,
+            answer_sheets=answer_sheets
         )
 
         result_dataset_path = combiner.combine()
 
-        logger.info(f"[{self.task_id}] 结果合并完成: {result_dataset_path}")
+        logger.info("[%s] 结果合并完成: %s", self.task_id, result_dataset_path)
         return result_dataset_path
 
-    def _step4_generate_gantt_chart(self, result_dataset_path):
+    def _step4_generate_gantt_chart(self, result_dataset_path, frames=None):
         """
         步骤4: 生成甘特图（HTML + 图片）
 
+        Args:
+            result_dataset_path: 结果数据集目录
+            frames: 可选，已读取的结果CSV数据
+
         Returns:
             tuple: (html_content, image_url)
         """
-        logger.info(f"[{self.task_id}] 【步骤4/7】生成甘特图（HTML + 图片）...")
+        logger.info("[%s] 【步骤4/7】生成甘特图（HTML + 图片）...", self.task_id)
 
         generator = GanttChartGenerator(
             result_dir=result_dataset_path,
             output_dir=self.charts_dir
         )
 
-        gantt_html, gantt_image_url = generator.generate(self.task_id)
+        gantt_html, gantt_image_url = generator.generate(
+            self.task_id, save_files=self._save_chart_html, frames=frames
+        )
 
-        logger.info(f"[{self.task_id}] 甘特图生成完成")
-        logger.info(f"[{self.task_id}]   HTML长度: {len(gantt_html)} 字符")
-        logger.info(f"[{self.task_id}]   图片URL: {gantt_image_url}")
+        logger.info(
+            "[%s] 甘特图生成完成: HTML长度=%d 字符, 图片URL=%s",
+            self.task_id, len(gantt_html), gantt_image_url
+        )
 
         return gantt_html, gantt_image_url
 
-    def _step5_generate_satisfaction_chart(self, result_dataset_path):
+    def _step5_generate_satisfaction_chart(self, result_dataset_path, frames=None):
         """
         步骤5: 生成满足度分析图（HTML + 图片）
 
+        Args:
+            result_dataset_path: 结果数据集目录
+            frames: 可选，已读取的结果CSV数据
+
         Returns:
             tuple: (html_content, image_url)
         """
-        logger.info(f"[{self.task_id}] 【步骤5/7】生成满足度分析图（HTML + 图片）...")
+        logger.info("[%s] 【步骤5/7】生成满足度分析图（HTML + 图片）...", self.task_id)
 
         generator = SatisfactionChartGenerator(
             result_dir=result_dataset_path,
             output_dir=self.charts_dir
         )
 
-        satisfaction_html, satisfaction_image_url = generator.generate(self.task_id)
+        satisfaction_html, satisfaction_image_url = generator.generate(
+            self.task_id, save_files=self._save_chart_html, frames=frames
+        )
 
-        logger.info(f"[{self.task_id}] 满足度图生成完成")
-        logger.info(f"[{self.task_id}]   HTML长度: {len(satisfaction_html)} 字符")
-        logger.info(f"[{self.task_id}]   图片URL: {satisfaction_image_url}")
+        logger.info(
+            "[%s] 满足度图生成完成: HTML长度=%d 字符, 图片URL=%s",
+            self.task_id, len(satisfaction_html), satisfaction_image_url
+        )
 
         return satisfaction_html, satisfaction_image_url
 
-    def _generate_task_id(self):
-        """生成任务ID"""
-        return f"task_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    @staticmethod
+    def _run_in_app_context(app, func, *args):
+        """在工作线程中执行步骤函数（图表生成需要读取 current_app 配置）"""
+        with app.app_context():
+            return func(*args)
+
+    def _raw_data_fingerprint(self):
+        """原始数据文件指纹（相对路径 + 修改时间 + 大小），同一任务内只遍历一次"""
+        if self._raw_fingerprint is None:
+            parts = []
+            for root, dirs, files in os.walk(self.raw_data_dir):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    st = os.stat(path)
+                    rel = os.path.relpath(path, self.raw_data_dir)
+                    parts.append(f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\n")
+            self._raw_fingerprint = ''.join(parts).encode('utf-8')
+        return self._raw_fingerprint
+
+    @staticmethod
+    def _algorithm_fingerprint():
+        """
+        调度算法版本指纹（文件名 + 修改时间 + 大小）
 
-    def _create_directories(self):
-        """创建必要的目录"""
-        for directory in [self.dataset_dir, self.output_dir,
-                         self.result_dir, self.charts_dir]:
-            os.makedirs(directory, exist_ok=True)
+        包含 core/scheduling 下的算法源码、config.py 与调优参数 sa_params.json，
+        以及本模块（算法配置模板在步骤1.7中生成），重新调优或修改算法后缓存自动失效
+        """
+        parts = []
+        with os.scandir(_SCHEDULING_DIR) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name.endswith(('.py', '.json')) and entry.is_file():
+                    st = entry.stat()
+                    parts.append(f"{entry.name}\0{st.st_mtime_ns}\0{st.st_size}\n")
+        st = os.stat(__file__)
+        parts.append(f"{os.path.basename(__file__)}\0{st.st_mtime_ns}\0{st.st_size}\n")
+        return ''.join(parts).encode('utf-8')
+
+    def _compute_cache_key(self):
+        """根据请求参数、原始数据文件（路径 + 修改时间）和调度算法版本计算缓存键"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(self.params, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        digest.update(self._raw_data_fingerprint())
+        digest.update(self._algorithm_fingerprint())
+        return digest.hexdigest()
+
+    def _compute_dataset_key(self):
+        """根据数据集名称、天线配置和原始数据文件计算数据集缓存键（不含算法参数）"""
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(json.dumps(
+            [self.params['arc_data'], sorted(self.params['antenna_num'].items())],
+            ensure_ascii=False
+        ).encode('utf-8'))
+        digest.update(self._raw_data_fingerprint())
+        return digest.hexdigest()
+
+    def _chart_cache_file(self, result_dataset_path):
+        """
+        根据结果数据内容（相对路径 + 文件字节）和图片导出设置计算图表缓存文件路径
 
-    def _cleanup(self):
-        """清理临时文件（保留静态图片和ZIP）"""
-        logger.info(f"[{self.task_id}] 清理临时工作目录...")
+        Returns:
+            str 或 None: 未启用图表缓存时返回 None
+        """
+        if self._chart_cache_dir is None:
+            return None
 
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(self._image_settings).encode('utf-8'))
+        for path, arcname in sorted(scan_dataset_files(result_dataset_path), key=lambda item: item[1]):
+            digest.update(arcname.encode('utf-8') + b'\0')
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        return os.path.join(self._chart_cache_dir, f"{digest.hexdigest()}.json")
+
+    def _load_json_cache(self, cache_file):
+        """读取 JSON 缓存文件，未启用、不存在或损坏时返回 None"""
+        if cache_file is None:
+            return None
         try:
-            # 清理临时工作目录
-            if os.path.exists(self.work_dir):
-                shutil.rmtree(self.work_dir)
-                logger.info(f"[{self.task_id}] ✓ 临时工作目录已清理: {self.work_dir}")
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("[%s] ⚠ 缓存读取失败，重新计算: %s - %s", self.task_id, cache_file, e)
+            return None
 
-            # 清理算法配置文件（可选）
-            if hasattr(self, 'algorithm_config_path') and os.path.exists(self.algorithm_config_path):
-                os.remove(self.algorithm_config_path)
-                logger.info(f"[{self.task_id}] ✓ 算法配置文件已清理")
+    def _save_json_cache(self, cache_file, payload):
+        """保存 JSON 缓存文件（先写临时文件再替换，避免并发请求读到半个文件）"""
+        if cache_file is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            tmp_file = f"{cache_file}.{self.task_id}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning("[%s] ⚠ 缓存写入失败: %s - %s", self.task_id, cache_file, e)
+
+    def _load_cached_dataset_info(self):
+        """读取数据集缓存（统计信息 + 预览），未启用、不存在或损坏时返回 None"""
+        return self._load_json_cache(self.dataset_cache_file)
+
+    def _save_cached_dataset_info(self, dataset_stats, csv_preview_md):
+        """保存数据集缓存"""
+        self._save_json_cache(
+            self.dataset_cache_file,
+            {'statistics': dataset_stats, 'preview_markdown': csv_preview_md}
+        )
 
-            # 注意：静态图片和ZIP文件保留在 STATIC_FILES_DIR 中
-            logger.info(f"[{self.task_id}] ℹ️  静态文件（图片和ZIP）已保留在静态目录")
+    def _load_cached_result(self):
+        """读取缓存结果，不存在或损坏时返回 None"""
+        return self._load_json_cache(self.cache_file)
+
+    def _save_cached_result(self, result):
+        """
+        保存结果缓存
+
+        每个缓存键一个目录（_cache/<键>/result.json），由 create_app 启动的后台线程
+        （start_cache_pruning）按目录 mtime 删除超过 CLEANUP_KEEP_DAYS 的条目。
+        命中时不刷新 mtime，条目存活期不超过 CLEANUP_KEEP_DAYS，短于静态文件（STATIC_KEEP_DAYS）。
+        """
+        self._save_json_cache(self.cache_file, result)
 
+    def _generate_task_id(self):
+        """生成任务ID（时间戳 + 进程号 + 进程内序号，避免同一秒内的任务共用工作目录）"""
+        return f"task_{int(time.time())}_{os.getpid()}_{next(_task_counter)}"
+
+    def _create_directories(self):
+        """创建必要的目录（公共前缀 work_dir 只创建一次，子目录直接 mkdir）"""
+        os.makedirs(self.work_dir, exist_ok=True)
+        for directory in (self.dataset_dir, self.output_dir,
+                          self.result_dir, self.charts_dir):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+
+    def _cleanup(self):
+        """
+        清理临时文件（保留静态图片和ZIP）
+
+        先把工作目录重命名为 .trash_<task_id>（O(1)），再在后台线程中删除，不阻塞请求；
+        进程异常退出遗留的 .trash_* 目录在应用启动时清理（见 core.utils.remove_trash_dirs）。
+        """
+        logger.info("[%s] 清理临时工作目录...", self.task_id)
+
+        trash_dir = os.path.join(os.path.dirname(self.work_dir), f"{TRASH_DIR_PREFIX}{self.task_id}")
+        try:
+            os.rename(self.work_dir, trash_dir)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            # 重命名失败（如 Windows 下目录仍被占用）时原地同步删除
+            logger.warning("[%s] ⚠ 工作目录重命名失败，原地删除: %s", self.task_id, e)
+            trash_dir = self.work_dir
+
+        threading.Thread(
+            target=self._remove_trash_dir, args=(trash_dir,),
+            name=f"cleanup-{self.task_id}", daemon=True
+        ).start()
+
+        # 注意：静态图片和ZIP文件保留在 STATIC_FILES_DIR 中
+        logger.info("[%s] ℹ️  静态文件（图片和ZIP）已保留在静态目录", self.task_id)
+
+    def _remove_trash_dir(self, trash_dir):
+        """后台删除已移走的工作目录"""
+        try:
+            remove_tree(trash_dir)
+            logger.info("[%s] ✓ 临时工作目录已清理: %s", self.task_id, self.work_dir)
         except Exception as e:
-            logger.warning(f"[{self.task_id}] ⚠ 清理失败: {str(e)}")
+            logger.warning("[%s] ⚠ 清理失败: %s", self.task_id, e)
+
+    @staticmethod
+    def _list_subdirs(path):
+        """列出子目录 [(名称, 路径), ...]（scandir 直接给出条目类型，无需逐个 stat）"""
+        with os.scandir(path) as entries:
+            return [(entry.name, entry.path) for entry in entries if entry.is_dir()]
 
     def _generate_csv_preview(self, dataset_path):
         """
         辅助步骤: 遍历数据集目录(频段->站点->CSV)，生成预览表格
         结构: dataset/QV/CM/CM01.csv
         """
-        logger.info(f"[{self.task_id}] 生成CSV数据预览...")
-        preview_markdown = "###  数据集抽样预览\n\n"
+        logger.info("[%s] 生成CSV数据预览...", self.task_id)
+        parts = ["###  数据集抽样预览\n\n"]
         
         try:
             # 1. 获取第一层文件夹 (频段层: QV, S)
-            band_dirs = [d for d in os.listdir(dataset_path) if os.path.isdir(os.path.join(dataset_path, d))]
+            band_dirs = self._list_subdirs(dataset_path)
             
             if not band_dirs:
                 return "###  数据集目录为空"
 
             # 遍历每个频段文件夹 (QV, S)
-            for band_name in band_dirs:
-                band_path = os.path.join(dataset_path, band_name)
-                
+            for band_name, band_path in band_dirs:
                 # 2. 获取第二层文件夹 (站点层: CM, JMS, KEL...)
-                station_dirs = [d for d in os.listdir(band_path) if os.path.isdir(os.path.join(band_path, d))]
+                station_dirs = self._list_subdirs(band_path)
                 
                 if not station_dirs:
                     continue
 
                 # 在Markdown里标明频段
-                preview_markdown += f"### 📡 频段: {band_name}\n"
+                parts.append(f"### 📡 频段: {band_name}\n")
 
                 # 遍历每个站点文件夹
-                for station_name in station_dirs:
-                    station_path = os.path.join(band_path, station_name)
-                    
-                    # 3. 寻找 .csv 文件
-                    csv_files = [f for f in os.listdir(station_path) if f.endswith('.csv')]
+                for station_name, station_path in station_dirs:
+                    # 3. 寻找 .csv 文件（只需要第一个，找到即停止遍历）
+                    with os.scandir(station_path) as entries:
+                        target_csv = next((entry for entry in entries if entry.name.endswith('.csv')), None)
                     
-                    if not csv_files:
+                    if target_csv is None:
                         continue
                     
                     # 随机或固定选取第一个CSV文件
-                    target_csv_name = csv_files[0]
-                    target_csv_path = os.path.join(station_path, target_csv_name)
+                    target_csv_name = target_csv.name
+                    target_csv_path = target_csv.path
                     
                     # 生成标题: 站点名 / 文件名
-                    preview_markdown += f"** 站点: {station_name} / 📄 {target_csv_name}**\n"
+                    parts.append(f"** 站点: {station_name} / 📄 {target_csv_name}**\n")
                     
                     try:
-                        # 读取 CSV
+                        # 读取 CSV（只解析表头和前3行，不读取整个文件）
                         with open(target_csv_path, 'r', encoding='utf-8-sig') as f:
                             reader = csv.reader(f)
-                            all_rows = list(reader)
+                            # 获取表头
+                            header = next(reader, None)
                             
-                            if not all_rows:
-                                preview_markdown += "> *[文件为空]*\n\n"
+                            if header is None:
+                                parts.append("> *[文件为空]*\n\n")
                                 continue
                             
-                            # 获取表头
-                            header = all_rows[0]
-                            # 获取数据 (取第1到第3行数据，即 rows[1:4])
-                            data_rows = all_rows[1:4] if len(all_rows) > 1 else []
+                            # 获取数据 (取第1到第3行数据)
+                            data_rows = list(itertools.islice(reader, 3))
                             
                             # --- 生成表格 ---
                             # 写入表头
-                            preview_markdown += "| " + " | ".join(header) + " |\n"
+                            parts.append("| " + " | ".join(header) + " |\n")
                             # 写入分隔线
-                            preview_markdown += "| " + " | ".join(["---"] * len(header)) + " |\n"
+                            parts.append("| " + " | ".join(["---"] * len(header)) + " |\n")
                             # 写入数据行
                             for row in data_rows:
-                                preview_markdown += "| " + " | ".join(row) + " |\n"
+                                parts.append("| " + " | ".join(row) + " |\n")
                             
-                            preview_markdown += "\n" # 表格后空一行
+                            parts.append("\n") # 表格后空一行
                             
                     except Exception as e:
-                        preview_markdown += f"> *读取出错: {str(e)}*\n\n"
+                        parts.append(f"> *读取出错: {str(e)}*\n\n")
 
-            return preview_markdown
+            return "".join(parts)
 
         except Exception as e:
-            logger.error(f"[{self.task_id}] 生成预览失败: {e}", exc_info=True)
+            logger.error("[%s] 生成预览失败: %s", self.task_id, e, exc_info=True)
             return "###  数据预览生成失败"
\ No newline at end of file
@@ -3,11 +3,17 @@
 功能：测试后端API接口是否正常工作
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# 调度结果中体积较大的图表HTML字段（测试只关心长度）
+_CHART_HTML_FIELDS = ('gantt_chart_html', 'satisfaction_chart_html')
+
 
 class SchedulingAPITester:
     """API测试类"""
@@ -22,6 +28,22 @@ class SchedulingAPITester:
         self.base_url = base_url
         self.test_results = []
 
+        # 所有请求共用一个会话，复用连接（保持连接，不再每个请求单独建连）
+        # 仅对网关类错误重试（重试用尽后仍返回最后的响应）；POST 默认不在重试方法内，不会重复提交调度任务
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                              raise_on_status=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        """关闭会话，释放连接"""
+        self.session.close()
+
     def print_header(self, title):
         """打印测试标题"""
         print("\n" + "=" * 70)
@@ -53,7 +75,7 @@ class SchedulingAPITester:
         self.print_header("测试1: 服务器连接")
 
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
+            response = self.session.get(f"{self.base_url}/health", timeout=5)
 
             if response.status_code == 200:
                 self.print_success(f"服务器连接成功: {self.base_url}")
@@ -81,7 +103,7 @@ class SchedulingAPITester:
         self.print_header("测试2: API端点测试")
 
         try:
-            response = requests.get(f"{self.base_url}/api/simulations/test", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/simulations/test", timeout=5)
 
             if response.status_code == 200:
                 data = response.json()
@@ -112,66 +134,97 @@ class SchedulingAPITester:
             self.print_error(f"测试数据JSON格式错误: {str(e)}")
             return None
 
+    def _post_and_check(self, data, desc):
+        """
+        发送一个应被拒绝的请求，检查是否返回400
+
+        Returns:
+            tuple: (是否通过, 提示信息)
+        """
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/simulations",
+                json=data,
+                timeout=5
+            )
+
+            if response.status_code == 400:
+                return True, f"{desc} → 正确返回400错误"
+            return False, f"{desc} → 应返回400，实际返回{response.status_code}"
+        except Exception as e:
+            return False, f"{desc} → 测试失败: {str(e)}"
+
     def test_parameter_validation(self):
         """测试3: 参数验证"""
         self.print_header("测试3: 参数验证")
 
         # 测试3.1: 缺少参数
-        print("\n[3.1] 测试缺少必需参数...")
-
-        test_cases = [
+        missing_cases = [
             ({"antenna_num": {"CM": 6}, "time_window": 300}, "缺少arc_data"),
             ({"arc_data": "test", "time_window": 300}, "缺少antenna_num"),
             ({"arc_data": "test", "antenna_num": {"CM": 6}}, "缺少time_window"),
         ]
 
-        all_passed = True
-        for data, desc in test_cases:
-            try:
-                response = requests.post(
-                    f"{self.base_url}/api/simulations",
-                    json=data,
-                    timeout=5
-                )
-
-                if response.status_code == 400:
-                    self.print_success(f"{desc} → 正确返回400错误")
-                else:
-                    self.print_error(f"{desc} → 应返回400，实际返回{response.status_code}")
-                    all_passed = False
-            except Exception as e:
-                self.print_error(f"{desc} → 测试失败: {str(e)}")
-                all_passed = False
-
         # 测试3.2: 错误的参数类型
-        print("\n[3.2] 测试错误的参数类型...")
-
-        test_cases = [
+        type_cases = [
             ({"arc_data": 123, "antenna_num": {"CM": 6}, "time_window": 300}, "arc_data非字符串"),
             ({"arc_data": "test", "antenna_num": "wrong", "time_window": 300}, "antenna_num非对象"),
             ({"arc_data": "test", "antenna_num": {"CM": 6}, "time_window": "300"}, "time_window非数字"),
         ]
 
-        for data, desc in test_cases:
-            try:
-                response = requests.post(
-                    f"{self.base_url}/api/simulations",
-                    json=data,
-                    timeout=5
-                )
+        # 各请求互不依赖，并发发送；结果仍按用例顺序输出
+        all_cases = missing_cases + type_cases
+        with ThreadPoolExecutor(max_workers=len(all_cases)) as executor:
+            results = list(executor.map(lambda case: self._post_and_check(*case), all_cases))
 
-                if response.status_code == 400:
-                    self.print_success(f"{desc} → 正确返回400错误")
-                else:
-                    self.print_error(f"{desc} → 应返回400，实际返回{response.status_code}")
-                    all_passed = False
-            except Exception as e:
-                self.print_error(f"{desc} → 测试失败: {str(e)}")
+        all_passed = True
+        for index, (passed, message) in enumerate(results):
+            if index == 0:
+                print("\n[3.1] 测试缺少必需参数...")
+            elif index == len(missing_cases):
+                print("\n[3.2] 测试错误的参数类型...")
+
+            if passed:
+                self.print_success(message)
+            else:
+                self.print_error(message)
                 all_passed = False
 
         self.record_test("参数验证", all_passed)
         return all_passed
 
+    @staticmethod
+    def _load_execution_result(response):
+        """
+        解析调度结果JSON
+
+        安装了 ijson 时从响应流中边读边解析，图表HTML只记录长度、不保留内容；
+        未安装时退回 response.json()
+
+        Returns:
+            tuple: (result, chart_sizes)
+                - result: 响应JSON（流式解析时图表HTML字段为空字符串）
+                - chart_sizes: {图表HTML字段: 字符数}
+        """
+        try:
+            import ijson
+        except ImportError:
+            result = response.json()
+            charts = (result.get('data') or {}).get('charts') or {}
+            return result, {field: len(charts.get(field) or '') for field in _CHART_HTML_FIELDS}
+
+        html_prefixes = {f'data.charts.{field}': field for field in _CHART_HTML_FIELDS}
+        chart_sizes = {}
+        builder = ijson.ObjectBuilder()
+        response.raw.decode_content = True
+        for prefix, event, value in ijson.parse(response.raw, use_float=True):
+            field = html_prefixes.get(prefix)
+            if field is not None and event == 'string':
+                chart_sizes[field] = len(value)
+                value = ''
+            builder.event(event, value)
+        return builder.value, chart_sizes
+
     def test_scheduling_execution(self, test_data):
         """测试4: 调度执行（核心功能）"""
         self.print_header("测试4: 调度执行（核心功能）")
@@ -189,10 +242,11 @@ class SchedulingAPITester:
         start_time = time.time()
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/simulations",
                 json=test_data,
-                timeout=600  # 10分钟超时
+                timeout=600,  # 10分钟超时
+                stream=True   # 响应体边接收边解析
             )
 
             elapsed_time = time.time() - start_time
@@ -201,7 +255,7 @@ class SchedulingAPITester:
             print(f"[耗时] {elapsed_time:.2f}秒")
 
             if response.status_code == 200:
-                result = response.json()
+                result, chart_sizes = self._load_execution_result(response)
 
                 # 验证响应结构
                 if result.get('code') == 200:
@@ -226,8 +280,8 @@ class SchedulingAPITester:
                     charts = data.get('charts', {})
                     if charts:
                         print(f"\n[图表生成]")
-                        gantt_size = len(charts.get('gantt_chart_html', ''))
-                        satisfaction_size = len(charts.get('satisfaction_chart_html', ''))
+                        gantt_size = chart_sizes.get('gantt_chart_html', 0)
+                        satisfaction_size = chart_sizes.get('satisfaction_chart_html', 0)
                         print(f"  甘特图: {gantt_size} 字符")
                         print(f"  满足度图表: {satisfaction_size} 字符")
 
@@ -345,7 +399,10 @@ def main():
     tester = SchedulingAPITester(base_url)
 
     # 运行所有测试
-    success = tester.run_all_tests(test_file)
+    try:
+        success = tester.run_all_tests(test_file)
+    finally:
+        tester.close()
 
     # 返回退出码
     sys.exit(0 if success else 1)